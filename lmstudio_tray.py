@@ -12,19 +12,26 @@ Usage:
 """
 
 import argparse
+import functools
 import subprocess  # nosec B404
 import sys
 import os
 import time
 import signal
+import stat
 import logging
 import shutil
 import threading
 import importlib
 import json
+import mmap
+import re
+import select
 import webbrowser
-from typing import Callable, Optional
+from datetime import datetime, timezone
+from typing import Callable, Optional, Sequence
 from types import ModuleType
+from http import client as http_client
 from urllib import request as urllib_request
 from urllib import error as urllib_error
 from urllib import parse as urllib_parse
@@ -106,15 +113,17 @@ def _get_writable_logs_dir(base_script_dir: str) -> str:
         return writable_logs
 
 
-def parse_args() -> argparse.Namespace:
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     """
-    Parse command-line arguments and return namespace.
+    Build the command-line parser once and reuse it.
 
-    Returns:
-        argparse.Namespace: Parsed arguments.
+    The parser definition is static, so it is constructed on first use
+    only. ``script_dir`` defaults to ``None`` here and is resolved by
+    :func:`parse_args` so the default still follows ``sys.argv[0]``.
 
-    Raises:
-        SystemExit: On --help, --version, or invalid arguments.
+    Returns:
+        argparse.ArgumentParser: Configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="LM Studio Tray Monitor",
@@ -129,7 +138,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "script_dir",
         nargs="?",
-        default=_get_default_script_dir(),
+        default=None,
         help=(
             "Script directory for logs and VERSION file. If a relative path "
             "is provided it will be resolved to an absolute path when "
@@ -160,7 +169,26 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Print version and exit"
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments and return namespace.
+
+    Args:
+        argv: Arguments to parse. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+
+    Raises:
+        SystemExit: On --help, --version, or invalid arguments.
+    """
+    args = _build_parser().parse_args(argv)
+    if args.script_dir is None:
+        args.script_dir = _get_default_script_dir()
+    return args
 
 
 class _AppState:
@@ -179,6 +207,7 @@ class _AppState:
     GLib: Optional[ModuleType] = None
     AppIndicator3: Optional[ModuleType] = None
     GdkPixbuf: Optional[ModuleType] = None
+    Notify: Optional[ModuleType] = None
 
     @classmethod
     def apply_cli_args(cls, args: argparse.Namespace) -> None:
@@ -251,6 +280,10 @@ def sync_app_state_for_tests(
         _AppState.API_HOST = api_host_val
     if api_port_val is not None:
         _AppState.API_PORT = api_port_val
+    _clear_path_resolver_cache()
+    _reset_which_cache()
+    _reset_desktop_install_cache()
+    _clear_command_cache()
 
 
 script_dir = os.getcwd()
@@ -261,6 +294,11 @@ GUI_MODE = False
 
 INTERVAL = 10
 UPDATE_CHECK_INTERVAL = 60 * 60 * 24
+UPDATE_RETRY_BASE_SECONDS = 300
+UPDATE_RETRY_MAX_SECONDS = 60 * 60
+# Backoff between stop checks; roughly two seconds before escalating.
+STOP_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.4, 0.4, 0.45)
+STOP_WAIT_SECONDS = sum(STOP_POLL_DELAYS)
 
 # --------------------------------------------
 # === GTK icon names from the icon browser ===
@@ -339,6 +377,47 @@ def get_release_url(tag: Optional[str] = None) -> str:
         return f"{base}/releases/tag/{tag}"
     return f"{base}/releases/latest"
 
+
+@functools.lru_cache(maxsize=16)
+def _build_update_check_message(
+    status: str,
+    latest: Optional[str],
+    error: Optional[str],
+    app_version: str,
+) -> str:
+    """Build the update check notification message.
+
+    Args:
+        status: Update status label.
+        latest: Latest release tag, if known.
+        error: Error detail from the last lookup, if any.
+        app_version: Currently running version.
+
+    Returns:
+        str: Human-readable message; cached per argument tuple.
+    """
+    if status == "Update available" and latest:
+        url = get_release_url(latest)
+        return (
+            "New version available: "
+            f"{latest} (current {app_version}) {url}"
+        )
+
+    messages = {
+        "Up to date": f"You are up to date ({app_version})",
+        "Ahead of release": (
+            f"Ahead of release "
+            f"(current {app_version}, latest {latest})"
+        ),
+        "Dev build": "Dev build: update checks disabled",
+    }
+    message = messages.get(status)
+    if message:
+        return message
+
+    detail = f" ({error})" if error else ""
+    return "Unable to check for updates." + detail
+
 # -----------------------
 # === Path to lms-CLI ===
 # -----------------------
@@ -451,6 +530,7 @@ def main() -> None:
         app_indicator_module,
         gdk_pixbuf_module,
     )
+    _AppState.Notify = _init_libnotify()
 
     logs_dir = _get_writable_logs_dir(_AppState.script_dir)
     log_level = (
@@ -467,32 +547,14 @@ def main() -> None:
     logging.basicConfig(
         filename=log_file,
         level=log_level,
-        format="%(asctime)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         filemode='a',
         force=True,
     )
-    root = logging.getLogger()
-    for handler in root.handlers:
-        handler.setFormatter(
-            HomeMaskFormatter(
-                "%(asctime)s - %(levelname)s - %(message)s"
-            )
-        )
+    _install_home_mask_formatter()
 
     if _AppState.DEBUG_MODE:
         logging.captureWarnings(True)
-
-    app_indicator_module = importlib.import_module(
-        f"gi.repository.{app_namespace}"
-    )
-    _AppState.set_gtk_modules(
-        gtk_module,
-        glib_module,
-        app_indicator_module,
-        gdk_pixbuf_module,
-    )
-
-    if _AppState.DEBUG_MODE:
         warnings_logger = logging.getLogger('py.warnings')
         warnings_logger.setLevel(logging.DEBUG)
         logging.debug(
@@ -518,6 +580,54 @@ def main() -> None:
     gtk.main()
 
 
+def _init_libnotify() -> Optional[ModuleType]:
+    """Load and initialize libnotify via GI.
+
+    Returns:
+        ModuleType | None: The ``Notify`` module, or None when libnotify
+        is unavailable and notifications fall back to notify-send.
+    """
+    if gi is None:
+        return None
+    try:
+        gi.require_version("Notify", "0.7")
+        notify_module = importlib.import_module("gi.repository.Notify")
+    except (ValueError, ImportError):
+        return None
+    if not notify_module.init(APP_NAME):
+        return None
+    return notify_module
+
+
+def _with_status_icon(message: str) -> str:
+    """Prefix ``message`` with the info icon unless it has a status icon."""
+    icon_prefixes = ("✅", "ℹ️", "⚠️", "❌")
+    if message.lstrip().startswith(icon_prefixes):
+        return message
+    return f"ℹ️ {message}"
+
+
+def _show_libnotify(summary: str, body: str) -> bool:
+    """Show a desktop notification in-process through libnotify.
+
+    Args:
+        summary: Notification title.
+        body: Notification text.
+
+    Returns:
+        bool: True if libnotify displayed the notification.
+    """
+    notify_module = _AppState.Notify
+    if notify_module is None:
+        return False
+    try:
+        notify_module.Notification.new(summary, body, None).show()
+    except RuntimeError as exc:
+        logging.debug("libnotify failed, using notify-send: %s", exc)
+        return False
+    return True
+
+
 def _run_macos(_args):
     """Set up logging and launch macOS rumps tray."""
     if _rumps_lib is None:
@@ -543,17 +653,11 @@ def _run_macos(_args):
     logging.basicConfig(
         filename=log_file,
         level=log_level,
-        format="%(asctime)s - %(levelname)s - %(message)s",
+        format=LOG_FORMAT,
         filemode='a',
         force=True,
     )
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers:
-        handler.setFormatter(
-            HomeMaskFormatter(
-                "%(asctime)s - %(levelname)s - %(message)s"
-            )
-        )
+    _install_home_mask_formatter()
 
     if _AppState.DEBUG_MODE:
         logging.captureWarnings(True)
@@ -574,18 +678,62 @@ def _run_macos(_args):
 
 
 class HomeMaskFormatter(logging.Formatter):
-    """Formatter replacing user's home directory with ~ in log messages."""
+    """Formatter masking the user's home and runtime dirs in log messages.
+
+    The home directory becomes ``~`` and ``XDG_RUNTIME_DIR`` becomes
+    ``$XDG_RUNTIME_DIR``. Both are folded into one compiled regex that
+    is only rebuilt when ``HOME`` or ``XDG_RUNTIME_DIR`` changes, so a
+    record is masked in a single scan however many paths are masked.
+
+    One instance is shared by all root handlers, so the mask is swapped
+    in as a single tuple and ``format`` stays safe across threads.
+    """
+
+    _mask: tuple = (None, None, {})
+
+    def _mask_pattern(
+        self,
+    ) -> tuple[Optional[re.Pattern[str]], dict[str, str]]:
+        """Return the masking regex and replacements for the current env."""
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        key = (os.environ.get("HOME"), runtime_dir)
+        mask = self._mask
+        if mask[0] != key:
+            subs = {}
+            if runtime_dir and runtime_dir != "/":
+                subs[runtime_dir] = "$XDG_RUNTIME_DIR"
+            home = os.path.expanduser("~")
+            if home and home != "/":
+                subs[home] = "~"
+            # Longest first so a runtime dir below home keeps its name.
+            paths = sorted(subs, key=len, reverse=True)
+            pattern = (
+                re.compile("|".join(map(re.escape, paths)))
+                if paths else None
+            )
+            mask = self._mask = (key, pattern, subs)
+        return mask[1], mask[2]
 
     def format(
         self, record: logging.LogRecord
     ) -> str:  # pragma: no cover - simple
         s = super().format(record)
-        home = os.path.expanduser("~")
-        if home and home != "/":
-            s = s.replace(home, "~")
+        pattern, subs = self._mask_pattern()
+        if pattern is not None:
+            s = pattern.sub(lambda m: subs[m.group(0)], s)
         return s
 
 
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+def _install_home_mask_formatter() -> None:
+    """Give every root log handler one shared ``HomeMaskFormatter``."""
+    formatter = HomeMaskFormatter(LOG_FORMAT)
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(formatter)
+
+
 def get_asset_path(*path_components: str) -> Optional[str]:
     """Locate asset file in PyInstaller bundle, script_dir, or cwd.
 
@@ -616,6 +764,10 @@ def get_asset_path(*path_components: str) -> Optional[str]:
     return None
 
 
+# The config file is meant to be hand-edited, so keep it indented.
+_CONFIG_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
 def _get_config_path() -> str:
     """Return config file path ~/.config/lmstudio_tray.json."""
     return os.path.expanduser("~/.config/lmstudio_tray.json")
@@ -710,7 +862,7 @@ def save_config(api_host: str, api_port: int) -> None:
     tmp_path = f"{config_path}.tmp"
     try:
         with open(tmp_path, "w", encoding="utf-8") as config_file:
-            json.dump(payload, config_file, indent=2)
+            config_file.write(_CONFIG_JSON_ENCODER.encode(payload))
             config_file.flush()
             os.fsync(config_file.fileno())
         os.replace(tmp_path, config_path)
@@ -785,6 +937,11 @@ def get_api_models_url() -> str:
     return f"{get_api_base_url()}/v1/models"
 
 
+_AUTHOR_LINE_RE = re.compile(
+    r"^[^\S\n]*-[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
+
 def get_authors() -> list[str]:
     """Parse AUTHORS file from script_dir.
 
@@ -797,28 +954,28 @@ def get_authors() -> list[str]:
     authors = []
     try:
         with open(authors_path, "r", encoding="utf-8") as authors_file:
-            for line in authors_file:
-                line = line.strip()
-                if (
-                    line
-                    and not line.startswith("#")
-                    and not line.startswith("<!--")
-                    and line.startswith("-")
-                ):
-                    author = line[1:].strip()
-                    if " - " in author:
-                        author = author.split(" - ")[0].strip()
-                    if "(@" in author:
-                        author = author.split(" (@")[0].strip()
-                    if author:
-                        authors.append(author)
+            text = authors_file.read()
     except OSError:
-        pass
+        text = ""
+    for match in _AUTHOR_LINE_RE.finditer(text):
+        author = match.group(1).partition(" - ")[0].strip()
+        author = author.partition(" (@")[0].strip()
+        if author:
+            authors.append(author)
     return authors if authors else [APP_MAINTAINER]
 
 
+_VERSION_PART_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=32)
 def parse_version(version: Optional[str]) -> tuple[int, ...]:
-    """Parse version string to tuple of integers for comparison."""
+    """Parse version string to tuple of integers for comparison.
+
+    Each dot-separated part contributes its leading digits; parsing stops
+    at the first part without any. Results are cached because the same
+    few version strings are compared on every update check.
+    """
     if not version:
         return ()
     cleaned = version.strip()
@@ -826,15 +983,10 @@ def parse_version(version: Optional[str]) -> tuple[int, ...]:
         cleaned = cleaned[1:]
     parts = []
     for part in cleaned.split("."):
-        digits = ""
-        for char in part:
-            if char.isdigit():
-                digits += char
-            else:
-                break
-        if not digits:
+        match = _VERSION_PART_RE.match(part)
+        if match is None:
             break
-        parts.append(int(digits))
+        parts.append(int(match.group()))
     return tuple(parts)
 
 
@@ -864,15 +1016,160 @@ def _is_allowed_update_url(url: str) -> bool:
     )
 
 
+_TAG_NAME_KEY_RE = re.compile(r'"tag_name"\s*:\s*')
+_JSON_DECODER = json.JSONDecoder()
+# Update-check records are machine-read only, so skip the padding.
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def _extract_tag_name(payload: str) -> Optional[str]:
+    """Return the ``tag_name`` string from a GitHub release payload.
+
+    Only the value following the ``"tag_name"`` key is decoded, so the
+    long release body and asset list are never parsed. Payloads without
+    the key are fully decoded to tell a missing tag from invalid JSON.
+
+    Raises:
+        ValueError: If the payload is not valid JSON.
+    """
+    match = _TAG_NAME_KEY_RE.search(payload)
+    if match is None:
+        data = json.loads(payload)
+        tag = data.get("tag_name") if isinstance(data, dict) else None
+    else:
+        tag, _end = _JSON_DECODER.raw_decode(payload, match.end())
+    return tag if isinstance(tag, str) else None
+
+
+RELEASE_CACHE_TTL_DEFAULT = 3600.0
+
+_latest_release_cache = {
+    "tag": None,
+    "fetched_at": None,
+    "etag": None,
+    "loaded": False,
+}
+
+
+def _get_release_cache_ttl() -> float:
+    """Return the release lookup cache TTL in seconds.
+
+    The value comes from ``LMS_TRAY_RELEASE_TTL`` when it holds a valid
+    non-negative number, otherwise :data:`RELEASE_CACHE_TTL_DEFAULT`.
+    """
+    raw = os.environ.get("LMS_TRAY_RELEASE_TTL")
+    if raw is None:
+        return RELEASE_CACHE_TTL_DEFAULT
+    try:
+        ttl = float(raw)
+    except ValueError:
+        return RELEASE_CACHE_TTL_DEFAULT
+    return ttl if ttl >= 0 else RELEASE_CACHE_TTL_DEFAULT
+
+
+def _get_update_check_path() -> str:
+    """Return the file recording the last successful update check.
+
+    The file lives in ``lmstudio-tray-manager`` under
+    ``$XDG_CACHE_HOME``, which defaults to ``~/.cache``.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME", "~/.cache")
+    return os.path.join(
+        os.path.expanduser(cache_home),
+        "lmstudio-tray-manager",
+        "last_update_check",
+    )
+
+
+def _clear_latest_release_cache() -> None:
+    """Forget the cached release tag so the next lookup hits the network."""
+    _latest_release_cache["tag"] = None
+    _latest_release_cache["fetched_at"] = None
+    _latest_release_cache["etag"] = None
+    try:
+        os.remove(_get_update_check_path())
+    except OSError:
+        pass
+
+
+def _load_persisted_update_check() -> bool:
+    """Seed the release cache from the last check recorded on disk.
+
+    Only a record younger than :func:`_get_release_cache_ttl` is used,
+    so restarting the tray repeatedly does not hit the GitHub API.
+
+    Returns:
+        bool: True if the in-memory cache was seeded.
+    """
+    try:
+        with open(_get_update_check_path(), "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        tag = data["tag"]
+        checked_at = datetime.fromisoformat(data["checked_at"])
+        age = (datetime.now(timezone.utc) - checked_at).total_seconds()
+    except (OSError, ValueError, TypeError, KeyError):
+        return False
+    if not isinstance(tag, str) or not tag or not (
+        0 <= age < _get_release_cache_ttl()
+    ):
+        return False
+    etag = data.get("etag")
+    _latest_release_cache["tag"] = tag
+    _latest_release_cache["etag"] = etag if isinstance(etag, str) else None
+    _latest_release_cache["fetched_at"] = time.monotonic() - age
+    return True
+
+
+def _persist_update_check(tag: str, etag: Optional[str]) -> None:
+    """Atomically record a successful update check on disk."""
+    path = _get_update_check_path()
+    tmp_path = f"{path}.tmp"
+    payload = {
+        "checked_at": datetime.now(timezone.utc).isoformat(),
+        "tag": tag,
+        "etag": etag,
+    }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            fh.write(_COMPACT_JSON_ENCODER.encode(payload))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logging.debug("Update check: failed to persist %s: %s", path, exc)
+
+
 def get_latest_release_version() -> tuple[Optional[str], Optional[str]]:
-    """Fetch latest GitHub release tag, return (tag, error_msg) tuple."""
+    """Fetch latest GitHub release tag, return (tag, error_msg) tuple.
+
+    Successful lookups are cached for :func:`_get_release_cache_ttl`
+    seconds; failures are never cached so the next check retries. Once
+    the TTL expires the stored ``ETag`` is sent as ``If-None-Match`` so
+    an unchanged release costs a bodyless 304 instead of a JSON parse.
+    Each success is also persisted via :func:`_persist_update_check` so
+    a restarted tray reuses it instead of fetching again.
+    """
     if not _is_allowed_update_url(LATEST_RELEASE_API_URL):
         logging.debug("Update check: invalid update URL")
         return None, "Invalid update URL"
 
+    cache = _latest_release_cache
+    if not cache["loaded"]:
+        cache["loaded"] = True
+        _load_persisted_update_check()
+    fetched_at = cache["fetched_at"]
+    if (
+        fetched_at is not None
+        and time.monotonic() - fetched_at < _get_release_cache_ttl()
+    ):
+        logging.debug("Update check: using cached tag %s", cache["tag"])
+        return cache["tag"], None
+
+    headers = {"User-Agent": "LM-Studio-Tray-Manager"}
+    if cache["tag"] and cache["etag"]:
+        headers["If-None-Match"] = cache["etag"]
     request = urllib_request.Request(
         LATEST_RELEASE_API_URL,
-        headers={"User-Agent": "LM-Studio-Tray-Manager"},
+        headers=headers,
     )
     logging.debug(
         "Update check: requesting %s",
@@ -884,11 +1181,22 @@ def get_latest_release_version() -> tuple[Optional[str], Optional[str]]:
 
         with opener.open(request, timeout=10) as response:
             payload = response.read().decode("utf-8")
-            data = json.loads(payload)
-            tag = data.get("tag_name")
+            tag = _extract_tag_name(payload)
             logging.debug("Update check: latest tag %s", tag)
-            return (tag.strip(), None) if tag else (None, "No tag found")
+            if not tag:
+                return None, "No tag found"
+            tag = tag.strip()
+            cache["tag"] = tag
+            cache["etag"] = response.headers.get("ETag")
+            cache["fetched_at"] = time.monotonic()
+            _persist_update_check(tag, cache["etag"])
+            return tag, None
     except urllib_error.HTTPError as exc:
+        if exc.code == 304 and cache["tag"]:
+            logging.debug("Update check: release unchanged (304)")
+            cache["fetched_at"] = time.monotonic()
+            _persist_update_check(cache["tag"], cache["etag"])
+            return cache["tag"], None
         logging.debug("Update check: HTTP error %s", exc.code)
         return None, f"HTTP {exc.code}"
     except (urllib_error.URLError, OSError, ValueError):
@@ -896,16 +1204,124 @@ def get_latest_release_version() -> tuple[Optional[str], Optional[str]]:
         return None, "Network or parse error"
 
 
+PATH_RESOLVER_TTL = 30.0
+
+_path_resolver_cache: dict[str, tuple] = {}
+
+
+def _clear_path_resolver_cache() -> None:
+    """Drop all memoized command lookups."""
+    _path_resolver_cache.clear()
+
+
+def _stat_mtime_ns(path: str) -> Optional[int]:
+    """Return the modification time of ``path`` or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _stat_dir_mtime_ns(path: str) -> Optional[int]:
+    """Return the mtime of ``path`` if it is a directory, else None.
+
+    One ``stat`` answers both questions, replacing an ``isdir`` check
+    followed by a separate mtime lookup.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns if stat.S_ISDIR(info.st_mode) else None
+
+
+_which_cache = {"key": None, "paths": {}}
+
+
+def _reset_which_cache() -> None:
+    """Forget every memoized PATH lookup."""
+    _which_cache["key"] = None
+    _which_cache["paths"].clear()
+
+
+def _which(name: str) -> Optional[str]:
+    """Return ``shutil.which(name)``, memoized while PATH is unchanged.
+
+    The cache is keyed on the ``PATH`` value and the mtime of each of
+    its directories, so installing or removing a binary in any PATH
+    directory also invalidates it.
+    """
+    path_env = os.environ.get("PATH", os.defpath)
+    key = (
+        path_env,
+        tuple(_stat_mtime_ns(d) for d in path_env.split(os.pathsep) if d),
+    )
+    cache = _which_cache
+    if cache["key"] != key:
+        cache["key"] = key
+        cache["paths"].clear()
+    paths = cache["paths"]
+    if name not in paths:
+        paths[name] = shutil.which(name)
+    return paths[name]
+
+
+def _cached_resolver(
+    watch_path: Optional[Callable[[], str]] = None,
+) -> Callable[[Callable[[], Optional[str]]], Callable[[], Optional[str]]]:
+    """Memoize a command resolver for :data:`PATH_RESOLVER_TTL` seconds.
+
+    A change to the ``PATH`` environment variable invalidates the cached
+    value immediately.
+
+    Args:
+        watch_path: Optional callable returning a path whose mtime is
+            checked on every call; a change invalidates the cached value
+            before the TTL expires.
+
+    Returns:
+        Callable: Decorator wrapping a zero-argument resolver.
+    """
+
+    def decorator(
+        func: Callable[[], Optional[str]]
+    ) -> Callable[[], Optional[str]]:
+        key = func.__name__
+
+        @functools.wraps(func)
+        def wrapper() -> Optional[str]:
+            mtime = _stat_mtime_ns(watch_path()) if watch_path else None
+            path_env = os.environ.get("PATH")
+            now = time.monotonic()
+            entry = _path_resolver_cache.get(key)
+            if (
+                entry is not None
+                and now - entry[1] < PATH_RESOLVER_TTL
+                and entry[2] == mtime
+                and entry[3] == path_env
+            ):
+                return entry[0]
+            value = func()
+            _path_resolver_cache[key] = (value, now, mtime, path_env)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@_cached_resolver(lambda: LMS_CLI)
 def get_lms_cmd() -> Optional[str]:
     """Return LM Studio CLI path if executable, else resolve from PATH."""
     if os.path.isfile(LMS_CLI) and os.access(LMS_CLI, os.X_OK):
         return LMS_CLI
-    return shutil.which("lms")
+    return _which("lms")
 
 
 _get_llmster_cmd_state = {"last_candidate": None, "seen_call": False}
 
 
+@_cached_resolver(lambda: os.path.expanduser("~/.lmstudio/llmster"))
 def get_llmster_cmd() -> Optional[str]:
     """Return llmster path from PATH or install dir.
 
@@ -913,7 +1329,7 @@ def get_llmster_cmd() -> Optional[str]:
     """
     state = _get_llmster_cmd_state
 
-    llmster_cmd = shutil.which("llmster")
+    llmster_cmd = _which("llmster")
     if llmster_cmd:
         candidate = llmster_cmd
     else:
@@ -921,21 +1337,26 @@ def get_llmster_cmd() -> Optional[str]:
         if not os.path.isdir(llmster_root):
             candidate = None
         else:
-            candidates = []
+            candidate = None
             try:
-                for entry in os.listdir(llmster_root):
-                    candidate_path = os.path.join(
-                        llmster_root, entry, "llmster"
+                with os.scandir(llmster_root) as entries:
+                    candidates = sorted(
+                        (
+                            os.path.join(entry.path, "llmster")
+                            for entry in entries
+                            if entry.is_dir()
+                        ),
+                        reverse=True,
                     )
-                    if (
-                        os.path.isfile(candidate_path)
-                        and os.access(candidate_path, os.X_OK)
-                    ):
-                        candidates.append(candidate_path)
             except (OSError, PermissionError):
-                candidate = None
-            else:
-                candidate = sorted(candidates)[-1] if candidates else None
+                candidates = []
+            for candidate_path in candidates:
+                if (
+                    os.path.isfile(candidate_path)
+                    and os.access(candidate_path, os.X_OK)
+                ):
+                    candidate = candidate_path
+                    break
 
     log_needed = False
     if not state["seen_call"]:
@@ -963,6 +1384,13 @@ def get_llmster_cmd() -> Optional[str]:
     return candidate
 
 
+# Markers in ``lms ps`` output, matched case-insensitively in one pass.
+_LMS_PS_SIGNAL_RE = re.compile(
+    r"(?P<none>no models)|(?P<available>available)|(?P<loaded>loaded)",
+    re.IGNORECASE,
+)
+
+
 def _has_loaded_model(output: str) -> bool:
     """Return True if lms ps output indicates loaded model.
 
@@ -970,11 +1398,13 @@ def _has_loaded_model(output: str) -> bool:
     """
     if not output or not output.strip():
         return False
-    text = output.lower()
-    if "no models" in text:
-        logging.debug("lms ps output explicitly reports no models")
-        return False
-    if "available" in text and "loaded" not in text:
+    seen = set()
+    for match in _LMS_PS_SIGNAL_RE.finditer(output):
+        if match.lastgroup == "none":
+            logging.debug("lms ps output explicitly reports no models")
+            return False
+        seen.add(match.lastgroup)
+    if "available" in seen and "loaded" not in seen:
         logging.debug("lms ps output contains only available models, ignoring")
         return False
     return True
@@ -1022,29 +1452,103 @@ def _api_loaded_model_names(models: object) -> list[str]:
     return loaded_names
 
 
+@_cached_resolver()
 def get_pkill_cmd() -> Optional[str]:
     """Return absolute pkill path from PATH."""
-    return shutil.which("pkill")
+    return _which("pkill")
 
 
+@_cached_resolver()
 def get_notify_send_cmd() -> Optional[str]:
     """Return absolute notify-send path from PATH."""
-    return shutil.which("notify-send")
+    return _which("notify-send")
 
 
+@_cached_resolver()
 def get_ps_cmd() -> Optional[str]:
     """Return absolute ps path from PATH."""
-    return shutil.which("ps")
+    return _which("ps")
 
 
+@_cached_resolver()
 def get_pgrep_cmd() -> Optional[str]:
     """Return absolute pgrep path from PATH."""
-    return shutil.which("pgrep")
+    return _which("pgrep")
 
 
+@_cached_resolver()
 def get_dpkg_cmd() -> Optional[str]:
     """Return absolute dpkg path from PATH."""
-    return shutil.which("dpkg")
+    return _which("dpkg")
+
+
+API_REQUEST_TIMEOUT = 2
+
+_api_connection_cache = {"key": None, "conn": None}
+
+
+def _close_api_connection() -> None:
+    """Close and forget the cached LM Studio API connection."""
+    conn = _api_connection_cache["conn"]
+    _api_connection_cache["key"] = None
+    _api_connection_cache["conn"] = None
+    if conn is not None:
+        conn.close()
+
+
+def _get_api_connection(host: str, port: int) -> http_client.HTTPConnection:
+    """Return a keep-alive connection to the API, reusing the last one.
+
+    A new connection is only opened when the configured host or port
+    changes or the previous one failed, so polling the API does not pay
+    for a TCP handshake on every request.
+    """
+    cache = _api_connection_cache
+    key = (host, port)
+    if cache["key"] != key or cache["conn"] is None:
+        _close_api_connection()
+        cache["conn"] = http_client.HTTPConnection(
+            host, port, timeout=API_REQUEST_TIMEOUT
+        )
+        cache["key"] = key
+    return cache["conn"]
+
+
+def _request_api_json(host: str, port: int, path: str) -> object:
+    """Send one GET over the cached API connection and decode the JSON."""
+    conn = _get_api_connection(host, port)
+    try:
+        conn.request(
+            "GET", path, headers={"User-Agent": "lmstudio-tray-manager"}
+        )
+        response = conn.getresponse()
+        payload = response.read()
+    except (OSError, http_client.HTTPException):
+        _close_api_connection()
+        raise
+    if response.status != 200:
+        raise ValueError(f"API returned HTTP {response.status}")
+    return json.loads(payload.decode("utf-8"))
+
+
+def _fetch_api_models() -> object:
+    """Return the decoded JSON body of the API models endpoint.
+
+    A request on a kept-alive connection the server has since closed
+    is retried once on a fresh connection.
+
+    Raises:
+        OSError: If the API cannot be reached.
+        http.client.HTTPException: On a malformed HTTP exchange.
+        ValueError: If the config is invalid, the status is not 200 or
+            the body is not valid JSON.
+    """
+    parsed = urllib_parse.urlsplit(get_api_models_url())
+    host, port = parsed.hostname, parsed.port
+    try:
+        return _request_api_json(host, port, parsed.path)
+    except ConnectionError:
+        return _request_api_json(host, port, parsed.path)
 
 
 def check_api_models() -> bool:
@@ -1054,42 +1558,76 @@ def check_api_models() -> bool:
         bool: True if at least one model loaded.
     """
     try:
-        api_url = get_api_models_url()
-        _validate_url_scheme(api_url)
-        req = urllib_request.Request(
-            api_url,
-            headers={"User-Agent": "lmstudio-tray-manager"},
-        )
-        with urllib_request.urlopen(req, timeout=2) as response:  # nosec B310
-            payload = response.read()
-            data = json.loads(payload.decode("utf-8"))
-            if not isinstance(data, dict):
-                return False
-            models = data.get("data", [])
-            loaded_models = _api_loaded_model_names(models)
-            return len(loaded_models) > 0
+        data = _fetch_api_models()
     except (
-        urllib_error.HTTPError,
-        urllib_error.URLError,
+        http_client.HTTPException,
         OSError,
         ValueError,
         UnicodeDecodeError,
         json.JSONDecodeError,
     ):
         return False
+    if not isinstance(data, dict):
+        return False
+    models = data.get("data", [])
+    loaded_models = _api_loaded_model_names(models)
+    return len(loaded_models) > 0
+
+
+COMMAND_TIMEOUT = 10
+
+_command_cache: dict[tuple[str, ...], tuple] = {}
+
 
+def _clear_command_cache() -> None:
+    """Drop all results memoized by ``_run_safe_command``."""
+    _command_cache.clear()
 
-def _run_safe_command(command: list[str]) -> subprocess.CompletedProcess[str]:
+
+def _run_safe_command(
+    command: list[str], *, cache_ttl: float = 0
+) -> subprocess.CompletedProcess[str]:
     """Run pre-validated command list.
 
-    Caller must ensure trusted absolute-path executable.
+    Caller must ensure trusted absolute-path executable. Read-only
+    queries may pass ``cache_ttl`` to share one result between identical
+    calls for that many seconds; commands with side effects must not.
 
     Args:
         command: Command list.
+        cache_ttl: Seconds to reuse the result for; 0 disables caching.
 
     Returns:
         CompletedProcess: Result.
 
+    Raises:
+        ValueError: If format invalid or exe not absolute.
+    """
+    _validate_command(command)
+
+    key = tuple(command)
+    if cache_ttl > 0:
+        cached = _command_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+    result = subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+        shell=False,  # nosec B603 B607
+        timeout=COMMAND_TIMEOUT,
+    )
+    if cache_ttl > 0:
+        _command_cache[key] = (time.monotonic() + cache_ttl, result)
+    return result
+
+
+def _validate_command(command: list[str]) -> None:
+    """Reject commands that are not lists of strings with an absolute exe.
+
     Raises:
         ValueError: If format invalid or exe not absolute.
     """
@@ -1103,19 +1641,239 @@ def _run_safe_command(command: list[str]) -> subprocess.CompletedProcess[str]:
     if not os.path.isabs(exe):
         raise ValueError(f"Executable must be absolute path: {exe}")
 
-    return subprocess.run(
+
+def _run_safe_command_async(
+    command: list[str],
+    callback: Callable[[subprocess.CompletedProcess[str]], None],
+) -> bool:
+    """Run a pre-validated command without blocking the GLib main loop.
+
+    The command's stdout pipe is watched by the main loop and
+    ``callback`` receives the completed process once the pipe reaches
+    EOF and the command has exited; a command that closes its output
+    early is reaped through a GLib child watch instead of blocking. If
+    that takes longer than ``COMMAND_TIMEOUT`` the command is killed,
+    the pipe is dropped and ``callback`` receives a failed result, even
+    when a leftover grandchild still holds the pipe open.
+
+    Args:
+        command: Command list.
+        callback: Called with the result on the main loop.
+
+    Returns:
+        bool: False if GLib cannot watch file descriptors, in which case
+        the caller should run the command synchronously instead.
+
+    Raises:
+        ValueError: If format invalid or exe not absolute.
+        OSError: If the command cannot be started.
+    """
+    glib = _AppState.GLib
+    fd_add = getattr(glib, "unix_fd_add_full", None)
+    if fd_add is None:
+        return False
+    _validate_command(command)
+
+    proc = subprocess.Popen(  # nosec B603
         command,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=False,
-        shell=False,  # nosec B603 B607
-        timeout=10,
+        stderr=subprocess.DEVNULL,
+        shell=False,
     )
+    fd = proc.stdout.fileno()
+    os.set_blocking(fd, False)
+    chunks = []
+    sources = {"timer": None, "watch": None}
+
+    def finish(returncode: int) -> None:
+        proc.stdout.close()
+        stdout = b"".join(chunks).decode("utf-8", "replace")
+        callback(subprocess.CompletedProcess(command, returncode, stdout, ""))
+
+    def on_timeout() -> bool:
+        sources["timer"] = None
+        logging.debug("Killing %s after timeout", command[0])
+        if proc.poll() is None:
+            proc.kill()
+        glib.source_remove(sources["watch"])
+        finish(proc.wait() or 1)
+        return False
+
+    def on_exit(_pid: int, wait_status: int) -> None:
+        glib.source_remove(sources["timer"])
+        proc.returncode = os.waitstatus_to_exitcode(wait_status)
+        finish(proc.returncode)
+
+    def on_ready(_fd: int, _condition) -> bool:
+        try:
+            data = os.read(fd, 65536)
+        except BlockingIOError:
+            return True
+        if data:
+            chunks.append(data)
+            return True
+        if proc.poll() is None:
+            sources["watch"] = glib.child_watch_add(
+                glib.PRIORITY_DEFAULT, proc.pid, on_exit
+            )
+            return False
+        glib.source_remove(sources["timer"])
+        finish(proc.returncode)
+        return False
+
+    sources["timer"] = glib.timeout_add_seconds(COMMAND_TIMEOUT, on_timeout)
+    sources["watch"] = fd_add(
+        glib.PRIORITY_DEFAULT,
+        fd,
+        glib.IOCondition.IN | glib.IOCondition.HUP,
+        on_ready,
+    )
+    return True
+
+
+PROCESS_SNAPSHOT_TTL = 0.5
+PROC_ROOT = "/proc"
+
+_process_snapshot = {"lines": None, "taken_at": None}
+
+
+def _read_proc_lines() -> Optional[list[str]]:
+    """Return ``<pid> <args>`` lines read straight from ``/proc``.
+
+    Mirrors ``ps -eo pid=,args=`` without forking a helper. Kernel
+    threads have an empty ``cmdline`` and are skipped, as are processes
+    that exit mid-scan.
+
+    Returns:
+        list[str] | None: Output lines, or None if ``/proc`` is missing.
+    """
+    try:
+        entries = os.scandir(PROC_ROOT)
+    except OSError:
+        return None
+    lines = []
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(
+                    os.path.join(entry.path, "cmdline"), "rb"
+                ) as fh:
+                    raw = fh.read()
+            except OSError:
+                continue
+            args = raw.rstrip(b"\0").replace(b"\0", b" ")
+            if args:
+                lines.append(
+                    f"{entry.name} {args.decode('utf-8', 'replace')}"
+                )
+    return lines
+
+
+def _invalidate_process_snapshot() -> None:
+    """Drop the shared process snapshot and the daemon status cache.
+
+    The next lookup rescans ``/proc`` (or runs ``ps`` where ``/proc`` is
+    missing) and re-derives the daemon status from that scan.
+    """
+    _process_snapshot["lines"] = None
+    _process_snapshot["taken_at"] = None
+    _daemon_status_cache["status"] = None
+    _daemon_status_cache["taken_at"] = None
+
+
+def _wait_for_pids_exit(
+    pids: Sequence[int], timeout: float
+) -> Optional[bool]:
+    """Block until every PID in ``pids`` exits or ``timeout`` elapses.
+
+    Uses pidfds (Linux 5.3+), which become readable when the process
+    exits, so callers avoid re-scanning the process table while waiting.
+
+    Returns:
+        bool | None: True when all processes exited, False on timeout.
+        None when pidfds are unavailable, in which case callers should
+        poll.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None or not pids:
+        return None
+    fds = []
+    try:
+        for pid in pids:
+            try:
+                fds.append(pidfd_open(pid))
+            except ProcessLookupError:
+                continue
+        deadline = time.monotonic() + timeout
+        pending = fds
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            ready, _, _ = select.select(pending, [], [], remaining)
+            pending = [fd for fd in pending if fd not in ready]
+        return True
+    except OSError as exc:
+        logging.debug("pidfd wait unavailable: %s", exc)
+        return None
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _get_process_lines() -> Optional[list[str]]:
+    """Return ``ps -eo pid=,args=`` output lines.
+
+    One scan is shared by all callers for :data:`PROCESS_SNAPSHOT_TTL`
+    seconds, so a status refresh forks ``ps`` once instead of once per
+    helper. Where ``/proc`` is available it is read directly and ``ps``
+    is not forked at all.
+
+    Returns:
+        list[str] | None: Output lines, or None if ps is unavailable or
+        failed.
+    """
+    snapshot = _process_snapshot
+    now = time.monotonic()
+    taken_at = snapshot["taken_at"]
+    if taken_at is not None and now - taken_at < PROCESS_SNAPSHOT_TTL:
+        return snapshot["lines"]
+
+    lines = _read_proc_lines()
+    ps_cmd = get_ps_cmd() if lines is None else None
+    if ps_cmd and os.path.isabs(ps_cmd):
+        try:
+            result = _run_safe_command([ps_cmd, "-eo", "pid=,args="])
+        except (
+            FileNotFoundError,
+            ValueError,
+            OSError,
+            subprocess.SubprocessError,
+        ):
+            result = None
+        if result is not None and result.returncode == 0:
+            lines = result.stdout.splitlines()
+
+    snapshot["lines"] = lines
+    snapshot["taken_at"] = now
+    return lines
 
 
 def is_llmster_running() -> bool:
-    """Return True if llmster process running (using pgrep or ps)."""
+    """Return True if llmster process running (using ps or pgrep).
+
+    The shared ``ps`` snapshot answers first, so a status refresh does
+    not fork ``pgrep`` on top of the scan it already ran; ``pgrep`` is
+    only consulted when ``ps`` is unavailable.
+    """
+    lines = _get_process_lines()
+    if lines is not None:
+        return any(
+            "llmster" in line and "grep" not in line for line in lines
+        )
+
     pgrep_cmd = get_pgrep_cmd()
     if pgrep_cmd and os.path.isabs(pgrep_cmd):
         try:
@@ -1142,25 +1900,43 @@ def is_llmster_running() -> bool:
         ):
             pass
 
-    ps_cmd = get_ps_cmd()
-    if not ps_cmd or not os.path.isabs(ps_cmd):
-        return False
+    return False
+
+
+DAEMON_STATUS_TTL = 0.25
+
+_daemon_status_cache = {"status": None, "taken_at": None}
+
+
+def _get_daemon_status() -> str:
+    """Return daemon status: 'running', 'stopped', or 'not_found'.
 
+    The menu, the icon refresh and the stop helpers all ask within the
+    same tick, so the answer is shared for ``DAEMON_STATUS_TTL`` seconds.
+    Every daemon start or stop command invalidates it together with the
+    process snapshot, so post-command checks see the new state.
+    """
+    cache = _daemon_status_cache
+    now = time.monotonic()
+    taken_at = cache["taken_at"]
+    if taken_at is not None and now - taken_at < DAEMON_STATUS_TTL:
+        return cache["status"]
     try:
-        result = _run_safe_command([ps_cmd, "-eo", "pid=,args="])
-        if result.returncode == 0:
-            for line in result.stdout.splitlines():
-                if "llmster" in line and "grep" not in line:
-                    return True
+        if not get_llmster_cmd():
+            status = "not_found"
+        elif is_llmster_running():
+            status = "running"
+        else:
+            status = "stopped"
     except (
-        FileNotFoundError,
-        ValueError,
         OSError,
         subprocess.SubprocessError,
+        subprocess.TimeoutExpired,
     ):
-        pass
-
-    return False
+        status = "not_found"
+    cache["status"] = status
+    cache["taken_at"] = now
+    return status
 
 
 def _is_lm_studio_appimage_label(value):
@@ -1188,77 +1964,276 @@ def _is_lm_studio_appimage_label(value):
     return True
 
 
+_appimage_scan_cache: dict[str, tuple[int, Optional[str]]] = {}
+
+
+def _find_lm_studio_appimage(
+    search_path: str, mtime: Optional[int] = None
+) -> Optional[str]:
+    """Return the path of the first LM Studio AppImage in a directory.
+
+    A single ``scandir`` pass yields names together with their file
+    type, so directories matching the AppImage pattern are skipped
+    without an extra ``stat`` per entry. The result is reused until the
+    directory's mtime changes, i.e. until an entry is added, removed or
+    renamed.
+
+    Args:
+        search_path: Directory to scan.
+        mtime: The directory's mtime if the caller already has it.
+
+    Raises:
+        OSError: If ``search_path`` cannot be read.
+    """
+    if mtime is None:
+        mtime = _stat_mtime_ns(search_path)
+    cached = _appimage_scan_cache.get(search_path)
+    if mtime is not None and cached is not None and cached[0] == mtime:
+        return cached[1]
+    # Keep the smallest matching name so the pick does not depend on
+    # directory order; comparing names first skips ``is_file`` for
+    # entries that could not win anyway.
+    best = None
+    with os.scandir(search_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if (
+                (best is None or name < best)
+                and _is_lm_studio_appimage_label(name)
+                and entry.is_file()
+            ):
+                best = name
+    found = os.path.join(search_path, best) if best else None
+    if mtime is not None:
+        _appimage_scan_cache[search_path] = (mtime, found)
+    return found
+
+
+def _desktop_app_search_paths() -> list[str]:
+    """Return the directories scanned for an LM Studio AppImage."""
+    return [
+        _AppState.script_dir,
+        os.path.expanduser("~/Apps"),
+        os.path.expanduser("~/LM_Studio"),
+        os.path.expanduser("~/Applications"),
+        os.path.expanduser("~/.local/bin"),
+        "/opt/lm-studio",
+    ]
+
+
+DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+
+_dpkg_status_cache = {"mtime": None, "installed": {}}
+
+
+def _scan_dpkg_status(package: str) -> bool:
+    """Return True if the dpkg database marks ``package`` installed.
+
+    The status file is memory-mapped and searched for the package's
+    stanza, so only the matching record is copied out of the page cache.
+
+    Raises:
+        OSError: If the database cannot be read.
+    """
+    marker = f"Package: {package}\n".encode("utf-8")
+    with open(DPKG_STATUS_PATH, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0 if data[:len(marker)] == marker else -1
+            if start < 0:
+                start = data.find(b"\n" + marker)
+            if start < 0:
+                return False
+            end = data.find(b"\n\n", start + 1)
+            stanza = data[start:end if end >= 0 else len(data)]
+    for line in stanza.split(b"\n"):
+        if line.startswith(b"Status:"):
+            return line.split()[-2:] == [b"ok", b"installed"]
+    return False
+
+
+def _dpkg_has(package: str) -> Optional[bool]:
+    """Return whether dpkg lists ``package`` as installed.
+
+    Reads the dpkg database directly instead of forking ``dpkg``; answers
+    are reused until the database's mtime changes, which dpkg bumps on
+    every atomic rewrite.
+
+    Returns:
+        bool | None: None when the database is unavailable.
+    """
+    mtime = _stat_mtime_ns(DPKG_STATUS_PATH)
+    if mtime is None:
+        return None
+    cache = _dpkg_status_cache
+    if cache["mtime"] != mtime:
+        cache["mtime"] = mtime
+        cache["installed"].clear()
+    installed = cache["installed"]
+    if package not in installed:
+        try:
+            installed[package] = _scan_dpkg_status(package)
+        except OSError as exc:
+            logging.debug("Could not read %s: %s", DPKG_STATUS_PATH, exc)
+            return None
+    return installed[package]
+
+
+DPKG_QUERY_TTL = 30
+
+
+def _dpkg_query_many(
+    dpkg_cmd: str, packages: Sequence[str], ttl: int = DPKG_QUERY_TTL
+) -> dict[str, bool]:
+    """Ask ``dpkg-query`` once which of ``packages`` are installed.
+
+    All packages are queried in a single fork whose result is reused for
+    ``ttl`` seconds. ``dpkg-query`` is taken from the directory of
+    ``dpkg_cmd``, as both ship in the dpkg package.
+
+    Args:
+        dpkg_cmd: Absolute path to ``dpkg``.
+        packages: Package names to look up.
+        ttl: Cache window in seconds.
+
+    Returns:
+        dict[str, bool]: Installed flag for every requested package.
+
+    Raises:
+        OSError, subprocess.SubprocessError: If the query fails.
+    """
+    query_cmd = os.path.join(os.path.dirname(dpkg_cmd), "dpkg-query")
+    # Unknown packages make dpkg-query exit 1 while the known ones are
+    # still printed, so the return code is not checked.
+    result = _run_safe_command(
+        [query_cmd, "-W", "-f=${Package} ${Status}\n", *packages],
+        cache_ttl=ttl,
+    )
+    installed = dict.fromkeys(packages, False)
+    for line in result.stdout.splitlines():
+        name, _, status = line.partition(" ")
+        if name in installed:
+            installed[name] = status.endswith(" ok installed")
+    return installed
+
+
+def _lm_studio_deb_listed(dpkg_cmd: str) -> bool:
+    """Return True if the lm-studio package is installed via dpkg.
+
+    Falls back to ``dpkg-query`` when the database cannot be read.
+
+    Raises:
+        OSError, subprocess.SubprocessError: If the fallback query fails.
+    """
+    listed = _dpkg_has("lm-studio")
+    if listed is None:
+        listed = _dpkg_query_many(dpkg_cmd, ["lm-studio"])["lm-studio"]
+    return listed
+
+
+_desktop_install_cache = {"key": None, "status": None}
+
+
+def _reset_desktop_install_cache() -> None:
+    """Force the next status check to re-detect the installation."""
+    _desktop_install_cache["key"] = None
+    _desktop_install_cache["status"] = None
+
+
+def _appimage_search_dirs() -> tuple[tuple[str, int], ...]:
+    """Return ``(path, mtime_ns)`` for each existing AppImage search dir."""
+    dirs = []
+    for path in _desktop_app_search_paths():
+        mtime = _stat_dir_mtime_ns(path)
+        if mtime is not None:
+            dirs.append((path, mtime))
+    return tuple(dirs)
+
+
+def _desktop_install_key(dpkg_cmd: Optional[str]) -> tuple:
+    """Fingerprint the inputs of desktop app installation detection.
+
+    The dpkg database, ``PATH`` and every AppImage search directory
+    change their mtime when a package or file is added or removed, so
+    an unchanged key means the previous detection still holds.
+    """
+    return (
+        dpkg_cmd,
+        _stat_mtime_ns(DPKG_STATUS_PATH),
+        os.environ.get("PATH", os.defpath),
+        _appimage_search_dirs(),
+    )
+
+
+# "<pid> <args>" rows from ``ps -eo pid=,args=``.
+_PS_LINE_RE = re.compile(r"^\s*(\d+)\s+(\S.*?)\s*$")
+# Renderer/utility children, background workers and the llmster daemon.
+_DESKTOP_HELPER_RE = re.compile(
+    r"--type=|systemresourcesworker|liblmstudioworker|/llmster/"
+)
+
+
 def get_desktop_app_pids():
     """Return PIDs of LM Studio desktop app root processes.
 
     Excludes workers/helpers.
     """
     pids = []
-    ps_cmd = get_ps_cmd()
-    if not ps_cmd:
-        return pids
-    try:
-        result = _run_safe_command([ps_cmd, "-eo", "pid=,args="])
-        if result.returncode != 0:
-            return pids
+    for line in _get_process_lines() or ():
+        match = _PS_LINE_RE.match(line)
+        if match is None:
+            continue
 
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
+        pid_text, cmd_args = match.groups()
+        if _DESKTOP_HELPER_RE.search(cmd_args):
+            continue
 
-            parts = line.split(None, 1)
-            if len(parts) != 2:
+        if IS_MACOS:
+            if (
+                "LM Studio.app/Contents/MacOS" in cmd_args
+                or cmd_args.endswith("/LM Studio")
+                or cmd_args == "LM Studio"
+            ):
+                pids.append(int(pid_text))
                 continue
-
-            pid_text, cmd_args = parts
-            if not pid_text.isdigit():
+        else:
+            cmd_args_lower = cmd_args.lower()
+            if (
+                "/opt/LM Studio/lm-studio" in cmd_args
+                or cmd_args.startswith("/usr/bin/lm-studio")
+                or cmd_args.startswith("lm-studio ")
+                or cmd_args == "lm-studio"
+            ):
+                pids.append(int(pid_text))
                 continue
 
-            if "--type=" in cmd_args:
+            if _is_lm_studio_appimage_label(cmd_args_lower):
+                pids.append(int(pid_text))
                 continue
 
-            if (
-                "systemresourcesworker" in cmd_args
-                or "liblmstudioworker" in cmd_args
-                or "/llmster/" in cmd_args
-            ):
+            is_lm_studio_mount = (
+                "/lm-studio" in cmd_args
+                and ".mount_" in cmd_args
+                and "bench" not in cmd_args_lower
+            )
+            if is_lm_studio_mount:
+                pids.append(int(pid_text))
                 continue
 
-            if IS_MACOS:
-                if (
-                    "LM Studio.app/Contents/MacOS" in cmd_args
-                    or cmd_args.endswith("/LM Studio")
-                    or cmd_args == "LM Studio"
-                ):
-                    pids.append(int(pid_text))
-                    continue
-            else:
-                cmd_args_lower = cmd_args.lower()
-                if (
-                    "/opt/LM Studio/lm-studio" in cmd_args
-                    or cmd_args.startswith("/usr/bin/lm-studio")
-                    or cmd_args.startswith("lm-studio ")
-                    or cmd_args == "lm-studio"
-                ):
-                    pids.append(int(pid_text))
-                    continue
+    return pids
 
-                if _is_lm_studio_appimage_label(cmd_args_lower):
-                    pids.append(int(pid_text))
-                    continue
-
-                is_lm_studio_mount = (
-                    "/lm-studio" in cmd_args
-                    and ".mount_" in cmd_args
-                    and "bench" not in cmd_args_lower
-                )
-                if is_lm_studio_mount:
-                    pids.append(int(pid_text))
-                    continue
-    except (OSError, subprocess.SubprocessError, ValueError):
-        return []
 
+def get_llmster_pids() -> list[int]:
+    """Return PIDs of running llmster processes from the process scan."""
+    pids = []
+    for line in _get_process_lines() or ():
+        match = _PS_LINE_RE.match(line)
+        if match is None:
+            continue
+        pid_text, cmd_args = match.groups()
+        if "llmster" in cmd_args and "grep" not in cmd_args:
+            pids.append(int(pid_text))
     return pids
 
 
@@ -1311,6 +2286,8 @@ class TrayIcon:
         self.update_status = "Unknown"
         self.latest_update_version = None
         self.last_update_error = None
+        self._update_retry_delay = UPDATE_RETRY_BASE_SECONDS
+        self._update_retry_pending = False
         self.menu = gtk.Menu()
         self._seen_desktop_call = False
         self._last_desktop_detection = None
@@ -1363,12 +2340,12 @@ class TrayIcon:
         """Return False if within cooldown, else set cooldown and return True.
         """
         now = time.monotonic()
-        if now < self.action_lock_until:
-            remaining = self.action_lock_until - now
+        deadline = self.action_lock_until
+        if now < deadline:
             logging.info(
                 "Action blocked by cooldown: %s (%.1fs remaining)",
                 action_name,
-                remaining,
+                deadline - now,
             )
             return False
 
@@ -1431,6 +2408,7 @@ class TrayIcon:
 
         daemon_status = self.get_daemon_status()
         app_status = self.get_desktop_app_status()
+        self._menu_state = (daemon_status, app_status)
         daemon_indicator = self.get_status_indicator(daemon_status)
         app_indicator = self.get_status_indicator(app_status)
 
@@ -1523,23 +2501,11 @@ class TrayIcon:
     def get_daemon_status(self) -> str:
         """Return daemon status: 'running', 'stopped', or 'not_found'.
 
-        Returns:
-            str: Status string.
-        """
-        try:
-            llmster_cmd = get_llmster_cmd()
-            if not llmster_cmd:
-                return "not_found"
-            if is_llmster_running():
-                return "running"
-            return "stopped"
-        except (
-            OSError,
-            subprocess.SubprocessError,
-            subprocess.TimeoutExpired,
-        ):
-            return "not_found"
-
+        Returns:
+            str: Status string.
+        """
+        return _get_daemon_status()
+
     def get_desktop_app_status(self) -> str:
         """Return desktop app status: 'running', 'stopped', or 'not_found'.
 
@@ -1560,11 +2526,15 @@ class TrayIcon:
         detection = None
 
         dpkg_cmd = get_dpkg_cmd()
+        cache = _desktop_install_cache
+        key = _desktop_install_key(dpkg_cmd)
+        if cache["key"] == key and self._seen_desktop_call:
+            return cache["status"]
+
         if dpkg_cmd and os.path.isabs(dpkg_cmd):
             try:
-                result = _run_safe_command([dpkg_cmd, "-l"])
-                if "lm-studio" in result.stdout:
-                    if shutil.which("lm-studio"):
+                if _lm_studio_deb_listed(dpkg_cmd):
+                    if _which("lm-studio"):
                         detection = "dpkg"
                         status = "stopped"
                         self._seen_dpkg_missing = False
@@ -1590,32 +2560,14 @@ class TrayIcon:
             self._seen_dpkg_missing = False
 
         if status is None:
-            search_paths = [
-                _AppState.script_dir,
-                os.path.expanduser("~/Apps"),
-                os.path.expanduser("~/LM_Studio"),
-                os.path.expanduser("~/Applications"),
-                os.path.expanduser("~/.local/bin"),
-                "/opt/lm-studio",
-            ]
-            for search_path in search_paths:
-                if not os.path.isdir(search_path):
-                    continue
+            # The fingerprint already stat'ed every search directory.
+            for search_path, mtime in key[3]:
                 try:
-                    candidates = [
-                        f for f in os.listdir(search_path)
-                        if _is_lm_studio_appimage_label(f)
-                    ]
-                    picked = None
-                    if candidates:
-                        picked = sorted(candidates)[0]
-                    if picked:
-                        app_path = os.path.join(search_path, picked)
+                    app_path = _find_lm_studio_appimage(search_path, mtime)
+                    if app_path:
                         detection = f"appimage:{app_path}"
                         status = "stopped"
                         break
-                    if status is not None:
-                        break
                 except (OSError, PermissionError) as exc:
                     logging.debug(
                         "Error scanning %s for AppImage: %s",
@@ -1644,6 +2596,8 @@ class TrayIcon:
             self._last_desktop_detection = detection
             self._seen_desktop_call = True
 
+        cache["key"] = key
+        cache["status"] = status
         return status
 
     def get_status_indicator(self, status: str) -> str:
@@ -1689,13 +2643,32 @@ class TrayIcon:
             and os.path.basename(command[0]) == "notify-send"
             and isinstance(command[2], str)
         ):
-            icon_prefixes = ("✅", "ℹ️", "⚠️", "❌")
-            message = command[2].lstrip()
-            if not message.startswith(icon_prefixes):
-                command = list(command)
-                command[2] = f"ℹ️ {command[2]}"
+            command = [
+                *command[:2], _with_status_icon(command[2]), *command[3:]
+            ]
         return _run_safe_command(command)
 
+    def _notify(self, title: str, message: str) -> bool:
+        """Show a desktop notification.
+
+        libnotify shows it in-process when loaded; otherwise it goes
+        through ``notify-send``, and is dropped if that is not installed.
+
+        Args:
+            title: Notification title.
+            message: Notification text.
+
+        Returns:
+            bool: True if the notification was handed off.
+        """
+        if _show_libnotify(title, _with_status_icon(message)):
+            return True
+        notify_cmd = get_notify_send_cmd()
+        if not notify_cmd:
+            return False
+        self._run_validated_command([notify_cmd, title, message])
+        return True
+
     def _run_daemon_attempts(
         self,
         attempts: list[list[str]],
@@ -1729,9 +2702,11 @@ class TrayIcon:
 
             try:
                 result = self._run_validated_command(command)
+                _invalidate_process_snapshot()
                 if stop_when(result):
                     break
             except subprocess.TimeoutExpired:
+                _invalidate_process_snapshot()
                 logging.warning("Command timed out: %s", " ".join(command))
                 break
         return result
@@ -1808,10 +2783,12 @@ class TrayIcon:
             pass
 
         for _ in range(12):
+            _invalidate_process_snapshot()
             if not is_llmster_running():
                 return
             time.sleep(0.25)
 
+        _invalidate_process_snapshot()
         if is_llmster_running():
             logging.warning(
                 "SIGTERM did not stop llmster; sending SIGKILL"
@@ -1830,6 +2807,7 @@ class TrayIcon:
                 pass
 
             for _ in range(8):
+                _invalidate_process_snapshot()
                 if not is_llmster_running():
                     break
                 time.sleep(0.25)
@@ -1872,33 +2850,17 @@ class TrayIcon:
         """
         if not self._build_daemon_attempts("stop"):
             logging.error("llmster not found")
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        "llmster/lms not found. Nothing to stop.",
-                    ]
-                )
+            self._notify("Error", "llmster/lms not found. Nothing to stop.")
             return (False, None)
 
         stopped, result = self._stop_llmster_best_effort()
 
         if stopped:
             logging.info("llmster daemon stopped")
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "LLMster",
-                        (
-                            "Daemon stopped. You can now start the "
-                            "desktop app."
-                        ),
-                    ]
-                )
+            self._notify(
+                "LLMster",
+                "Daemon stopped. You can now start the desktop app.",
+            )
         else:
             err = "llmster process is still running"
             if result is not None:
@@ -1906,18 +2868,30 @@ class TrayIcon:
                 if detail:
                     err = f"{err}: {detail}"
             logging.error("Failed to stop llmster daemon: %s", err)
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        "Daemon stop failed: " + str(err)
-                    ]
-                )
+            self._notify("Error", "Daemon stop failed: " + str(err))
 
         return (stopped, result)
 
+    def _wait_desktop_app_stopped(self, pids: Sequence[int]) -> bool:
+        """Wait for the desktop app to exit after a signal was sent.
+
+        Blocks on pidfds for ``pids`` when the platform supports them so
+        the status check runs once, whether the processes exited or the
+        wait timed out; otherwise polls with :data:`STOP_POLL_DELAYS`
+        backoff, rescanning the process table on every poll.
+
+        Returns:
+            bool: True when the desktop app is no longer running.
+        """
+        if _wait_for_pids_exit(pids, STOP_WAIT_SECONDS) is None:
+            for delay in STOP_POLL_DELAYS:
+                _invalidate_process_snapshot()
+                if self.get_desktop_app_status() != "running":
+                    return True
+                time.sleep(delay)
+        _invalidate_process_snapshot()
+        return self.get_desktop_app_status() != "running"
+
     def _stop_desktop_app_processes(self) -> bool:
         """Stop LM Studio desktop processes using TERM, then KILL.
 
@@ -1931,26 +2905,18 @@ class TrayIcon:
             except (OSError, ProcessLookupError, PermissionError):
                 pass
 
-        for _ in range(8):
-            if self.get_desktop_app_status() != "running":
-                break
-            time.sleep(0.25)
-
-        if self.get_desktop_app_status() == "running":
-            desktop_pids = get_desktop_app_pids()
-            for pid in desktop_pids:
-                try:
-                    sigkill = getattr(signal, "SIGKILL", 9)
-                    os.kill(pid, sigkill)
-                except (OSError, ProcessLookupError, PermissionError):
-                    pass
+        if self._wait_desktop_app_stopped(desktop_pids):
+            return True
 
-            for _ in range(8):
-                if self.get_desktop_app_status() != "running":
-                    break
-                time.sleep(0.25)
+        desktop_pids = get_desktop_app_pids()
+        for pid in desktop_pids:
+            try:
+                sigkill = getattr(signal, "SIGKILL", 9)
+                os.kill(pid, sigkill)
+            except (OSError, ProcessLookupError, PermissionError):
+                pass
 
-        return self.get_desktop_app_status() != "running"
+        return self._wait_desktop_app_stopped(desktop_pids)
 
     def start_daemon(self, _widget: object) -> None:
         """Start the headless daemon.
@@ -1969,18 +2935,10 @@ class TrayIcon:
                 logging.error(
                     "Cannot start daemon: desktop app is still running"
                 )
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [
-                            notify_cmd,
-                            "Error",
-                            (
-                                "Failed to stop desktop app. "
-                                "Please stop it first."
-                            ),
-                        ]
-                    )
+                self._notify(
+                    "Error",
+                    "Failed to stop desktop app. Please stop it first.",
+                )
                 self.build_menu()
                 return
 
@@ -1990,15 +2948,10 @@ class TrayIcon:
         start_attempts = self._build_daemon_attempts("start")
         if not start_attempts:
             logging.error("llmster not found")
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        "llmster/lms not found. Please install LM Studio CLI.",
-                    ]
-                )
+            self._notify(
+                "Error",
+                "llmster/lms not found. Please install LM Studio CLI.",
+            )
             return
         try:
             result = self._run_daemon_attempts(
@@ -2010,33 +2963,19 @@ class TrayIcon:
 
             if is_llmster_running():
                 logging.info("llmster daemon started/ensured")
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [
-                            notify_cmd, "LLMster", "llmster daemon is running",
-                        ]
-                    )
+                self._notify("LLMster", "llmster daemon is running")
             else:
                 err = "Unknown error"
                 if result is not None:
                     err = result.stderr.strip() or result.stdout.strip() or err
                 logging.error("Failed to start llmster daemon: %s", err)
                 error_msg = "Daemon start failed: " + str(err)
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [notify_cmd, "Error", error_msg]
-                    )
+                self._notify("Error", error_msg)
             self.build_menu()
             self._schedule_menu_refresh()
         except (OSError, RuntimeError, subprocess.SubprocessError) as e:
             logging.error("Error starting llmster daemon: %s", e)
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [notify_cmd, "Error", "Error: " + str(e)]
-                )
+            self._notify("Error", "Error: " + str(e))
             self.build_menu()
 
     def stop_daemon(self, _widget: object) -> None:
@@ -2057,11 +2996,7 @@ class TrayIcon:
             self._schedule_menu_refresh()
         except (OSError, RuntimeError, subprocess.SubprocessError) as e:
             logging.error("Error stopping llmster daemon: %s", e)
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [notify_cmd, "Error", "Error: " + str(e)]
-                )
+            self._notify("Error", "Error: " + str(e))
             self.build_menu()
 
     def start_desktop_app(self, _widget: object) -> None:
@@ -2100,15 +3035,7 @@ class TrayIcon:
         lms_cmd = get_lms_cmd()
         if not lms_cmd:
             logging.error("lms CLI not found")
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        "lms CLI not found. Cannot launch app.",
-                    ]
-                )
+            self._notify("Error", "lms CLI not found. Cannot launch app.")
             return
 
         daemon_was_running = is_llmster_running()
@@ -2139,18 +3066,10 @@ class TrayIcon:
                 "Cannot start desktop app: daemon still running "
                 "after stop verification"
             )
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        (
-                            "Daemon could not be stopped. "
-                            "Please stop it manually."
-                        ),
-                    ]
-                )
+            self._notify(
+                "Error",
+                "Daemon could not be stopped. Please stop it manually.",
+            )
             _rebuild_menu()
             return
 
@@ -2162,9 +3081,8 @@ class TrayIcon:
         dpkg_cmd = get_dpkg_cmd()
         if dpkg_cmd:
             try:
-                result = _run_safe_command([dpkg_cmd, "-l"])
-                if "lm-studio" in result.stdout:
-                    resolved = shutil.which("lm-studio")
+                if _lm_studio_deb_listed(dpkg_cmd):
+                    resolved = _which("lm-studio")
                     if resolved and os.path.isabs(resolved):
                         app_path = "lm-studio"
                         app_found = True
@@ -2178,26 +3096,11 @@ class TrayIcon:
                 logging.warning("Error checking for .deb package: %s", e)
 
         if not app_found:
-            search_paths = [
-                _AppState.script_dir,
-                os.path.expanduser("~/Apps"),
-                os.path.expanduser("~/LM_Studio"),
-                os.path.expanduser("~/Applications"),
-                os.path.expanduser("~/.local/bin"),
-                "/opt/lm-studio",
-            ]
-            for search_path in search_paths:
-                if not os.path.isdir(search_path):
-                    continue
+            for search_path, mtime in _appimage_search_dirs():
                 try:
-                    candidates = [
-                        f for f in os.listdir(search_path)
-                        if _is_lm_studio_appimage_label(f)
-                    ]
-                    if not candidates:
+                    app_path = _find_lm_studio_appimage(search_path, mtime)
+                    if not app_path:
                         continue
-                    picked = sorted(candidates)[0]
-                    app_path = os.path.join(search_path, picked)
                     app_found = True
                     logging.info("Found AppImage: %s", app_path)
                     break
@@ -2209,7 +3112,7 @@ class TrayIcon:
         if app_found and app_path:
             try:
                 if app_path == "lm-studio":
-                    resolved_path = shutil.which("lm-studio")
+                    resolved_path = _which("lm-studio")
                     if not resolved_path or not os.path.isabs(resolved_path):
                         raise ValueError(
                             "lm-studio executable not found"
@@ -2243,7 +3146,7 @@ class TrayIcon:
                     if os.path.isdir(safe_path)
                 )
 
-                if shutil.which("lm-studio") == app_path:
+                if _which("lm-studio") == app_path:
                     is_safe = True
 
                 if not is_safe:
@@ -2274,42 +3177,24 @@ class TrayIcon:
                     "Started LM Studio desktop app: %s",
                     app_path
                 )
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [
-                            notify_cmd,
-                            "LM Studio",
-                            "LM Studio GUI is starting...",
-                        ]
-                    )
+                self._notify("LM Studio", "LM Studio GUI is starting...")
                 _rebuild_menu()
                 self._schedule_menu_refresh()
             except (OSError, subprocess.SubprocessError, ValueError) as e:
                 logging.error("Failed to start desktop app: %s", e)
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    error_msg = "Failed to start app: " + str(e)
-                    self._run_validated_command(
-                        [notify_cmd, "Error", error_msg]
-                    )
+                self._notify("Error", "Failed to start app: " + str(e))
         else:
             logging.warning(
                 "No LM Studio desktop app found (.deb or AppImage)"
             )
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        (
-                            "No LM Studio desktop app found.\n"
-                            "Please install from "
-                            "https://lmstudio.ai/download"
-                        ),
-                    ]
-                )
+            self._notify(
+                "Error",
+                (
+                    "No LM Studio desktop app found.\n"
+                    "Please install from "
+                    "https://lmstudio.ai/download"
+                ),
+            )
 
     def stop_desktop_app(self, _widget: object) -> None:
         """Stop the LM Studio desktop app process.
@@ -2325,15 +3210,7 @@ class TrayIcon:
         desktop_pids = get_desktop_app_pids()
         if not desktop_pids:
             logging.info("No LM Studio desktop app process found to stop")
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "LM Studio",
-                        "No running desktop app found",
-                    ]
-                )
+            self._notify("LM Studio", "No running desktop app found")
             return
 
         try:
@@ -2341,40 +3218,16 @@ class TrayIcon:
 
             if stopped:
                 logging.info("LM Studio desktop app stopped")
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [
-                            notify_cmd,
-                            "LM Studio",
-                            "Desktop app stopped",
-                        ]
-                    )
+                self._notify("LM Studio", "Desktop app stopped")
             else:
                 logging.warning("Failed to stop desktop app processes")
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    self._run_validated_command(
-                        [
-                            notify_cmd,
-                            "LM Studio",
-                            "Desktop app may still be running",
-                        ]
-                    )
+                self._notify("LM Studio", "Desktop app may still be running")
 
             self.build_menu()
             self._schedule_menu_refresh()
         except (OSError, RuntimeError, subprocess.SubprocessError) as e:
             logging.error("Failed to stop desktop app: %s", e)
-            notify_cmd = get_notify_send_cmd()
-            if notify_cmd:
-                self._run_validated_command(
-                    [
-                        notify_cmd,
-                        "Error",
-                        "Desktop app stop failed: " + str(e),
-                    ]
-                )
+            self._notify("Error", "Desktop app stop failed: " + str(e))
 
     def quit_app(self, _widget):
         """Handle the tray quit action by logging and exiting the Gtk main
@@ -2412,18 +3265,7 @@ class TrayIcon:
         def _models_text_from_api():
             """Return loaded-model text from API or default error text."""
             try:
-                api_url = get_api_models_url()
-                _validate_url_scheme(api_url)
-                req = urllib_request.Request(
-                    api_url,
-                    headers={"User-Agent": "lmstudio-tray-manager"},
-                )
-                with urllib_request.urlopen(  # nosec B310
-                    req, timeout=2
-                ) as response:
-                    payload = response.read()
-                    data = json.loads(payload.decode("utf-8"))
-
+                data = _fetch_api_models()
                 if isinstance(data, dict):
                     models = data.get("data", [])
                     loaded_models = _api_loaded_model_names(models)
@@ -2434,8 +3276,7 @@ class TrayIcon:
                             f"{model_names}"
                         )
             except (
-                urllib_error.HTTPError,
-                urllib_error.URLError,
+                http_client.HTTPException,
                 OSError,
                 ValueError,
                 UnicodeDecodeError,
@@ -2750,13 +3591,42 @@ class TrayIcon:
     def _check_updates_tick(self) -> bool:
         """Run the update check for scheduled timers."""
         self.check_updates()
+        self._schedule_update_retry()
         return True
 
     def _initial_update_check(self) -> bool:
         """Run a single update check shortly after startup."""
         self.check_updates()
+        self._schedule_update_retry()
+        return False
+
+    def _retry_update_check(self) -> bool:
+        """Run a one-shot retry after a failed scheduled update check."""
+        self._update_retry_pending = False
+        self.check_updates()
+        self._schedule_update_retry()
         return False
 
+    def _schedule_update_retry(self) -> None:
+        """Back off exponentially after failed update checks.
+
+        A failed check (status ``Unknown``) schedules a single retry whose
+        delay doubles on each consecutive failure up to
+        :data:`UPDATE_RETRY_MAX_SECONDS`. Any successful check resets the
+        delay to :data:`UPDATE_RETRY_BASE_SECONDS`.
+        """
+        if self.update_status != "Unknown":
+            self._update_retry_delay = UPDATE_RETRY_BASE_SECONDS
+            return
+        glib = _AppState.GLib
+        if glib is None or self._update_retry_pending:
+            return
+        delay = self._update_retry_delay
+        self._update_retry_delay = min(delay * 2, UPDATE_RETRY_MAX_SECONDS)
+        self._update_retry_pending = True
+        logging.debug("Update check failed; retrying in %ss", delay)
+        glib.timeout_add_seconds(delay, self._retry_update_check)
+
     def _format_update_check_message(
         self,
         status: str,
@@ -2764,33 +3634,15 @@ class TrayIcon:
         error: Optional[str],
     ) -> str:
         """Build the update check notification message."""
-        if status == "Update available" and latest:
-            url = get_release_url(latest)
-            return (
-                "New version available: "
-                f"{latest} (current {_AppState.APP_VERSION}) {url}"
-            )
-
-        messages = {
-            "Up to date": f"You are up to date ({_AppState.APP_VERSION})",
-            "Ahead of release": (
-                f"Ahead of release "
-                f"(current {_AppState.APP_VERSION}, latest {latest})"
-            ),
-            "Dev build": "Dev build: update checks disabled",
-        }
-        message = messages.get(status)
-        if message:
-            return message
-
-        detail = f" ({error})" if error else ""
-        return "Unable to check for updates." + detail
+        return _build_update_check_message(
+            status, latest, error, _AppState.APP_VERSION
+        )
 
     def manual_check_updates(self, _widget: object) -> None:
         """Run update check on demand and notify about the result."""
-        notified = self.check_updates()
-        notify_cmd = get_notify_send_cmd()
-        if not notify_cmd or notified:
+        if not self.begin_action_cooldown("manual_check_updates"):
+            return
+        if self.check_updates():
             return
 
         status = self.update_status or "Unknown"
@@ -2798,7 +3650,7 @@ class TrayIcon:
         error = self.last_update_error
         message = self._format_update_check_message(status, latest, error)
 
-        self._run_validated_command([notify_cmd, "Update Check", message])
+        self._notify("Update Check", message)
 
     def check_updates(self) -> bool:
         """Check GitHub for a newer release and notify the user.
@@ -2821,12 +3673,11 @@ class TrayIcon:
         self.latest_update_version = latest
         self.last_update_error = None
 
-        newer = is_newer_version(_AppState.APP_VERSION, latest)
         current_parts = parse_version(_AppState.APP_VERSION)
         latest_parts = parse_version(latest)
-        is_ahead = current_parts > latest_parts if (
-            current_parts and latest_parts
-        ) else False
+        comparable = bool(current_parts and latest_parts)
+        newer = comparable and latest_parts > current_parts
+        is_ahead = comparable and current_parts > latest_parts
 
         if newer:
             self.update_status = "Update available"
@@ -2848,25 +3699,21 @@ class TrayIcon:
             return False
 
         self.last_update_version = latest
-        notify_cmd = get_notify_send_cmd()
-        if notify_cmd:
-            url = get_release_url(latest)
-            message = (
-                "New version available: "
-                f"{latest} (current {_AppState.APP_VERSION}) {url}"
-            )
-            self._run_validated_command(
-                [notify_cmd, "Update Available", message]
-            )
-            return True
-        return False
+        url = get_release_url(latest)
+        message = (
+            "New version available: "
+            f"{latest} (current {_AppState.APP_VERSION}) {url}"
+        )
+        return self._notify("Update Available", message)
 
     def check_model(self) -> bool:
         """Check LM Studio runtime/model status and update tray icon.
 
         The ``_has_loaded_model`` helper is used to interpret the output of
         ``lms ps``.  This keeps the icon from flipping to OK when the CLI
-        merely reports a catalogue of available models.
+        merely reports a catalogue of available models. When GLib can
+        watch its pipe, ``lms ps`` runs in the background and its result
+        is applied by the probe's callback once the output arrives.
 
         Updates the tray icon using this schema:
         - FAIL: neither daemon nor desktop app is installed
@@ -2885,6 +3732,7 @@ class TrayIcon:
             lms_cmd = get_lms_cmd()
             current_status = None
             reason = ""
+            waiting = False
             daemon_status = self.get_daemon_status()
             app_status = self.get_desktop_app_status()
 
@@ -2898,14 +3746,14 @@ class TrayIcon:
             if both_missing:
                 current_status = "FAIL"
                 reason = "daemon and desktop app not installed"
-                self.indicator.set_icon_full(
+                self._set_indicator_icon(
                     ICON_FAIL,
                     "Daemon and desktop app not installed"
                 )
             elif not any_running:
                 current_status = "WARN"
                 reason = "daemon and desktop app stopped"
-                self.indicator.set_icon_full(
+                self._set_indicator_icon(
                     ICON_WARN,
                     "Daemon and desktop app stopped"
                 )
@@ -2916,47 +3764,27 @@ class TrayIcon:
                         app_running,
                     )
                     if can_use_lms_ps:
-                        result = _run_safe_command([lms_cmd, "ps"])
-                        if result.returncode == 0:
-                            if _has_loaded_model(result.stdout):
-                                current_status = "OK"
-                                reason = "lms ps indicates model loaded"
-                                self.indicator.set_icon_full(
-                                    ICON_OK, "Model loaded"
-                                )
-                            else:
-                                current_status = "INFO"
-                                reason = "lms ps indicates no model loaded"
-                                self.indicator.set_icon_full(
-                                    ICON_INFO,
-                                    "No model loaded"
-                                )
+                        result = self._lms_ps_result(lms_cmd)
+                        if result is None:
+                            # The probe's callback applies its result.
+                            current_status = self.last_status
+                            reason = "waiting for lms ps"
+                            waiting = True
                         else:
-                            if check_api_models():
-                                current_status = "OK"
-                                reason = "API reported models loaded"
-                                self.indicator.set_icon_full(
-                                    ICON_OK,
-                                    "Model loaded"
-                                )
-                            else:
-                                current_status = "INFO"
-                                reason = "API reported no models"
-                                self.indicator.set_icon_full(
-                                    ICON_INFO,
-                                    "No model loaded"
-                                )
+                            current_status, reason = self._lms_ps_status(
+                                result
+                            )
                     elif any_running and check_api_models():
                         current_status = "OK"
                         reason = "API reported models loaded"
-                        self.indicator.set_icon_full(
+                        self._set_indicator_icon(
                             ICON_OK,
                             "Model loaded",
                         )
                     else:
                         current_status = "INFO"
                         reason = "running, no model via API"
-                        self.indicator.set_icon_full(
+                        self._set_indicator_icon(
                             ICON_INFO,
                             "No model loaded",
                         )
@@ -2966,123 +3794,218 @@ class TrayIcon:
                         app_running,
                     )
                     if can_use_lms_ps:
-                        result = _run_safe_command([lms_cmd, "ps"])
-                        if result.returncode == 0:
-                            if _has_loaded_model(result.stdout):
-                                current_status = "OK"
-                                reason = "lms ps indicates model loaded"
-                                self.indicator.set_icon_full(
-                                    ICON_OK,
-                                    "Model loaded",
-                                )
-                            else:
-                                current_status = "INFO"
-                                reason = "lms ps indicates no model loaded"
-                                self.indicator.set_icon_full(
-                                    ICON_INFO,
-                                    "No model loaded",
-                                )
-                        elif check_api_models():
-                            current_status = "OK"
-                            reason = "API reported models loaded"
-                            self.indicator.set_icon_full(
-                                ICON_OK,
-                                "Model loaded",
-                            )
+                        result = self._lms_ps_result(lms_cmd)
+                        if result is None:
+                            # The probe's callback applies its result.
+                            current_status = self.last_status
+                            reason = "waiting for lms ps"
+                            waiting = True
                         else:
-                            current_status = "INFO"
-                            reason = "API reported no models"
-                            self.indicator.set_icon_full(
-                                ICON_INFO,
-                                "No model loaded",
+                            current_status, reason = self._lms_ps_status(
+                                result
                             )
                     elif any_running and check_api_models():
                         current_status = "OK"
                         reason = "API reported models loaded"
-                        self.indicator.set_icon_full(
+                        self._set_indicator_icon(
                             ICON_OK,
                             "Model loaded",
                         )
                     else:
                         current_status = "INFO"
                         reason = "running, no model via API"
-                        self.indicator.set_icon_full(
+                        self._set_indicator_icon(
                             ICON_INFO,
                             "No model loaded",
                         )
                 elif any_running and check_api_models():
                     current_status = "OK"
                     reason = "API reported models loaded"
-                    self.indicator.set_icon_full(ICON_OK, "Model loaded")
+                    self._set_indicator_icon(ICON_OK, "Model loaded")
                 else:
                     current_status = "INFO"
                     reason = "running, no model via API"
-                    self.indicator.set_icon_full(
+                    self._set_indicator_icon(
                         ICON_INFO,
                         "No model loaded"
                     )
 
-            if (
-                self.last_status != current_status
-                and self.last_status is not None
-            ):
-                logging.debug(
-                    "Status change reason: %s -> %s (%s)",
-                    self.last_status,
-                    current_status,
-                    reason,
-                )
-                notify_cmd = get_notify_send_cmd()
-                if notify_cmd:
-                    if current_status == "OK":
-                        msg = "✅ A model is loaded"
-                        self._run_validated_command(
-                            [notify_cmd, "LM Studio", msg]
-                        )
-                    elif current_status == "INFO":
-                        info_msg = ("ℹ️ Daemon or desktop app is running, "
-                                    + "but no model is loaded")
-                        self._run_validated_command(
-                            [
-                                notify_cmd,
-                                "LM Studio",
-                                info_msg,
-                            ]
-                        )
-                    elif current_status == "WARN":
-                        self._run_validated_command(
-                            [
-                                notify_cmd,
-                                "LM Studio",
-                                "⚠️ Neither daemon nor desktop app is running",
-                            ]
-                        )
-                    elif current_status == "FAIL":
-                        self._run_validated_command(
-                            [
-                                notify_cmd,
-                                "LM Studio",
-                                "❌ Daemon and desktop app are not installed",
-                            ]
-                        )
-                logging.info(
-                    "Status change: %s -> %s",
-                    self.last_status,
-                    current_status
+            if not waiting:
+                # A probe still in flight was spawned for an older state.
+                self._lms_ps_generation = (
+                    getattr(self, "_lms_ps_generation", 0) + 1
                 )
+                self._record_status(current_status, reason)
+            # The menu only reflects the daemon and app states, so skip
+            # rebuilding every GTK item on ticks where neither changed.
+            menu_state = (daemon_status, app_status)
+            if getattr(self, "_menu_state", None) != menu_state:
                 self.build_menu()
 
-            self.last_status = current_status
-            self.build_menu()
-
         except subprocess.TimeoutExpired:
             logging.debug("Timeout in lms ps check (keeping previous status)")
         except (OSError, RuntimeError, subprocess.SubprocessError) as e:
-            self.indicator.set_icon_full(ICON_FAIL, "Error checking status")
+            self._set_indicator_icon(ICON_FAIL, "Error checking status")
             logging.error("Error in status check: %s", e)
             self.build_menu()
+        self._watch_process_exits()
         return True
 
+    def _lms_ps_status(
+        self, result: subprocess.CompletedProcess[str]
+    ) -> tuple[str, str]:
+        """Set the icon from an ``lms ps`` result.
+
+        Falls back to the HTTP API when ``lms ps`` itself failed.
+
+        Returns:
+            tuple[str, str]: Status name and the reason it was chosen.
+        """
+        if result.returncode == 0:
+            if _has_loaded_model(result.stdout):
+                self._set_indicator_icon(ICON_OK, "Model loaded")
+                return "OK", "lms ps indicates model loaded"
+            self._set_indicator_icon(ICON_INFO, "No model loaded")
+            return "INFO", "lms ps indicates no model loaded"
+        if check_api_models():
+            self._set_indicator_icon(ICON_OK, "Model loaded")
+            return "OK", "API reported models loaded"
+        self._set_indicator_icon(ICON_INFO, "No model loaded")
+        return "INFO", "API reported no models"
+
+    def _record_status(self, current_status: str, reason: str) -> None:
+        """Log and notify a status change, then remember the new status.
+
+        Args:
+            current_status: Status computed by the latest check.
+            reason: Why that status was chosen, for the debug log.
+        """
+        if (
+            self.last_status != current_status
+            and self.last_status is not None
+        ):
+            logging.debug(
+                "Status change reason: %s -> %s (%s)",
+                self.last_status,
+                current_status,
+                reason,
+            )
+            if current_status == "OK":
+                self._notify("LM Studio", "✅ A model is loaded")
+            elif current_status == "INFO":
+                info_msg = ("ℹ️ Daemon or desktop app is running, "
+                            + "but no model is loaded")
+                self._notify("LM Studio", info_msg)
+            elif current_status == "WARN":
+                self._notify(
+                    "LM Studio",
+                    "⚠️ Neither daemon nor desktop app is running",
+                )
+            elif current_status == "FAIL":
+                self._notify(
+                    "LM Studio",
+                    "❌ Daemon and desktop app are not installed",
+                )
+            logging.info(
+                "Status change: %s -> %s",
+                self.last_status,
+                current_status
+            )
+
+        self.last_status = current_status
+
+    def _set_indicator_icon(self, icon: str, tooltip: str) -> None:
+        """Update the tray icon, skipping the call if nothing changed.
+
+        Every ``set_icon_full`` is a D-Bus round trip to the status
+        notifier host, so idle ticks that land on the same icon and
+        tooltip leave the indicator alone.
+        """
+        state = (icon, tooltip)
+        if getattr(self, "_icon_state", None) == state:
+            return
+        self._icon_state = state
+        self.indicator.set_icon_full(icon, tooltip)
+
+    def _lms_ps_result(
+        self, lms_cmd: str
+    ) -> Optional[subprocess.CompletedProcess[str]]:
+        """Return ``lms ps`` output without stalling the main loop.
+
+        Starts a background probe, unless one is still running, and
+        returns None; the probe's callback applies the result. Each probe
+        gets a new generation, so a status set after it was spawned is
+        not overwritten by its result. Without GLib fd watches ``lms ps``
+        runs synchronously.
+        """
+        if getattr(self, "_lms_ps_pending", False):
+            return None
+        command = [lms_cmd, "ps"]
+        generation = getattr(self, "_lms_ps_generation", 0) + 1
+        self._lms_ps_generation = generation
+        callback = functools.partial(self._on_lms_ps_done, generation)
+        if _run_safe_command_async(command, callback):
+            self._lms_ps_pending = True
+            return None
+        return _run_safe_command(command)
+
+    def _on_lms_ps_done(
+        self, generation: int, result: subprocess.CompletedProcess[str]
+    ) -> None:
+        """Apply a finished background ``lms ps`` result to the status.
+
+        Results from a probe older than the current generation are
+        dropped.
+        """
+        self._lms_ps_pending = False
+        if generation != self._lms_ps_generation:
+            logging.debug("Dropping stale lms ps result")
+            return
+        try:
+            self._record_status(*self._lms_ps_status(result))
+        except (OSError, RuntimeError, subprocess.SubprocessError) as e:
+            logging.error("Error applying lms ps result: %s", e)
+
+    def _watch_process_exits(self) -> None:
+        """Refresh status as soon as a running daemon or app process exits.
+
+        Each running PID gets a pidfd registered with the GLib main loop.
+        The pidfd turns readable on exit, so the tray reacts immediately
+        instead of on the next poll. Without pidfd support the periodic
+        poll alone picks up the change.
+        """
+        glib = _AppState.GLib
+        pidfd_open = getattr(os, "pidfd_open", None)
+        fd_add = getattr(glib, "unix_fd_add_full", None)
+        if pidfd_open is None or fd_add is None:
+            return
+        if not hasattr(self, "_pidfd_watches"):
+            self._pidfd_watches = {}
+        watches = self._pidfd_watches
+        for pid in get_desktop_app_pids() + get_llmster_pids():
+            if pid in watches:
+                continue
+            try:
+                fd = pidfd_open(pid)
+            except OSError:
+                continue
+            watches[pid] = fd
+            fd_add(
+                glib.PRIORITY_DEFAULT,
+                fd,
+                glib.IOCondition.IN,
+                self._on_process_exit,
+                pid,
+            )
+
+    def _on_process_exit(self, fd: int, _condition, pid: int) -> bool:
+        """Drop the exited PID's watch and refresh the tray status."""
+        self._pidfd_watches.pop(pid, None)
+        os.close(fd)
+        _invalidate_process_snapshot()
+        self.check_model()
+        return False
+
 
 class MacOSTrayIcon(_RumpsBase):
     """macOS menu-bar tray using the ``rumps`` library.
@@ -3165,19 +4088,7 @@ class MacOSTrayIcon(_RumpsBase):
         Returns:
             str: ``"running"``, ``"stopped"``, or ``"not_found"``.
         """
-        try:
-            llmster_cmd = get_llmster_cmd()
-            if not llmster_cmd:
-                return "not_found"
-            if is_llmster_running():
-                return "running"
-            return "stopped"
-        except (
-            OSError,
-            subprocess.SubprocessError,
-            subprocess.TimeoutExpired,
-        ):
-            return "not_found"
+        return _get_daemon_status()
 
     def get_desktop_app_status(self) -> str:
         """Check if LM Studio desktop app is running or installed (macOS).
@@ -3414,12 +4325,12 @@ class MacOSTrayIcon(_RumpsBase):
             bool: ``True`` when the action may proceed.
         """
         now = time.monotonic()
-        if now < self.action_lock_until:
-            remaining = self.action_lock_until - now
+        deadline = self.action_lock_until
+        if now < deadline:
             logging.info(
                 "Action blocked by cooldown: %s (%.1fs remaining)",
                 action_name,
-                remaining,
+                deadline - now,
             )
             return False
         self.action_lock_until = now + seconds
@@ -3601,9 +4512,11 @@ class MacOSTrayIcon(_RumpsBase):
             except (OSError, subprocess.SubprocessError):
                 pass
         for _ in range(12):
+            _invalidate_process_snapshot()
             if not is_llmster_running():
                 return
             time.sleep(0.25)
+        _invalidate_process_snapshot()
         if is_llmster_running():
             logging.warning(
                 "SIGTERM did not stop llmster; sending SIGKILL"
@@ -3616,6 +4529,7 @@ class MacOSTrayIcon(_RumpsBase):
                 except (OSError, subprocess.SubprocessError):
                     pass
             for _ in range(8):
+                _invalidate_process_snapshot()
                 if not is_llmster_running():
                     break
                 time.sleep(0.25)
@@ -3641,10 +4555,11 @@ class MacOSTrayIcon(_RumpsBase):
         for attempt in stop_attempts:
             try:
                 result = _run_safe_command(attempt)
+                _invalidate_process_snapshot()
                 if not is_llmster_running():
                     break
             except (OSError, subprocess.SubprocessError):
-                pass
+                _invalidate_process_snapshot()
 
         self._force_stop_llmster()
         stopped = not is_llmster_running()
@@ -3680,10 +4595,12 @@ class MacOSTrayIcon(_RumpsBase):
                 os.kill(pid, signal.SIGTERM)
             except (OSError, ProcessLookupError, PermissionError):
                 pass
-        for _ in range(8):
+        for delay in STOP_POLL_DELAYS:
+            _invalidate_process_snapshot()
             if self.get_desktop_app_status() != "running":
-                break
-            time.sleep(0.25)
+                return True
+            time.sleep(delay)
+        _invalidate_process_snapshot()
         if self.get_desktop_app_status() == "running":
             for pid in get_desktop_app_pids():
                 try:
@@ -3691,10 +4608,12 @@ class MacOSTrayIcon(_RumpsBase):
                     os.kill(pid, sigkill)
                 except (OSError, ProcessLookupError, PermissionError):
                     pass
-            for _ in range(8):
+            for delay in STOP_POLL_DELAYS:
+                _invalidate_process_snapshot()
                 if self.get_desktop_app_status() != "running":
-                    break
-                time.sleep(0.25)
+                    return True
+                time.sleep(delay)
+            _invalidate_process_snapshot()
         return self.get_desktop_app_status() != "running"
 
     # ------------------------------------------------------------------
@@ -3734,6 +4653,7 @@ class MacOSTrayIcon(_RumpsBase):
         for attempt in start_attempts:
             try:
                 _run_safe_command(attempt)
+                _invalidate_process_snapshot()
                 for _ in range(10):
                     if is_llmster_running():
                         break
@@ -3800,7 +4720,7 @@ class MacOSTrayIcon(_RumpsBase):
         if is_llmster_running():
             self._stop_daemon_with_notification()
 
-        open_cmd = shutil.which("open")
+        open_cmd = _which("open")
         if not open_cmd:
             self._notify("Error", "'open' command not found")
             return
@@ -3944,14 +4864,11 @@ class MacOSTrayIcon(_RumpsBase):
         self._update_info["last_error"] = None
         self.last_update_error = None
 
-        newer = is_newer_version(_AppState.APP_VERSION, latest)
         current_parts = parse_version(_AppState.APP_VERSION)
         latest_parts = parse_version(latest)
-        is_ahead = (
-            current_parts > latest_parts
-            if current_parts and latest_parts
-            else False
-        )
+        comparable = bool(current_parts and latest_parts)
+        newer = comparable and latest_parts > current_parts
+        is_ahead = comparable and current_parts > latest_parts
 
         if newer:
             self._update_info["status"] = "Update available"
@@ -3991,6 +4908,8 @@ class MacOSTrayIcon(_RumpsBase):
             _sender: rumps sender object (unused).
         """
         _ = _sender
+        if not self.begin_action_cooldown("manual_check_updates"):
+            return
         notified = self.check_updates()
         if notified:
             return
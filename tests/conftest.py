@@ -4,9 +4,26 @@ It includes an alias fixture `_monkeypatch` that returns the standard
 pytest `monkeypatch` fixture, allowing legacy tests to use the expected
 fixture name without modification."""
 
+import os
+
 import pytest
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip ``gui`` tests when ``LM_TRAY_FAST_TESTS=1`` is set.
+
+    Tests that are also marked ``fast`` (pure helpers such as version and
+    argument parsing) keep running, giving a quick smoke-test pass.
+    """
+    _ = config
+    if os.environ.get("LM_TRAY_FAST_TESTS") != "1":
+        return
+    skip_gui = pytest.mark.skip(reason="GUI tests skipped in fast mode")
+    for item in items:
+        if "gui" in item.keywords and "fast" not in item.keywords:
+            item.add_marker(skip_gui)
+
+
 @pytest.fixture
 def _monkeypatch(monkeypatch):
     """Compatibility alias for tests expecting `_monkeypatch`.
@@ -14,6 +14,9 @@ The tests use mocked GTK, AppIndicator, and GLib components to avoid requiring
 a display server or actual system dependencies during test execution.
 """
 
+import collections
+import copy
+import functools
 import importlib.util
 import json
 import logging
@@ -22,6 +25,7 @@ import signal
 import threading
 import subprocess  # nosec B404
 import sys
+import time
 import urllib.error
 from email.message import Message
 from pathlib import Path
@@ -29,6 +33,34 @@ from types import ModuleType, SimpleNamespace, MethodType
 import pytest
 
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_TRAY_SCRIPT_PATH = str(_REPO_ROOT / "lmstudio_tray.py")
+
+# Everything here drives the mocked GTK tray; pure-function tests are
+# additionally marked ``fast`` so they still run when
+# LM_TRAY_FAST_TESTS=1 skips the rest (see tests/conftest.py).  Without
+# the tray source the whole file is skipped before any fixture runs.
+pytestmark = [
+    pytest.mark.gui,
+    pytest.mark.skipif(
+        not os.path.isfile(_TRAY_SCRIPT_PATH),
+        reason="lmstudio_tray.py not found",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def restore_argv():
+    """Restore ``sys.argv`` after each test.
+
+    Tests that drive ``main()`` assign ``sys.argv`` directly; snapshotting
+    it here keeps those assignments from leaking into later tests.
+    """
+    saved = sys.argv
+    yield
+    sys.argv = saved
+
+
 @pytest.fixture(autouse=True)
 def sync_threads(monkeypatch):
     """Run background threads inline during testing.
@@ -68,21 +100,30 @@ def sync_threads(monkeypatch):
 class DummyMenu:
     """Dummy menu used by tests."""
 
+    __slots__ = ("items",)
+
     def __init__(self):
-        """Initialize an in-memory list of menu items."""
-        self.items = []
+        """Initialize an insertion-ordered mapping of menu items."""
+        self.items = {}
 
     def get_children(self):
-        """Return current child items as a copy."""
-        return list(self.items)
+        """Return a read-only snapshot of the current child items."""
+        return tuple(self.items.values())
+
+    def has_label(self, needle):
+        """Return whether any item's label contains ``needle``."""
+        return any(
+            needle in getattr(item, "label", "")
+            for item in self.items.values()
+        )
 
     def remove(self, item):
         """Remove a menu item from the container."""
-        self.items.remove(item)
+        del self.items[id(item)]
 
     def append(self, item):
         """Append a menu item to the container."""
-        self.items.append(item)
+        self.items[id(item)] = item
 
     def show_all(self):
         """Mimic GTK's show_all call."""
@@ -92,11 +133,13 @@ class DummyMenu:
 class DummyMenuItem:
     """Dummy menu item used by tests."""
 
+    __slots__ = ("label", "sensitive", "connected", "submenu")
+
     def __init__(self, label=""):
         """Create a dummy menu item with label and callbacks."""
         self.label = label
         self.sensitive = True
-        self.connected = []
+        self.connected = None
         self.submenu = None
 
     def set_sensitive(self, value):
@@ -104,8 +147,8 @@ class DummyMenuItem:
         self.sensitive = value
 
     def connect(self, event, callback):
-        """Store a signal connection tuple."""
-        self.connected.append((event, callback))
+        """Remember the latest signal connection tuple."""
+        self.connected = (event, callback)
 
     def set_submenu(self, submenu):
         """Store submenu reference."""
@@ -118,10 +161,38 @@ class DummySeparatorMenuItem(DummyMenuItem):
     It serves as a visual divider between menu items.
     """
 
+    __slots__ = ()
+
+
+# Every dummy dialog built by the current test, oldest first.
+_DIALOGS = []
+
+
+@pytest.fixture(autouse=True)
+def reset_dialogs():
+    """Forget dialogs created by earlier tests."""
+    _DIALOGS.clear()
+
+
+def _last_dialog(kind):
+    """Return the most recently created dialog of type ``kind``."""
+    return next(d for d in reversed(_DIALOGS) if isinstance(d, kind))
+
 
 class DummyMessageDialog:
     """Dummy message dialog to capture interactions."""
-    last_instance = None
+
+    __slots__ = (
+        "parent",
+        "flags",
+        "modal",
+        "message_type",
+        "buttons",
+        "text",
+        "secondary",
+        "ran",
+        "destroyed",
+    )
 
     def __init__(
         self,
@@ -142,7 +213,7 @@ class DummyMessageDialog:
         self.secondary = ""
         self.ran = False
         self.destroyed = False
-        DummyMessageDialog.last_instance = self
+        _DIALOGS.append(self)
 
     def format_secondary_text(self, text):
         """Store secondary dialog text."""
@@ -159,7 +230,23 @@ class DummyMessageDialog:
 
 class DummyAboutDialog:
     """Dummy about dialog to capture interactions."""
-    last_instance = None
+
+    __slots__ = (
+        "program_name",
+        "version",
+        "authors",
+        "website",
+        "website_label",
+        "comments",
+        "logo",
+        "modal",
+        "copyright",
+        "license",
+        "ran",
+        "destroyed",
+        "signals",
+        "added_labels",
+    )
 
     def __init__(self):
         """Initialize a lightweight about dialog stub."""
@@ -176,8 +263,9 @@ class DummyAboutDialog:
         self.ran = False
         self.destroyed = False
         self.signals = {}
-        self.added_labels = []
-        DummyAboutDialog.last_instance = self
+        # Insertion-ordered dict used as a set of packed label markups.
+        self.added_labels = {}
+        _DIALOGS.append(self)
 
     def get_content_area(self):
         """Return self so pack_start can be called on the dialog."""
@@ -186,8 +274,7 @@ class DummyAboutDialog:
     def pack_start(self, widget, *_args, **_kwargs):
         """Simulate packing a widget; capture markup if present."""
         if hasattr(widget, 'markup') and widget.markup is not None:
-            if widget.markup not in self.added_labels:
-                self.added_labels.append(widget.markup)
+            self.added_labels.setdefault(widget.markup)
 
     def set_program_name(self, name):
         """Store program name."""
@@ -235,7 +322,7 @@ class DummyAboutDialog:
 
     def add_link_label(self, markup):
         """Simulate adding a clickable label to the content area."""
-        self.added_labels.append(markup)
+        self.added_labels.setdefault(markup)
 
     def run(self):
         """Mark the dialog as shown."""
@@ -249,12 +336,21 @@ class DummyAboutDialog:
 class DummyIndicator:
     """Dummy indicator capturing status and menu updates."""
 
+    __slots__ = ("status", "title", "menu", "_icon_calls")
+
     def __init__(self):
         """Create a dummy indicator object for assertions."""
         self.status = None
         self.title = None
         self.menu = None
-        self.icon_calls = []
+        self._icon_calls = None
+
+    @property
+    def icon_calls(self):
+        """Return recorded icon updates, creating the log on first use."""
+        if self._icon_calls is None:
+            self._icon_calls = []
+        return self._icon_calls
 
     def set_status(self, status):
         """Persist indicator status value."""
@@ -575,8 +671,8 @@ class DummyGLibModule(ModuleType):
     Error = Exception
 
     @staticmethod
-    def timeout_add_seconds(_seconds, _callback):
-        """Stub timer registration and report success."""
+    def timeout_add_seconds(*_args, **_kwargs):
+        """Stub timer registration as a no-op and report success."""
         return True
 
     @staticmethod
@@ -595,16 +691,59 @@ class DummyGdkPixbufModule(ModuleType):
             return object()
 
 
+def _require_any_version(*args, **kwargs):
+    """Accept every ``gi.require_version`` request."""
+    _ = (args, kwargs)
+
+
+# The GI module stubs hold no per-test state, so one instance of each is
+# shared by every test that needs to put them into ``sys.modules``.
+_GI_STUB = ModuleType("gi")
+setattr(_GI_STUB, "require_version", _require_any_version)
+_GTK_STUB = DummyGtkModule("gi.repository.Gtk")
+_GLIB_STUB = DummyGLibModule("gi.repository.GLib")
+_APP_INDICATOR_STUB = DummyAppIndicatorModule(
+    "gi.repository.AyatanaAppIndicator3"
+)
+_GDK_PIXBUF_STUB = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
+_GI_DISPATCH = {
+    "gi.repository.Gtk": _GTK_STUB,
+    "gi.repository.GLib": _GLIB_STUB,
+    "gi.repository.GdkPixbuf": _GDK_PIXBUF_STUB,
+    "gi.repository.AyatanaAppIndicator3": _APP_INDICATOR_STUB,
+}
+_REAL_IMPORT_MODULE = importlib.import_module
+
+
+def _fake_gi_import(name, package=None, dispatch=_GI_DISPATCH):
+    """Resolve GI stubs by table lookup and defer everything else."""
+    stub = dispatch.get(name)
+    if stub is not None:
+        return stub
+    return _REAL_IMPORT_MODULE(name, package)
+
+
 class DummyUrlResponse:
     """Dummy response object for urllib tests."""
 
-    def __init__(self, payload):
-        """Store response payload as bytes."""
+    __slots__ = ("payload", "headers", "status")
+
+    def __init__(self, payload, headers=None, status=200):
+        """Store response payload bytes, headers and HTTP status."""
         self.payload = payload
+        self.headers = headers if headers is not None else {}
+        self.status = status
 
-    def read(self):
-        """Return raw payload bytes."""
-        return self.payload
+    def read(self, amt=-1):
+        """Return raw payload bytes, like ``HTTPResponse.read``.
+
+        Full reads hand back the stored immutable ``bytes`` object itself,
+        so shared responses are never copied; only a bounded ``amt`` read
+        slices the buffer.
+        """
+        if amt is None or amt < 0 or amt >= len(self.payload):
+            return self.payload
+        return bytes(memoryview(self.payload)[:amt])
 
     def __enter__(self):
         """Support context manager protocol."""
@@ -615,6 +754,85 @@ class DummyUrlResponse:
         return False
 
 
+class DummyHTTPConnection:
+    """Stand-in for ``http.client.HTTPConnection`` and its constructor.
+
+    Calling the instance records the ``(host, port)`` pair and returns
+    the instance itself, so it can replace the class. Each request
+    raises the next queued error, if any, or serves ``response``.
+    """
+
+    def __init__(self, response=None, errors=()):
+        """Store the response to serve and errors to raise first."""
+        self.response = response
+        self.errors = collections.deque(errors)
+        self.opened = []
+        self.requests = []
+        self.closed = 0
+
+    def __call__(self, host, port, timeout=None):
+        """Record a new connection and return this double."""
+        _ = timeout
+        self.opened.append((host, port))
+        return self
+
+    def request(self, method, url, headers=None):
+        """Record the request or raise the next queued error."""
+        _ = headers
+        if self.errors:
+            raise self.errors.popleft()
+        self.requests.append((method, url))
+
+    def getresponse(self):
+        """Return the configured response."""
+        return self.response
+
+    def close(self):
+        """Count connection closes."""
+        self.closed += 1
+
+
+class DummyDirEntry:
+    """Stand-in for ``os.DirEntry`` with a pre-resolved file type."""
+
+    __slots__ = ("name", "path", "_is_file")
+
+    def __init__(self, directory, name, is_file=True):
+        """Store the entry name, joined path and file type."""
+        self.name = name
+        self.path = os.path.join(directory, name)
+        self._is_file = is_file
+
+    def is_file(self):
+        """Return the cached file type."""
+        return self._is_file
+
+    def is_dir(self):
+        """Return the inverse of the cached file type."""
+        return not self._is_file
+
+
+class DummyScandir(list):
+    """List of DummyDirEntry objects usable as a ``scandir`` context."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self, _exc_type, _exc, _tb):
+        """No cleanup required for dummy listings."""
+        return False
+
+
+def _fake_scandir(*names):
+    """Return an ``os.scandir`` replacement listing regular files."""
+    return lambda path: DummyScandir(
+        DummyDirEntry(path, name) for name in names
+    )
+
+
 class DummyUrlLib:
     """Dummy urllib.request module for version checks."""
 
@@ -624,51 +842,53 @@ class DummyUrlLib:
         self.raise_exc = raise_exc
         self.last_request = None
 
-    class Request:
-        """Dummy request object matching urllib.request.Request."""
-
-        def __init__(self, url, headers=None):
-            """Accept url and headers; store for potential inspection."""
-            self.full_url = url
-            self.headers = headers or {}
+    @staticmethod
+    def Request(url, headers=None):  # pylint: disable=invalid-name
+        """Build a stand-in for urllib.request.Request."""
+        return SimpleNamespace(full_url=url, headers=headers or {})
 
     class HTTPSHandler:
         """Dummy HTTPS handler for urllib opener."""
 
     class DummyOpenerDirector:
-        """Dummy opener that returns a fixed response payload."""
+        """Dummy opener serving the owning DummyUrlLib's current payload."""
 
-        def __init__(self, payload, raise_exc=None):
-            """Store payload and optional exception for open calls."""
-            self.payload = payload
-            self.raise_exc = raise_exc
-            self.handlers = []
+        __slots__ = ("source",)
+
+        def __init__(self, source):
+            """Keep a reference to the DummyUrlLib that configures us."""
+            self.source = source
 
         def add_handler(self, handler):
-            """Record a handler instance (unused)."""
-            self.handlers.append(handler)
+            """Accept a handler instance; no test inspects them."""
+            _ = handler
 
         def open(self, _request, _timeout=None, **_kwargs):
             """Return a dummy response or raise the configured exception."""
-            if self.raise_exc is not None:
-                raise self.raise_exc
-            return DummyUrlResponse(self.payload)
+            if self.source.raise_exc is not None:
+                raise self.source.raise_exc
+            return DummyUrlResponse(self.source.payload)
 
     def build_opener(self, *handlers):
         """Return a dummy opener and attach any provided handlers."""
-        opener = DummyUrlLib.DummyOpenerDirector(
-            self.payload,
-            self.raise_exc,
-        )
+        opener = DummyUrlLib.DummyOpenerDirector(self)
         for handler in handlers:
             opener.add_handler(handler)
         return opener
 
     def opener_director(self):
-        """Return a dummy opener with this instance payload."""
-        return DummyUrlLib.DummyOpenerDirector(
-            self.payload, self.raise_exc
-        )
+        """Return a dummy opener bound to this instance."""
+        return DummyUrlLib.DummyOpenerDirector(self)
+
+
+_EMPTY_HEADERS = Message()
+_HTTP_404_EXC = urllib.error.HTTPError(
+    url="https://api.github.com",
+    code=404,
+    msg="Not Found",
+    hdrs=_EMPTY_HEADERS,
+    fp=None,
+)
 
 
 class DummyProcess:
@@ -678,6 +898,8 @@ class DummyProcess:
     while supporting the context manager protocol (with statement).
     """
 
+    __slots__ = ("pid",)
+
     def __init__(self, pid=1):
         """Initialize with a process ID."""
         self.pid = pid
@@ -691,79 +913,242 @@ class DummyProcess:
         return False
 
 
+_Completed = collections.namedtuple(
+    "_Completed", ["returncode", "stdout", "stderr"], defaults=(0, "", "")
+)
+
+
 def _completed(returncode=0, stdout="", stderr=""):
     """Create a subprocess-like completed result object."""
-    return SimpleNamespace(returncode=returncode, stdout=stdout, stderr=stderr)
+    return _Completed(returncode, stdout, stderr)
 
 
-@pytest.fixture(name="tray_module")
-def tray_module_fixture(monkeypatch, tmp_path):
-    """Import lmstudio_tray with mocked GI/GTK dependencies."""
-    gi_mod = ModuleType("gi")
+# Shared read-only results; production code never mutates them.
+_RC0 = _completed(returncode=0)
+_RC1 = _completed(returncode=1)
+_RC0_LMS = _completed(
+    returncode=0, stdout="lm-studio install ok installed\n"
+)
 
-    def require_version(*args, **kwargs):
-        _ = (args, kwargs)
-        return None
+_PIDFD_OPEN = getattr(os, "pidfd_open", None)
 
-    monkeypatch.setattr(
-        gi_mod,
-        "require_version",
-        require_version,
-        raising=False,
-    )
 
-    gtk_mod = DummyGtkModule("gi.repository.Gtk")
-    glib_mod = DummyGLibModule("gi.repository.GLib")
-    app_mod = DummyAppIndicatorModule("gi.repository.AyatanaAppIndicator3")
+def _safe_run(_args, **_kwargs):
+    """Return a safe default subprocess result."""
+    _ = (_args, _kwargs)
+    return _RC1
 
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository",
-        ModuleType("gi.repository"),
-    )
-    monkeypatch.setitem(sys.modules, "gi.repository.Gtk", gtk_mod)
-    monkeypatch.setitem(sys.modules, "gi.repository.GLib", glib_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository.AyatanaAppIndicator3",
-        app_mod,
-    )
 
-    original_import_module = importlib.import_module
+def _run_ok(*_args, **_kwargs):
+    """Stand in for a command that succeeds with no output."""
+    return _RC0
 
-    def fake_import_module(name):
-        """Resolve mocked GI modules during import."""
-        if name == "gi.repository.Gtk":
-            return gtk_mod
-        if name == "gi.repository.GLib":
-            return glib_mod
-        if name == "gi.repository.AyatanaAppIndicator3":
-            return app_mod
-        return original_import_module(name)
 
-    monkeypatch.setattr(importlib, "import_module", fake_import_module)
+def _run_fail(*_args, **_kwargs):
+    """Stand in for a command that fails with no output."""
+    return _RC1
+
+
+def _raiser(exc):
+    """Return a callable that raises ``exc`` whatever it is called with."""
+
+    def _raise(*_args, **_kwargs):
+        raise exc
+
+    return _raise
+
 
-    def safe_run(_args, **_kwargs):
-        """Return a safe default subprocess result during import."""
-        _ = (_args, _kwargs)
-        return _completed(returncode=1, stdout="", stderr="")
+def _run_lms(*_args, **_kwargs):
+    """Stand in for a dpkg query that lists the lm-studio package."""
+    return _RC0_LMS
 
-    monkeypatch.setattr(subprocess, "run", safe_run)
+
+class DummySubprocessRun:
+    """Scripted stand-in for ``subprocess.run``.
+
+    Results queued with :meth:`set_sequence` are returned (or raised, for
+    exception instances) in order; afterwards the constant result is used.
+    """
+
+    __slots__ = ("calls", "programs", "_queue", "_constant")
+
+    def __init__(self):
+        """Start with no recorded calls and a failing default result."""
+        self.calls = []
+        self.programs = set()
+        self._queue = []
+        self._constant = _RC1
+
+    def set_sequence(self, results):
+        """Queue results for the next calls."""
+        self._queue = list(reversed(results))
+
+    def set_constant(self, result):
+        """Return ``result`` for every call once the queue is empty."""
+        self._constant = result
+
+    def reset(self):
+        """Forget calls and scripted results."""
+        self.calls.clear()
+        self.programs.clear()
+        self._queue = []
+        self._constant = _RC1
+
+    def __call__(self, args, **_kwargs):
+        """Record the command and return the next scripted result."""
+        self.calls.append(args)
+        self.programs.add(os.path.basename(args[0]))
+        result = self._queue.pop() if self._queue else self._constant
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+_FAKE_RUN = DummySubprocessRun()
+
+
+def _snapshot_module_state(module):
+    """Capture module globals and ``_AppState`` attributes for resets.
+
+    Plain dicts stored in module globals (such as per-function state
+    tables) are copied as well, so their contents can be restored even
+    though the dict object itself is shared with the module functions.
+    """
+    module_state = {
+        name: (value, dict(value) if type(value) is dict else None)
+        for name, value in vars(module).items()
+        if not name.startswith("__")
+    }
+    app_state = getattr(module, "_AppState")
+    app_state_attrs = {
+        name: value
+        for name, value in vars(app_state).items()
+        if not name.startswith("__")
+    }
+    return module_state, app_state_attrs
+
+
+def _restore_module_state(module, snapshot):
+    """Reset module globals and ``_AppState`` to a captured snapshot.
+
+    Most tests leave the shared module untouched, so only entries that
+    differ from the snapshot are written back.
+    """
+    module_state, app_state_attrs = snapshot
+    namespace = vars(module)
+    for name in namespace.keys() - module_state.keys():
+        if not name.startswith("__"):
+            del namespace[name]
+    for name, (value, contents) in module_state.items():
+        if namespace.get(name, _MISSING) is not value:
+            namespace[name] = value
+        if contents is not None and value != contents:
+            value.clear()
+            value.update(contents)
+    app_state = getattr(module, "_AppState")
+    state = vars(app_state)
+    for name in state.keys() - app_state_attrs.keys():
+        if not name.startswith("__"):
+            delattr(app_state, name)
+    for name, value in app_state_attrs.items():
+        if state.get(name, _MISSING) is not value:
+            setattr(app_state, name, value)
+
+
+@functools.lru_cache(maxsize=None)
+def _tray_code():
+    """Compile ``lmstudio_tray.py`` once for tests that need fresh copies."""
+    with open(_TRAY_SCRIPT_PATH, encoding="utf-8") as fh:
+        return compile(fh.read(), _TRAY_SCRIPT_PATH, "exec")
+
+
+def _exec_tray_module(monkeypatch, module_name):
+    """Execute a fresh copy of the tray module as ``module_name``.
+
+    The compiled code object is shared, so each copy costs a single
+    ``exec`` rather than a read, parse and compile of the source.
+    """
+    module = ModuleType(module_name)
+    module.__file__ = _TRAY_SCRIPT_PATH
+    monkeypatch.setitem(sys.modules, module_name, module)
+    exec(_tray_code(), vars(module))  # nosec B102
+    return module
+
+
+_MISSING = object()
+
+
+def _install_modules(mapping):
+    """Insert stub modules into ``sys.modules`` in one batch.
+
+    Returns a callable that puts the previous entries back.
+    """
+    previous = {name: sys.modules.get(name, _MISSING) for name in mapping}
+    sys.modules.update(mapping)
+
+    def restore():
+        """Reinstate or drop each entry replaced by the batch."""
+        for name, module in previous.items():
+            if module is _MISSING:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+    return restore
+
+
+@pytest.fixture(name="gi_stub_modules", scope="session", autouse=True)
+def gi_stub_modules_fixture():
+    """Install mocked GI/GTK modules in ``sys.modules`` for the session."""
+    modules = {
+        "gi": _GI_STUB,
+        "gi.repository": ModuleType("gi.repository"),
+        **_GI_DISPATCH,
+    }
+    restore = _install_modules(modules)
+    yield modules
+    restore()
+
+
+@pytest.fixture(name="session_home", scope="session")
+def session_home_fixture(tmp_path_factory):
+    """Point ``HOME`` at one throwaway directory for the whole session.
+
+    Tests that create files under ``~`` request ``home`` instead.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        yield home
+
+
+@pytest.fixture(name="home")
+def home_fixture(monkeypatch, tmp_path):
+    """Point ``HOME`` at the test's own ``tmp_path``."""
     monkeypatch.setenv("HOME", str(tmp_path))
-    monkeypatch.setattr(os, "getpid", lambda: 99999)
+    return tmp_path
+
+
+@pytest.fixture(name="tray_module_cached", scope="session")
+def tray_module_cached_fixture(gi_stub_modules, session_home):
+    """Import lmstudio_tray once per session with mocked GI dependencies.
+
+    Yields the module together with a snapshot of its initial state, which
+    the function-scoped ``tray_module`` fixture restores after every test.
+    Under ``pytest -n auto`` each xdist worker is its own process, so
+    ``_AppState`` is never shared between concurrently running tests.
+    """
+    _ = session_home
+    gtk_mod = gi_stub_modules["gi.repository.Gtk"]
+    glib_mod = gi_stub_modules["gi.repository.GLib"]
+    app_mod = gi_stub_modules["gi.repository.AyatanaAppIndicator3"]
 
     module_name = "lmstudio_tray"
-    sys.modules.pop(module_name, None)
-    spec = importlib.util.spec_from_file_location(
-        module_name,
-        str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
-    )
-    if spec is None or spec.loader is None:
-        raise RuntimeError("Failed to create module spec or loader")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(subprocess, "run", _safe_run)
+        mp.syspath_prepend(str(_REPO_ROOT))
+        sys.modules.pop(module_name, None)
+        module = importlib.import_module(module_name)
     setattr(module, "Gtk", gtk_mod)
     setattr(module, "GLib", glib_mod)
     setattr(module, "AppIndicator3", app_mod)
@@ -795,33 +1180,320 @@ def tray_module_fixture(monkeypatch, tmp_path):
 
     setattr(module, "_set_state_for_tests", _set_state)
 
+    yield module, _snapshot_module_state(module)
+    sys.modules.pop(module_name, None)
+
+
+@pytest.fixture(name="tray_module")
+def tray_module_fixture(tray_module_cached, monkeypatch, tmp_path):
+    """Provide the cached lmstudio_tray module with per-test isolation.
+
+    Subprocess calls are patched for each test, pidfd waits are
+    disabled so fake PIDs never block, ``/proc`` and the dpkg database
+    point at missing paths so scans use the stubbed ``ps`` and ``dpkg``,
+    and module/app state is reset to the post-import snapshot on
+    teardown so tests cannot leak state into each other. ``HOME`` stays
+    on the session directory; tests that write under ``~`` use ``home``.
+    """
+    module, snapshot = tray_module_cached
+    monkeypatch.setattr(subprocess, "run", _safe_run)
+    monkeypatch.delattr(os, "pidfd_open", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setattr(module, "PROC_ROOT", str(tmp_path / "no-proc"))
+    monkeypatch.setattr(
+        module, "DPKG_STATUS_PATH", str(tmp_path / "no-dpkg-status")
+    )
     yield module
+    _restore_module_state(module, snapshot)
+
+
+@pytest.fixture(name="tray_handles", scope="session")
+def tray_handles_fixture(tray_module_cached):
+    """Pre-resolve the tray module's stdlib handles once per session.
+
+    Tests patch attributes on these namespaces instead of walking
+    ``tray_module.os.path`` and friends on every ``setattr`` call.
+    """
+    module, _snapshot = tray_module_cached
+    return SimpleNamespace(
+        subprocess=module.subprocess,
+        os=module.os,
+        ospath=module.os.path,
+        shutil=module.shutil,
+        urllib_request=module.urllib_request,
+        http_client=module.http_client,
+    )
+
+
+@pytest.fixture(name="fake_subprocess")
+def fake_subprocess_fixture(tray_module, monkeypatch):
+    """Route ``subprocess.run`` through the shared scripted fake."""
+    monkeypatch.setattr(tray_module.subprocess, "run", _FAKE_RUN)
+    yield _FAKE_RUN
+    _FAKE_RUN.reset()
+
+
+class DummyClock:
+    """Controllable stand-in for ``time.monotonic`` and ``time.sleep``."""
+
+    __slots__ = ("now", "sleeps")
+
+    def __init__(self, now=0.0):
+        """Start the clock at ``now`` with no recorded sleeps."""
+        self.now = now
+        self.sleeps = []
+
+    def monotonic(self):
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds):
+        """Record ``seconds`` and advance the clock without blocking."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def set(self, now):
+        """Jump the clock to ``now``."""
+        self.now = now
+
+    def advance(self, seconds):
+        """Move the clock forward by ``seconds``."""
+        self.now += seconds
+
+
+@pytest.fixture(name="fake_clock")
+def fake_clock_fixture(monkeypatch):
+    """Freeze the tray modules' clock and turn sleeps into clock jumps."""
+    clock = DummyClock()
+    monkeypatch.setattr(time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    return clock
+
+
+class DummyCallRecorder(list):
+    """Callable list that records each command it is invoked with."""
+
+    __slots__ = ()
+
+    def __call__(self, command, **_kwargs):
+        """Record ``command`` and report success."""
+        self.append(command)
+        return _RC0
+
+
+class DummySpawnRecorder(list):
+    """Callable list that records each ``os.spawnv`` invocation."""
+
+    __slots__ = ("pid",)
+
+    def __init__(self, pid=12345):
+        """Create an empty recorder that reports ``pid`` on each spawn."""
+        super().__init__()
+        self.pid = pid
+
+    def __call__(self, mode, path, args):
+        """Record the ``(mode, path, args)`` triple and return the PID."""
+        self.append((mode, path, args))
+        return self.pid
+
+
+@pytest.fixture(name="notify_spy")
+def notify_spy_fixture():
+    """Provide a recorder to stand in for ``_run_validated_command``."""
+    return DummyCallRecorder()
+
+
+def configure_start_desktop(
+    monkeypatch,
+    module,
+    tray,
+    *,
+    lms_cmd="/usr/bin/lms",
+    daemon_running=False,
+    notify_cmd="/usr/bin/notify-send",
+    dpkg_cmd="/usr/bin/dpkg",
+):
+    """Install the stubs shared by the ``start_desktop_app`` tests."""
+    _install_stubs(
+        monkeypatch,
+        (
+            (tray, "begin_action_cooldown", _always_ready),
+            (module, "get_lms_cmd", lambda: lms_cmd),
+            (module, "is_llmster_running", lambda: daemon_running),
+            (module, "get_notify_send_cmd", lambda: notify_cmd),
+            (module, "get_dpkg_cmd", lambda: dpkg_cmd),
+        ),
+    )
+
+
+def _install_stubs(monkeypatch, stubs):
+    """Apply ``(target, name, value)`` patches in a single pass."""
+    setattr_ = monkeypatch.setattr
+    for target, name, value in stubs:
+        setattr_(target, name, value)
+
+
+@functools.lru_cache(maxsize=None)
+def _executable_stubs(module):
+    """Return the patches that make every path an executable file."""
+    return (
+        (module.os.path, "isfile", lambda _p: True),
+        (module.os, "access", lambda _p, _m: True),
+    )
+
+
+def _stub_executables(monkeypatch, module):
+    """Report every path as an existing, executable regular file."""
+    _install_stubs(monkeypatch, _executable_stubs(module))
+
+
+@functools.lru_cache(maxsize=None)
+def _deb_install_stubs(module):
+    """Return the patches that fake an installed ``lm-studio`` .deb.
+
+    The table only depends on the session-wide module, so it is built
+    once and reused by every test that needs it.
+    """
+    return (
+        (module, "_run_safe_command", _run_lms),
+        (module.shutil, "which", lambda _x: "/usr/bin/lm-studio"),
+        *_executable_stubs(module),
+        (module.os.path, "isdir", lambda p: p == "/usr/bin"),
+    )
+
+
+def _stub_deb_install(monkeypatch, module):
+    """Pretend the ``lm-studio`` .deb is installed at /usr/bin/lm-studio."""
+    _install_stubs(monkeypatch, _deb_install_stubs(module))
+
+
+@pytest.fixture(name="start_desktop_tray")
+def start_desktop_tray_fixture(tray_module, tray, monkeypatch):
+    """Provide a tray preconfigured for ``start_desktop_app`` tests.
+
+    Tests that diverge call :func:`configure_start_desktop` again with
+    only the overrides they need.
+    """
+    configure_start_desktop(monkeypatch, tray_module, tray)
+    return tray
+
+
+def _lazy_tray_class(module):
+    """Return a TrayIcon subclass whose indicator and menu are lazy.
+
+    Most tests never touch the indicator or menu, so the doubles are only
+    built on first access and then cached on the instance.
+    """
+
+    class LazyTrayIcon(module.TrayIcon):
+        """TrayIcon test double with on-demand indicator and menu."""
+
+        @functools.cached_property
+        def indicator(self):
+            """Build the indicator double on first use."""
+            return DummyIndicator()
+
+        @functools.cached_property
+        def menu(self):
+            """Build the menu double on first use."""
+            return DummyMenu()
+
+    return LazyTrayIcon
 
 
 def _make_tray_instance(module):
     """Build a partially initialized TrayIcon for unit tests."""
-    tray = module.TrayIcon.__new__(module.TrayIcon)
-    tray.indicator = DummyIndicator()
-    tray.menu = DummyMenu()
-    tray.last_status = None
-    tray.action_lock_until = 0.0
-    tray.last_update_version = None
-    tray.latest_update_version = None
-    tray.update_status = "Unknown"
-    tray.last_update_error = None
-    _call_member(tray, "__setattr__", "_seen_desktop_call", False)
-    _call_member(tray, "__setattr__", "_last_desktop_detection", None)
-    _call_member(tray, "__setattr__", "_seen_dpkg_missing", False)
-    tray.build_menu = lambda: None
+    tray_cls = _lazy_tray_class(module)
+    tray = tray_cls.__new__(tray_cls)
+    vars(tray).update(
+        {
+            "last_status": None,
+            "action_lock_until": 0.0,
+            "last_update_version": None,
+            "latest_update_version": None,
+            "update_status": "Unknown",
+            "last_update_error": None,
+            "_update_retry_delay": module.UPDATE_RETRY_BASE_SECONDS,
+            "_update_retry_pending": False,
+            "_seen_desktop_call": False,
+            "_last_desktop_detection": None,
+            "_seen_dpkg_missing": False,
+            "build_menu": lambda: None,
+        }
+    )
+    return tray
+
+
+@pytest.fixture(name="tray_template", scope="session")
+def tray_template_fixture(tray_module_cached):
+    """Build the partially initialized TrayIcon once per session."""
+    module, _snapshot = tray_module_cached
+    return _make_tray_instance(module)
+
+
+@pytest.fixture(name="tray")
+def tray_fixture(tray_module, tray_template):
+    """Provide a per-test shallow copy of the template tray.
+
+    The template never touches its lazy indicator or menu, so each copy
+    builds its own doubles on first access; every other attribute is
+    immutable and safe to share.
+    """
+    _ = tray_module
+    return copy.copy(tray_template)
+
+
+def _always_ready(_action):
+    """Let every tray action past the cooldown check."""
+    return True
+
+
+@pytest.fixture(name="action_tray")
+def action_tray_fixture(tray):
+    """Provide a tray whose actions always pass the cooldown check.
+
+    The tray is a per-test copy, so the override is set on the instance
+    directly instead of being registered with ``monkeypatch``.
+    """
+    tray.begin_action_cooldown = _always_ready
     return tray
 
 
+def _state(module):
+    """Return the module's ``_AppState`` class without instantiating it."""
+    return getattr(module, "_AppState")
+
+
 def _call_member(instance, member_name, *args, **kwargs):
     """Call a member by name to avoid direct protected-member access."""
     member = getattr(instance, member_name)
     return member(*args, **kwargs)
 
 
+def test_gi_stubs_resolve_through_sys_modules(tray_module, gi_stub_modules):
+    """Mocked GI modules are found by plain ``import_module`` lookups."""
+    gtk_mod = gi_stub_modules["gi.repository.Gtk"]
+    assert sys.modules["gi.repository.Gtk"] is gtk_mod  # nosec B101
+    assert importlib.import_module("gi.repository.Gtk") is gtk_mod  # nosec
+    assert tray_module.Gtk is gtk_mod  # nosec B101
+
+
+def test_tray_fixture_builds_indicator_and_menu_lazily(tray, tray_template):
+    """Only build the indicator and menu doubles when a test uses them."""
+    assert "indicator" not in vars(tray)  # nosec B101
+    assert "menu" not in vars(tray)  # nosec B101
+    assert tray.indicator is tray.indicator  # nosec B101
+    assert isinstance(tray.menu, DummyMenu)  # nosec B101
+    assert "indicator" not in vars(tray_template)  # nosec B101
+
+
+def test_dummy_url_response_reads_without_copying():
+    """Full reads return the stored payload object; bounded reads slice."""
+    response = DummyUrlResponse(b"payload")
+    assert response.read() is response.payload  # nosec B101
+    assert response.read(3) == b"pay"  # nosec B101
+
+
 def test_get_app_version_reads_file(tray_module, tmp_path):
     """Read version string from a VERSION file."""
     tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
@@ -840,6 +1512,7 @@ def test_get_app_version_fallback_default(tray_module, tmp_path):
     )  # nosec B101
 
 
+@pytest.mark.fast
 def test_load_version_from_dir_empty_file(tray_module, tmp_path):
     """Return default version when VERSION file is empty."""
     (tmp_path / "VERSION").write_text("", encoding="utf-8")
@@ -847,47 +1520,21 @@ def test_load_version_from_dir_empty_file(tray_module, tmp_path):
     assert version == tray_module.DEFAULT_APP_VERSION  # nosec B101
 
 
-def test_version_flag_exits(tmp_path, monkeypatch):
+def test_version_flag_exits(tray_module, tmp_path, monkeypatch, capsys):
     """Test that the CLI exits when --version is provided."""
     (tmp_path / "VERSION").write_text("v9.9.9", encoding="utf-8")
-    gi_mod = ModuleType("gi")
-
-    def require_version(*args, **kwargs):
-        _ = (args, kwargs)
-        return None
-
     monkeypatch.setattr(
-        gi_mod,
-        "require_version",
-        require_version,
-        raising=False,
-    )
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository",
-        ModuleType("gi.repository"),
+        sys, "argv", ["lmstudio_tray.py", "m", str(tmp_path), "--version"]
     )
-    module_name = "lmstudio_tray_version"
-    sys.modules.pop(module_name, None)
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["lmstudio_tray.py", "m", str(tmp_path), "--version"]
-        spec = importlib.util.spec_from_file_location(
-            module_name,
-            str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
-        )
-        assert spec is not None and spec.loader is not None  # nosec B101
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        with pytest.raises(SystemExit):
-            module.main()
-    finally:
-        sys.argv = old_argv
+    with pytest.raises(SystemExit) as exc:
+        tray_module.main()
+    assert exc.value.code == 0  # nosec B101
+    assert capsys.readouterr().out.strip() == "v9.9.9"  # nosec B101
 
 
-def test_namespace_fallback_to_appindicator3(monkeypatch, tmp_path):
+def test_namespace_fallback_to_appindicator3(
+    monkeypatch, request, tmp_path
+):
     """If Ayatana namespace is missing, we fall back to ``AppIndicator3``.
 
     The module should still import successfully and the selected namespace
@@ -910,66 +1557,41 @@ def test_namespace_fallback_to_appindicator3(monkeypatch, tmp_path):
         require_version,
         raising=False,
     )
-    gtk_mod = DummyGtkModule("gi.repository.Gtk")
-    glib_mod = DummyGLibModule("gi.repository.GLib")
-    gdkpixbuf_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
     app_mod = DummyAppIndicatorModule("gi.repository.AppIndicator3")
+    dispatch = {
+        "gi.repository.Gtk": _GTK_STUB,
+        "gi.repository.GLib": _GLIB_STUB,
+        "gi.repository.GdkPixbuf": _GDK_PIXBUF_STUB,
+        "gi.repository.AppIndicator3": app_mod,
+    }
 
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository",
-        ModuleType("gi.repository"),
-    )
-    monkeypatch.setitem(sys.modules, "gi.repository.Gtk", gtk_mod)
-    monkeypatch.setitem(sys.modules, "gi.repository.GLib", glib_mod)
-    monkeypatch.setitem(sys.modules, "gi.repository.GdkPixbuf", gdkpixbuf_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository.AppIndicator3",
-        app_mod,
-    )
-
-    original_import = importlib.import_module
-
-    def fake_import(name):
-        if name == "gi.repository.Gtk":
-            return gtk_mod
-        if name == "gi.repository.GLib":
-            return glib_mod
-        if name == "gi.repository.GdkPixbuf":
-            return gdkpixbuf_mod
-        if name == "gi.repository.AppIndicator3":
-            return app_mod
-        return original_import(name)
-
-    monkeypatch.setattr(importlib, "import_module", fake_import)
-
-    module_name = "lmstudio_tray_fallback"
-    sys.modules.pop(module_name, None)
-    spec = importlib.util.spec_from_file_location(
-        module_name,
-        str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
+    request.addfinalizer(
+        _install_modules(
+            {
+                "gi": gi_mod,
+                "gi.repository": ModuleType("gi.repository"),
+                **dispatch,
+            }
+        )
+    )
+    monkeypatch.setattr(
+        importlib,
+        "import_module",
+        functools.partial(_fake_gi_import, dispatch=dispatch),
     )
-    assert spec is not None and spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
+
+    module = _exec_tray_module(monkeypatch, "lmstudio_tray_fallback")
 
     module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
 
     monkeypatch.setattr(module, "TrayIcon", lambda *_args, **_kwargs: None)
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = [sys.argv[0], "dummy-model", str(tmp_path)]
-        module.main()
-    finally:
-        sys.argv = old_argv
+    sys.argv = [sys.argv[0], "dummy-model", str(tmp_path)]
+    module.main()
 
-    assert getattr(module, "_AppState").AppIndicator3 is app_mod  # nosec B101
+    assert _state(module).AppIndicator3 is app_mod  # nosec B101
 
 
-def test_namespace_missing_exits(monkeypatch, capsys):
+def test_namespace_missing_exits(monkeypatch, request, capsys):
     """Fail with a clear error when no AppIndicator namespace exists."""
     gi_mod = ModuleType("gi")
 
@@ -984,42 +1606,31 @@ def test_namespace_missing_exits(monkeypatch, capsys):
         require_version,
         raising=False,
     )
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository",
-        ModuleType("gi.repository"),
-    )
-
-    module_name = "lmstudio_tray_no_ns"
-    sys.modules.pop(module_name, None)
-    spec = importlib.util.spec_from_file_location(
-        module_name,
-        str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
+    request.addfinalizer(
+        _install_modules(
+            {"gi": gi_mod, "gi.repository": ModuleType("gi.repository")}
+        )
     )
-    assert spec is not None and spec.loader is not None
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
 
-    spec.loader.exec_module(module)
+    module = _exec_tray_module(monkeypatch, "lmstudio_tray_no_ns")
     monkeypatch.setattr(module, "TrayIcon", lambda *_a, **_k: None)
+    sys.argv = [sys.argv[0]]
     with pytest.raises(SystemExit) as exc:
-        old_argv = sys.argv[:]
-        try:
-            sys.argv = [sys.argv[0]]
-            module.main()
-        finally:
-            sys.argv = old_argv
+        module.main()
     assert exc.value.code == 1
     err = capsys.readouterr().err
     assert "AppIndicator3" in err
 
 
+@pytest.mark.fast
 def test_parse_version_handles_prefix(tray_module):
     """Parse versions with a leading v prefix."""
     assert tray_module.parse_version("v1.2.3") == (1, 2, 3)  # nosec B101
+    assert tray_module.parse_version(" 2.10rc1.x") == (2, 10)  # nosec B101
+    assert tray_module.parse_version("1.2a.3") == (1, 2, 3)  # nosec B101
 
 
+@pytest.mark.fast
 def test_parse_version_empty_string(tray_module):
     """Test parse_version returns empty tuple for empty string."""
     assert tray_module.parse_version("") == ()  # nosec B101
@@ -1028,6 +1639,7 @@ def test_parse_version_empty_string(tray_module):
     assert tray_module.parse_version("beta") == ()  # nosec B101
 
 
+@pytest.mark.fast
 def test_is_newer_version(tray_module):
     """Compare version tuples for update checks."""
     assert tray_module.is_newer_version("v1.2.3", "v1.2.4")  # nosec B101
@@ -1038,9 +1650,27 @@ def test_is_newer_version(tray_module):
     assert not tray_module.is_newer_version("", "v1.0.0")  # nosec B101
 
 
-def test_get_latest_release_version_reads_tag(tray_module, monkeypatch):
+# Release payloads are immutable bytes shared across tests.
+_TAG_PAYLOADS = {
+    tag: json.dumps({"tag_name": tag}).encode("utf-8")
+    for tag in (
+        "v1.0.0",
+        "v1.0.1",
+        "v1.2.3",
+        "v2.0.0",
+        "v2.0.1",
+        "v3.1.0",
+        "v9.9.9",
+    )
+}
+_NO_TAG_PAYLOAD = json.dumps({"other_field": "value"}).encode("utf-8")
+
+
+def test_get_latest_release_version_reads_tag(
+    tray_module, tray_handles, monkeypatch
+):
     """Extract tag_name from GitHub release payload."""
-    payload = json.dumps({"tag_name": "v9.9.9"}).encode("utf-8")
+    payload = _TAG_PAYLOADS["v9.9.9"]
 
     class DummyResponse:
         """
@@ -1052,6 +1682,7 @@ def test_get_latest_release_version_reads_tag(tray_module, monkeypatch):
         """
         def __init__(self, data):
             self._data = data
+            self.headers = {}
 
         def read(self):
             """Read and return the stored data.
@@ -1123,22 +1754,22 @@ def test_get_latest_release_version_reads_tag(tray_module, monkeypatch):
         return DummyOpener(payload)
 
     monkeypatch.setattr(
-        tray_module.urllib_request,
+        tray_handles.urllib_request,
         "Request",
         dummy_request,
     )
     monkeypatch.setattr(
-        tray_module.urllib_request,
+        tray_handles.urllib_request,
         "HTTPSHandler",
         DummyHttpsHandler,
     )
     monkeypatch.setattr(
-        tray_module.urllib_request,
+        tray_handles.urllib_request,
         "OpenerDirector",
         DummyOpenerDirector,
     )
     monkeypatch.setattr(
-        tray_module.urllib_request,
+        tray_handles.urllib_request,
         "build_opener",
         dummy_build_opener,
     )
@@ -1147,33 +1778,37 @@ def test_get_latest_release_version_reads_tag(tray_module, monkeypatch):
     assert error is None  # nosec B101
 
 
-def test_get_latest_release_version_http_error(tray_module, monkeypatch):
-    """Return HTTP error code string on HTTPError."""
-    hdrs = Message()
-    exc = urllib.error.HTTPError(
-        url="https://api.github.com",
-        code=404,
-        msg="Not Found",
-        hdrs=hdrs,
-        fp=None,
-    )
-    monkeypatch.setattr(
-        tray_module, "urllib_request", DummyUrlLib(b"", raise_exc=exc)
-    )
-    version, error = tray_module.get_latest_release_version()
-    assert version is None  # nosec B101
-    assert error == "HTTP 404"  # nosec B101
+_SHARED_URLLIB = DummyUrlLib(b"")
 
 
-def test_get_latest_release_version_url_error(tray_module, monkeypatch):
-    """Return network error message on URLError."""
-    exc = urllib.error.URLError(reason="connection refused")
-    monkeypatch.setattr(
-        tray_module, "urllib_request", DummyUrlLib(b"", raise_exc=exc)
-    )
+@pytest.fixture(name="shared_urllib")
+def shared_urllib_fixture(tray_module, monkeypatch):
+    """Install one reusable DummyUrlLib and reset it after the test."""
+    monkeypatch.setattr(tray_module, "urllib_request", _SHARED_URLLIB)
+    yield _SHARED_URLLIB
+    _SHARED_URLLIB.payload = b""
+    _SHARED_URLLIB.raise_exc = None
+
+
+@pytest.mark.parametrize(
+    "exc, expected_error",
+    [
+        (_HTTP_404_EXC, "HTTP 404"),
+        (
+            urllib.error.URLError(reason="connection refused"),
+            "Network or parse error",
+        ),
+    ],
+    ids=["http_error", "url_error"],
+)
+def test_get_latest_release_version_errors(
+    tray_module, shared_urllib, exc, expected_error
+):
+    """Map HTTP and network failures to their error strings."""
+    shared_urllib.raise_exc = exc
     version, error = tray_module.get_latest_release_version()
     assert version is None  # nosec B101
-    assert error == "Network or parse error"  # nosec B101
+    assert error == expected_error  # nosec B101
 
 
 def test_get_latest_release_version_invalid_url(tray_module, monkeypatch):
@@ -1184,28 +1819,249 @@ def test_get_latest_release_version_invalid_url(tray_module, monkeypatch):
     assert error == "Invalid update URL"  # nosec B101
 
 
-def test_get_latest_release_version_invalid_json(tray_module, monkeypatch):
+def test_get_latest_release_version_invalid_json(tray_module, shared_urllib):
     """Return parse error message when response body is not valid JSON."""
-    monkeypatch.setattr(
-        tray_module, "urllib_request", DummyUrlLib(b"not valid json")
-    )
+    shared_urllib.payload = b"not valid json"
     version, error = tray_module.get_latest_release_version()
     assert version is None  # nosec B101
     assert error == "Network or parse error"  # nosec B101
 
 
-def test_get_latest_release_version_no_tag(tray_module, monkeypatch):
+def test_get_latest_release_version_no_tag(tray_module, shared_urllib):
     """Return no-tag error when tag_name is absent from JSON response."""
-    payload = json.dumps({"other_field": "value"}).encode("utf-8")
-    monkeypatch.setattr(tray_module, "urllib_request", DummyUrlLib(payload))
+    shared_urllib.payload = _NO_TAG_PAYLOAD
     version, error = tray_module.get_latest_release_version()
     assert version is None  # nosec B101
     assert error == "No tag found"  # nosec B101
 
 
-def test_check_updates_notifies_once(tray_module, monkeypatch):
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ('{"id": 1, "tag_name" : "v1.4.0", "body": "', "v1.4.0"),
+        ('{"tag_name": null}', None),
+        ('{"name": "x"}', None),
+        ("[]", None),
+    ],
+    ids=["partial_body", "null_tag", "missing_key", "not_object"],
+)
+def test_extract_tag_name(tray_module, payload, expected):
+    """Decode only the tag_name value from a release payload."""
+    tag = _call_member(tray_module, "_extract_tag_name", payload)
+    assert tag == expected  # nosec B101
+
+
+def test_get_latest_release_version_caches_success(
+    tray_module, shared_urllib, fake_clock
+):
+    """Serve repeat lookups from cache until the TTL elapses."""
+    fake_clock.set(100.0)
+    shared_urllib.payload = _TAG_PAYLOADS["v1.2.3"]
+    assert tray_module.get_latest_release_version() == (  # nosec B101
+        "v1.2.3",
+        None,
+    )
+
+    shared_urllib.raise_exc = _HTTP_404_EXC
+    fake_clock.advance(tray_module.RELEASE_CACHE_TTL_DEFAULT - 1)
+    assert tray_module.get_latest_release_version() == (  # nosec B101
+        "v1.2.3",
+        None,
+    )
+
+    fake_clock.advance(1)
+    assert tray_module.get_latest_release_version() == (  # nosec B101
+        None,
+        "HTTP 404",
+    )
+
+
+def test_get_latest_release_version_does_not_cache_failures(
+    tray_module, shared_urllib
+):
+    """Retry the network after a failed lookup and clear on demand."""
+    shared_urllib.raise_exc = _HTTP_404_EXC
+    tray_module.get_latest_release_version()
+    shared_urllib.raise_exc = None
+    shared_urllib.payload = _TAG_PAYLOADS["v2.0.0"]
+    version, _ = tray_module.get_latest_release_version()
+    assert version == "v2.0.0"  # nosec B101
+
+    _call_member(tray_module, "_clear_latest_release_cache")
+    shared_urllib.payload = _TAG_PAYLOADS["v2.0.1"]
+    version, _ = tray_module.get_latest_release_version()
+    assert version == "v2.0.1"  # nosec B101
+
+
+def _forget_in_memory_release(module):
+    """Drop the in-memory release cache as a tray restart would."""
+    cache = getattr(module, "_latest_release_cache")
+    cache.update(
+        {"tag": None, "fetched_at": None, "etag": None, "loaded": False}
+    )
+
+
+def test_update_check_persists_across_restarts(tray_module, shared_urllib):
+    """Reuse a recent on-disk check instead of fetching after restart."""
+    shared_urllib.payload = _TAG_PAYLOADS["v2.0.0"]
+    tray_module.get_latest_release_version()
+    text = Path(getattr(tray_module, "_get_update_check_path")()).read_text(
+        encoding="utf-8"
+    )
+    assert ", " not in text and ": " not in text  # nosec B101
+    record = json.loads(text)
+    assert record["tag"] == "v2.0.0"  # nosec B101
+
+    _forget_in_memory_release(tray_module)
+    shared_urllib.raise_exc = _HTTP_404_EXC
+    assert tray_module.get_latest_release_version() == (  # nosec B101
+        "v2.0.0",
+        None,
+    )
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        '{"tag": "v9.9.9"}',
+        '{"tag": "v9.9.9", "checked_at": "2000-01-01T00:00:00+00:00"}',
+        '{"tag": "v9.9.9", "checked_at": "2000-01-01T00:00:00"}',
+        '{"tag": "", "checked_at": "%s"}',
+    ],
+)
+def test_update_check_ignores_stale_or_invalid_record(
+    tray_module, shared_urllib, content
+):
+    """Fetch from the network when the persisted record is unusable."""
+    if "%s" in content:
+        content = content % tray_module.datetime.now(
+            tray_module.timezone.utc
+        ).isoformat()
+    path = Path(getattr(tray_module, "_get_update_check_path")())
+    path.parent.mkdir(parents=True)
+    path.write_text(content, encoding="utf-8")
+    shared_urllib.payload = _TAG_PAYLOADS["v1.2.3"]
+    assert tray_module.get_latest_release_version() == (  # nosec B101
+        "v1.2.3",
+        None,
+    )
+
+
+def test_update_check_path_defaults_to_home_cache(
+    tray_module, home, monkeypatch
+):
+    """Fall back to ``~/.cache`` when XDG_CACHE_HOME is unset."""
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    path = getattr(tray_module, "_get_update_check_path")()
+    expected = home / ".cache" / "lmstudio-tray-manager" / "last_update_check"
+    assert path == str(expected)  # nosec B101
+
+
+def test_update_check_record_loaded_once(
+    tray_module, shared_urllib, monkeypatch
+):
+    """Read the on-disk record only on the first lookup."""
+    loads = []
+    load = getattr(tray_module, "_load_persisted_update_check")
+    monkeypatch.setattr(
+        tray_module,
+        "_load_persisted_update_check",
+        lambda: loads.append(1) or load(),
+    )
+    shared_urllib.raise_exc = _HTTP_404_EXC
+    tray_module.get_latest_release_version()
+    tray_module.get_latest_release_version()
+    assert loads == [1]  # nosec B101
+
+
+def test_persist_update_check_tolerates_write_errors(
+    tray_module, monkeypatch, tmp_path
+):
+    """Skip persisting silently when the cache directory is unwritable."""
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    _call_member(tray_module, "_persist_update_check", "v1.0.0", None)
+    assert blocker.is_file()  # nosec B101
+
+
+def test_get_latest_release_version_revalidates_with_etag(
+    tray_module, monkeypatch
+):
+    """Send If-None-Match after expiry and reuse the tag on HTTP 304."""
+    not_modified = urllib.error.HTTPError(
+        url="https://api.github.com",
+        code=304,
+        msg="Not Modified",
+        hdrs=_EMPTY_HEADERS,
+        fp=None,
+    )
+    responses = iter(
+        [
+            DummyUrlResponse(
+                _TAG_PAYLOADS["v3.1.0"],
+                {"ETag": '"abc"'},
+            ),
+            not_modified,
+        ]
+    )
+    sent_headers = []
+
+    def fake_open(request, **_kwargs):
+        sent_headers.append(request.headers)
+        result = next(responses)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setenv("LMS_TRAY_RELEASE_TTL", "0")
+    monkeypatch.setattr(
+        tray_module,
+        "urllib_request",
+        SimpleNamespace(
+            Request=DummyUrlLib.Request,
+            HTTPSHandler=DummyUrlLib.HTTPSHandler,
+            build_opener=lambda *_h: SimpleNamespace(open=fake_open),
+        ),
+    )
+
+    first = tray_module.get_latest_release_version()
+    second = tray_module.get_latest_release_version()
+
+    assert first == ("v3.1.0", None)  # nosec B101
+    assert second == ("v3.1.0", None)  # nosec B101
+    assert "If-None-Match" not in sent_headers[0]  # nosec B101
+    assert sent_headers[1]["If-None-Match"] == '"abc"'  # nosec B101
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (None, 3600.0),
+        ("120", 120.0),
+        ("0", 0.0),
+        ("-5", 3600.0),
+        ("soon", 3600.0),
+    ],
+    ids=["unset", "custom", "zero", "negative", "invalid"],
+)
+def test_get_release_cache_ttl_env(tray_module, monkeypatch, raw, expected):
+    """Read the cache TTL from the environment with a safe fallback."""
+    if raw is None:
+        monkeypatch.delenv("LMS_TRAY_RELEASE_TTL", raising=False)
+    else:
+        monkeypatch.setenv("LMS_TRAY_RELEASE_TTL", raw)
+    ttl = _call_member(tray_module, "_get_release_cache_ttl")
+    assert ttl == expected  # nosec B101
+
+
+def test_check_updates_notifies_once(
+    tray_module, tray, monkeypatch, notify_spy
+):
     """Send a single update notification per latest version."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1218,31 +2074,23 @@ def test_check_updates_notifies_once(tray_module, monkeypatch):
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.check_updates()
     tray.check_updates()
-    assert len(notify_calls) == 1  # nosec B101
+    assert len(notify_spy) == 1  # nosec B101
     assert tray.update_status == "Update available"  # nosec B101
 
 
-def test_check_updates_dev_build(tray_module, monkeypatch):
+def test_check_updates_dev_build(tray_module, tray, monkeypatch):
     """Set update_status to 'Dev build' when running a dev build."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="dev")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     tray.check_updates()
     assert tray.update_status == "Dev build"  # nosec B101
 
 
-def test_check_updates_error_path(tray_module, monkeypatch):
+def test_check_updates_error_path(tray_module, tray, monkeypatch):
     """Set update_status to 'Unknown' when version fetch fails."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1254,9 +2102,8 @@ def test_check_updates_error_path(tray_module, monkeypatch):
     assert tray.update_status == "Unknown"  # nosec B101
 
 
-def test_check_updates_ahead_of_release(tray_module, monkeypatch):
+def test_check_updates_ahead_of_release(tray_module, tray, monkeypatch):
     """Set update_status to 'Ahead of release' when current > latest."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v0.4.2")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1269,9 +2116,8 @@ def test_check_updates_ahead_of_release(tray_module, monkeypatch):
     assert result is False  # nosec B101
 
 
-def test_check_updates_up_to_date(tray_module, monkeypatch):
+def test_check_updates_up_to_date(tray_module, tray, monkeypatch):
     """Set update_status to 'Up to date' when versions match."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1284,9 +2130,10 @@ def test_check_updates_up_to_date(tray_module, monkeypatch):
     assert result is False  # nosec B101
 
 
-def test_manual_check_updates_reports_up_to_date(tray_module, monkeypatch):
+def test_manual_check_updates_reports_up_to_date(
+    tray_module, tray, monkeypatch, notify_spy
+):
     """Notify user when already up to date."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "APP_VERSION", "v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1299,24 +2146,32 @@ def test_manual_check_updates_reports_up_to_date(tray_module, monkeypatch):
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
+    tray.manual_check_updates(None)
+    assert len(notify_spy) == 1  # nosec B101
+    assert "Update Check" in str(notify_spy[0])  # nosec B101
+
 
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
+def test_manual_check_updates_debounces_rapid_clicks(
+    tray_module, tray, monkeypatch
+):
+    """Collapse repeated clicks inside the cooldown into one check."""
+    checks = []
+
+    def record_check():
+        checks.append(True)
+        return True
 
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "check_updates", record_check)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    assert "Update Check" in str(notify_calls[0])  # nosec B101
+    tray.manual_check_updates(None)
+    assert len(checks) == 1  # nosec B101
 
 
 def test_manual_check_updates_reports_update_available(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, monkeypatch, notify_spy
 ):
     """Notify user when an update is available."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1329,24 +2184,19 @@ def test_manual_check_updates_reports_update_available(
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    msg = str(notify_calls[0])
+    assert len(notify_spy) == 1  # nosec B101
+    msg = str(notify_spy[0])
     assert "Update Available" in msg  # nosec B101
     assert "v2.0.0" in msg  # nosec B101
     assert "/releases" in msg  # nosec B101
 
 
-def test_manual_check_updates_reports_dev_build(tray_module, monkeypatch):
+def test_manual_check_updates_reports_dev_build(
+    tray_module, tray, monkeypatch, notify_spy
+):
     """Notify user when running a development build."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="dev")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1359,26 +2209,18 @@ def test_manual_check_updates_reports_dev_build(tray_module, monkeypatch):
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    msg = str(notify_calls[0])
+    assert len(notify_spy) == 1  # nosec B101
+    msg = str(notify_spy[0])
     assert "Update Check" in msg  # nosec B101
     assert "Dev build" in msg  # nosec B101
 
 
 def test_manual_check_updates_reports_error_with_details(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, monkeypatch, notify_spy
 ):
     """Notify user when update check fails with error details."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1391,26 +2233,18 @@ def test_manual_check_updates_reports_error_with_details(
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    msg = str(notify_calls[0])
+    assert len(notify_spy) == 1  # nosec B101
+    msg = str(notify_spy[0])
     assert "Update Check" in msg  # nosec B101
     assert "Unable to check for updates" in msg  # nosec B101
 
 
 def test_manual_check_updates_reports_ahead_of_release(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, monkeypatch, notify_spy
 ):
     """Notify user when running ahead of latest release."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v0.4.2")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1423,23 +2257,30 @@ def test_manual_check_updates_reports_ahead_of_release(
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    msg = str(notify_calls[0])
+    assert len(notify_spy) == 1  # nosec B101
+    msg = str(notify_spy[0])
     assert "Update Check" in msg  # nosec B101
     assert "Ahead of release" in msg  # nosec B101
 
 
-def test_update_check_helpers(tray_module):
+@pytest.mark.fast
+def test_build_update_check_message_is_memoized(tray_module):
+    """Reuse formatted messages for repeated argument tuples."""
+    build = getattr(tray_module, "_build_update_check_message")
+    build.cache_clear()
+    first = build("Up to date", "v1.0.0", None, "v1.0.0")
+    second = build("Up to date", "v1.0.0", None, "v1.0.0")
+    assert first == "You are up to date (v1.0.0)"  # nosec B101
+    assert second is first  # nosec B101
+    assert build.cache_info().hits == 1  # nosec B101
+    newer = build("Up to date", "v1.0.0", None, "v1.1.0")
+    assert newer == "You are up to date (v1.1.0)"  # nosec B101
+
+
+def test_update_check_helpers(tray_module, tray):
     """Cover update helper methods and timer callbacks."""
-    tray = _make_tray_instance(tray_module)
     tray.update_status = None
     assert tray.get_version_label().endswith("(Unknown)")  # nosec B101
     message = _call_member(
@@ -1478,9 +2319,42 @@ def test_update_check_helpers(tray_module):
     assert calls["count"] == 2  # nosec B101
 
 
-def test_check_updates_without_notify(tray_module, monkeypatch):
+def test_update_check_failures_back_off_exponentially(
+    tray_module, tray, monkeypatch
+):
+    """Schedule one retry per failure, doubling up to the cap."""
+    scheduled = []
+    monkeypatch.setattr(
+        tray_module.GLib,
+        "timeout_add_seconds",
+        lambda seconds, callback: scheduled.append((seconds, callback)),
+    )
+    outcomes = iter(["Unknown"] * 6 + ["Up to date"])
+
+    def fake_check():
+        tray.update_status = next(outcomes)
+        return False
+
+    tray.check_updates = fake_check
+
+    _call_member(tray, "_check_updates_tick")
+    _call_member(tray, "_check_updates_tick")
+    assert len(scheduled) == 1  # nosec B101
+
+    for _ in range(4):
+        _seconds, callback = scheduled[-1]
+        assert callback() is False  # nosec B101
+    delays = [seconds for seconds, _callback in scheduled]
+    assert delays == [300, 600, 1200, 2400, 3600]  # nosec B101
+
+    scheduled[-1][1]()
+    assert len(scheduled) == 5  # nosec B101
+    retry_delay = getattr(tray, "_update_retry_delay")
+    assert retry_delay == tray_module.UPDATE_RETRY_BASE_SECONDS  # nosec B101
+
+
+def test_check_updates_without_notify(tray_module, tray, monkeypatch):
     """Return False when update is available but notify is missing."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "APP_VERSION", "v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1493,11 +2367,9 @@ def test_check_updates_without_notify(tray_module, monkeypatch):
 
 
 def test_manual_check_updates_reports_error_without_details(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, monkeypatch, notify_spy
 ):
     """Notify user when update check fails without details."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     monkeypatch.setattr(tray_module, "DEFAULT_APP_VERSION", "dev")
     monkeypatch.setattr(
@@ -1510,16 +2382,10 @@ def test_manual_check_updates_reports_error_without_details(
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify_call(cmd):
-        """Record notify command calls."""
-        notify_calls.append(cmd)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify_call)
+    monkeypatch.setattr(tray, "_run_validated_command", notify_spy)
     tray.manual_check_updates(None)
-    assert len(notify_calls) == 1  # nosec B101
-    msg = str(notify_calls[0])
+    assert len(notify_spy) == 1  # nosec B101
+    msg = str(notify_spy[0])
     assert "Update Check" in msg  # nosec B101
     assert "Unable to check for updates" in msg  # nosec B101
 
@@ -1552,6 +2418,17 @@ def test_get_authors_parsing_handles_dashes_and_handles(
     assert authors == ["Jane Doe"]  # nosec B101
 
 
+def test_get_authors_skips_empty_entries(tray_module, tmp_path):
+    """Ignore bare list markers and keep plain names without handles."""
+    tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
+    (tmp_path / "AUTHORS").write_text(
+        "-\n- \n\n  - Solo Dev  \nNot a list item\n- Ann (@ann)\n",
+        encoding="utf-8",
+    )
+    authors = tray_module.get_authors()
+    assert authors == ["Solo Dev", "Ann"]  # nosec B101
+
+
 def test_get_authors_fallback_maintainer(tray_module, tmp_path, monkeypatch):
     """Fall back to APP_MAINTAINER when AUTHORS file is absent."""
     tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
@@ -1560,59 +2437,228 @@ def test_get_authors_fallback_maintainer(tray_module, tmp_path, monkeypatch):
     assert authors == ["TestMaintainer"]  # nosec B101
 
 
-def test_get_lms_cmd_prefers_lms_cli(tray_module, monkeypatch):
-    """Prefer bundled LMS_CLI path when executable."""
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-    assert tray_module.get_lms_cmd() == tray_module.LMS_CLI  # nosec B101
+@pytest.mark.parametrize(
+    "resolver, bundled, expected",
+    [
+        ("get_lms_cmd", True, None),
+        ("get_lms_cmd", False, "/usr/bin/lms"),
+        ("get_llmster_cmd", False, "/usr/bin/llmster"),
+    ],
+    ids=["lms_bundled", "lms_on_path", "llmster_on_path"],
+)
+def test_get_cmd_resolution(
+    tray_module, tray_handles, monkeypatch, resolver, bundled, expected
+):
+    """Prefer the bundled LMS_CLI when executable, else search PATH."""
+    monkeypatch.setattr(tray_handles.ospath, "isfile", lambda _p: bundled)
+    monkeypatch.setattr(tray_handles.os, "access", lambda _p, _m: True)
+    monkeypatch.setattr(
+        tray_handles.shutil, "which", lambda name: f"/usr/bin/{name}"
+    )
+    expected = expected or tray_module.LMS_CLI
+    assert getattr(tray_module, resolver)() == expected  # nosec B101
+
+
+def test_command_resolvers_cache_until_ttl(
+    tray_module, fake_clock, monkeypatch
+):
+    """Reuse a resolved command path until the resolver TTL elapses."""
+    fake_clock.set(50.0)
+    lookups = []
+    monkeypatch.setattr(
+        tray_module,
+        "_which",
+        lambda name: lookups.append(name) or f"/usr/bin/{name}",
+    )
+    assert tray_module.get_pgrep_cmd() == "/usr/bin/pgrep"  # nosec B101
+    fake_clock.advance(tray_module.PATH_RESOLVER_TTL - 1)
+    assert tray_module.get_pgrep_cmd() == "/usr/bin/pgrep"  # nosec B101
+    assert lookups == ["pgrep"]  # nosec B101
+    fake_clock.advance(1)
+    tray_module.get_pgrep_cmd()
+    assert lookups == ["pgrep", "pgrep"]  # nosec B101
+
+
+def test_command_resolvers_refresh_on_path_change(tray_module, monkeypatch):
+    """Re-resolve a cached command as soon as PATH changes."""
+    lookups = []
+    monkeypatch.setattr(
+        tray_module,
+        "_which",
+        lambda name: lookups.append(name) or f"/usr/bin/{name}",
+    )
+    monkeypatch.setenv("PATH", "/usr/bin")
+    tray_module.get_pgrep_cmd()
+    tray_module.get_pgrep_cmd()
+    assert lookups == ["pgrep"]  # nosec B101
+    monkeypatch.setenv("PATH", "/opt/bin:/usr/bin")
+    tray_module.get_pgrep_cmd()
+    assert lookups == ["pgrep", "pgrep"]  # nosec B101
+
+
+def test_which_cache_tracks_path_changes(
+    tray_module, tray_handles, monkeypatch, tmp_path
+):
+    """Reuse PATH lookups until PATH or one of its directories changes."""
+    lookups = []
+    monkeypatch.setattr(
+        tray_handles.shutil,
+        "which",
+        lambda name: lookups.append(name) or f"/bin/{name}",
+    )
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", str(bin_dir))
+    which = getattr(tray_module, "_which")
+
+    which("ps")
+    which("ps")
+    assert lookups == ["ps"]  # nosec B101
 
+    (bin_dir / "new-tool").write_text("", encoding="utf-8")
+    os.utime(bin_dir, ns=(0, 0))
+    which("ps")
+    assert lookups == ["ps", "ps"]  # nosec B101
 
-def test_get_lms_cmd_fallback_to_which(tray_module, monkeypatch):
-    """Resolve lms command from PATH when bundled binary is unavailable."""
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: False)
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: "/usr/bin/lms")
-    assert tray_module.get_lms_cmd() == "/usr/bin/lms"  # nosec B101
+    monkeypatch.setenv("PATH", str(tmp_path))
+    which("ps")
+    assert lookups == ["ps", "ps", "ps"]  # nosec B101
 
 
-def test_get_llmster_cmd_from_which(tray_module, monkeypatch):
-    """Return llmster executable found on PATH."""
+def test_desktop_status_reuses_lm_studio_lookup(
+    tray_module, tray, tray_handles, monkeypatch
+):
+    """Resolve ``lm-studio`` on PATH once across repeated status polls."""
+    lookups = []
     monkeypatch.setattr(
-        tray_module.shutil,
+        tray_handles.shutil,
         "which",
-        lambda _x: "/usr/bin/llmster",
+        lambda name: lookups.append(name) or f"/usr/bin/{name}",
     )
-    assert tray_module.get_llmster_cmd() == "/usr/bin/llmster"  # nosec B101
+    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_lms)
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
 
+    tray.get_desktop_app_status()
+    tray.get_desktop_app_status()
+    assert lookups.count("lm-studio") == 1  # nosec B101
 
-def test_get_llmster_cmd_from_directory_scan(tray_module, monkeypatch):
-    """Pick latest discovered llmster binary from install directories."""
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: None)
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "listdir", lambda _p: ["a", "b"])
 
-    def fake_isfile(path):
-        """Match synthetic llmster binary candidates."""
-        return path.endswith("/a/llmster") or path.endswith("/b/llmster")
+_DPKG_STATUS_TEXT = (
+    "Package: lm-studio-bench\nStatus: install ok installed\n\n"
+    "Package: lm-studio\nStatus: {status}\nVersion: 0.3.0\n"
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", False),
+        ("Package: other\nStatus: install ok installed\n", False),
+        (_DPKG_STATUS_TEXT.format(status="deinstall ok config-files"), False),
+        (_DPKG_STATUS_TEXT.format(status="install ok installed"), True),
+        (_DPKG_STATUS_TEXT.format(status="hold ok installed"), True),
+        ("Package: lm-studio\nStatus: install ok installed", True),
+        ("Package: lm-studio\nVersion: 0.3.0\n", False),
+    ],
+    ids=[
+        "empty", "absent", "removed", "installed", "held", "first-stanza",
+        "no-status",
+    ],
+)
+def test_dpkg_has_reads_status_database(
+    tray_module, tmp_path, monkeypatch, text, expected
+):
+    """Match only the exact package stanza marked installed."""
+    status = tmp_path / "status"
+    status.write_text(text, encoding="utf-8")
+    monkeypatch.setattr(tray_module, "DPKG_STATUS_PATH", str(status))
+    has = getattr(tray_module, "_dpkg_has")
+    assert has("lm-studio") is expected  # nosec B101
+
+
+def test_desktop_status_uses_dpkg_database(
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
+):
+    """Skip forking dpkg while its status database is readable."""
+    status = tmp_path / "status"
+    status.write_text(
+        "Package: lm-studio\nStatus: install ok installed\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(tray_module, "DPKG_STATUS_PATH", str(status))
+    tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
+    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
+    monkeypatch.setattr(
+        tray_handles.shutil, "which", lambda _x: "/usr/bin/lm-studio"
+    )
+    assert tray.get_desktop_app_status() == "stopped"  # nosec B101
+
+    status.write_text("", encoding="utf-8")
+    os.utime(status, ns=(0, 0))
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_lms)
+    assert tray.get_desktop_app_status() == "not_found"  # nosec B101
+
 
-    monkeypatch.setattr(tray_module.os.path, "isfile", fake_isfile)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-    assert tray_module.get_llmster_cmd().endswith("/b/llmster")  # nosec B101
+def test_get_lms_cmd_cache_invalidated_by_mtime(
+    tray_module, tray_handles, monkeypatch, tmp_path
+):
+    """Re-probe the bundled CLI as soon as its mtime changes."""
+    lms_cli = tmp_path / "lms"
+    monkeypatch.setattr(tray_module, "LMS_CLI", str(lms_cli))
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+    assert tray_module.get_lms_cmd() is None  # nosec B101
+
+    lms_cli.write_text("#!/bin/sh\n", encoding="utf-8")
+    lms_cli.chmod(0o755)
+    assert tray_module.get_lms_cmd() == str(lms_cli)  # nosec B101
+
+
+def _make_llmster_install(home, versions, executable=True):
+    """Create fake llmster binaries under ``home/.lmstudio/llmster``."""
+    root = home / ".lmstudio" / "llmster"
+    root.mkdir(parents=True)
+    for version in versions:
+        binary = root / version / "llmster"
+        binary.parent.mkdir()
+        binary.write_text("#!/bin/sh\n", encoding="utf-8")
+        binary.chmod(0o755 if executable else 0o644)
+    return root
+
+
+def test_get_llmster_cmd_from_directory_scan(
+    tray_module, tray_handles, monkeypatch, home
+):
+    """Pick latest discovered llmster binary from install directories."""
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+    root = _make_llmster_install(home, ["a", "b"])
+    (root / "c").mkdir()
+    (root / "notes.txt").write_text("", encoding="utf-8")
+    assert tray_module.get_llmster_cmd() == str(  # nosec B101
+        root / "b" / "llmster"
+    )
 
 
-def test_get_llmster_cmd_debug_logs(tray_module, monkeypatch, caplog):
+def test_get_llmster_cmd_debug_logs(
+    tray_module, tray_handles, monkeypatch, caplog
+):
     """Debug mode emits helpful information about llmster lookup."""
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: None)
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: False)
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+    monkeypatch.setattr(tray_handles.ospath, "isdir", lambda _p: False)
     caplog.set_level(logging.DEBUG)
     result = tray_module.get_llmster_cmd()
     assert result is None
     assert "No ~/.lmstudio/llmster directory present" in caplog.text
 
 
-def test_get_llmster_cmd_debug_no_repeat(tray_module, monkeypatch, caplog):
+def test_get_llmster_cmd_debug_no_repeat(
+    tray_module, tray_handles, monkeypatch, caplog
+):
     """Repeated calls do not log the same message again."""
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: None)
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: False)
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+    monkeypatch.setattr(tray_handles.ospath, "isdir", lambda _p: False)
     caplog.set_level(logging.DEBUG)
     tray_module.get_llmster_cmd()
     caplog.clear()
@@ -1620,106 +2666,356 @@ def test_get_llmster_cmd_debug_no_repeat(tray_module, monkeypatch, caplog):
     assert caplog.text == ""
 
 
-def test_is_llmster_running_true_first_check(tray_module, monkeypatch):
-    """Report running when first pgrep call succeeds."""
-    calls = []
-
-    def fake_run(args, **_kwargs):
-        """Track command usage and emulate successful process probe."""
-        calls.append(args)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray_module.subprocess, "run", fake_run)
+def test_is_llmster_running_uses_process_snapshot(
+    tray_module, fake_subprocess
+):
+    """Answer from the shared ps scan without forking pgrep."""
+    fake_subprocess.set_constant(
+        _completed(returncode=0, stdout="42 /opt/llmster/llmster serve\n")
+    )
     assert tray_module.is_llmster_running() is True  # nosec B101
-    assert calls[0][0].endswith("pgrep")  # nosec B101
-    assert calls[0][1:3] == ["-x", "llmster"]  # nosec B101
+    assert tray_module.get_desktop_app_pids() == []  # nosec B101
+    assert len(fake_subprocess.calls) == 1  # nosec B101
+    assert fake_subprocess.calls[0][0].endswith("ps")  # nosec B101
 
 
-def test_is_llmster_running_true_second_check(tray_module, monkeypatch):
-    """Report running when second fallback pgrep succeeds."""
-    sequence = [
-        _completed(returncode=1),
-        _completed(returncode=0),
+def test_process_lines_read_from_proc(
+    tray_module, fake_subprocess, monkeypatch, tmp_path
+):
+    """Build the process snapshot from /proc without forking ps."""
+    proc = tmp_path / "proc"
+    for pid, cmdline in (
+        ("42", b"/opt/llmster/llmster\0serve\0"),
+        ("77", b"/usr/bin/lm-studio\0"),
+        ("2", b""),
+    ):
+        (proc / pid).mkdir(parents=True)
+        (proc / pid / "cmdline").write_bytes(cmdline)
+    (proc / "self").mkdir()
+    (proc / "99").mkdir()
+    monkeypatch.setattr(tray_module, "PROC_ROOT", str(proc))
+
+    lines = _call_member(tray_module, "_read_proc_lines")
+    assert sorted(lines) == [  # nosec B101
+        "42 /opt/llmster/llmster serve",
+        "77 /usr/bin/lm-studio",
     ]
-
-    def fake_run(_args, **_kwargs):
-        """Return predetermined probe results."""
-        return sequence.pop(0)
-
-    monkeypatch.setattr(tray_module.subprocess, "run", fake_run)
     assert tray_module.is_llmster_running() is True  # nosec B101
+    assert tray_module.get_llmster_pids() == [42]  # nosec B101
+    assert tray_module.get_desktop_app_pids() == [77]  # nosec B101
+    assert not fake_subprocess.calls  # nosec B101
 
 
-def test_is_llmster_running_requires_absolute_pgrep(
-    tray_module, monkeypatch
+def test_check_model_watches_process_exits(
+    tray_module, tray, tray_handles, monkeypatch
 ):
-    """Return False when pgrep is not an absolute path."""
-    monkeypatch.setattr(tray_module, "get_pgrep_cmd", lambda: "pgrep")
-    assert tray_module.is_llmster_running() is False  # nosec B101
-
-
-def test_get_desktop_app_pids_parsing(tray_module, monkeypatch):
-    """Parse desktop app root process IDs from ps output."""
-    output = (
-        "123 /opt/LM Studio/lm-studio\n"
-        "234 lm-studio\n"
-        "345 /usr/bin/lm-studio --type=renderer\n"
+    """Watch running PIDs via pidfd and refresh when one exits."""
+    added = []
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            PRIORITY_DEFAULT=0,
+            IOCondition=SimpleNamespace(IN=1),
+            unix_fd_add_full=lambda *args: added.append(args),
+        )
     )
-
+    pidfds = iter((100, 101))
     monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
+        tray_handles.os,
+        "pidfd_open",
+        lambda _pid: next(pidfds),
+        raising=False,
     )
-    assert tray_module.get_desktop_app_pids() == [123, 234]  # nosec B101
+    closed = []
+    monkeypatch.setattr(tray_handles.os, "close", closed.append)
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [11])
+    monkeypatch.setattr(tray_module, "get_llmster_pids", lambda: [22])
 
+    _call_member(tray, "_watch_process_exits")
+    _call_member(tray, "_watch_process_exits")
+    assert [(a[1], a[4]) for a in added] == [  # nosec B101
+        (100, 11),
+        (101, 22),
+    ]
 
-def test_get_desktop_app_pids_appimage(tray_module, monkeypatch):
-    """Also detect LM Studio AppImage processes."""
-    output = (
-        "777 /home/user/Apps/LM-Studio-0.4.6.AppImage --no-sandbox\n"
-        "888 /home/user/Apps/Other.AppImage\n"
+    checks = []
+    monkeypatch.setattr(tray, "check_model", lambda: checks.append(True))
+    on_exit = added[0][3]
+    assert on_exit(100, 1, 11) is False  # nosec B101
+    assert closed == [100]  # nosec B101
+    assert checks == [True]  # nosec B101
+    assert vars(tray)["_pidfd_watches"] == {22: 101}  # nosec B101
+
+
+def _reap_child(_priority, pid, on_exit):
+    """Stand in for ``GLib.child_watch_add`` by reaping ``pid`` now."""
+    on_exit(pid, os.waitpid(pid, 0)[1])
+    return 8
+
+
+def test_check_model_probes_lms_ps_in_background(
+    tray_module, tray, monkeypatch, tmp_path
+):
+    """Run lms ps off the main loop and finish the check on EOF."""
+    lms = tmp_path / "lms"
+    lms.write_text("#!/bin/sh\necho 'qwen LOADED'\n", encoding="utf-8")
+    lms.chmod(0o755)
+    added = []
+    removed = []
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            PRIORITY_DEFAULT=0,
+            IOCondition=SimpleNamespace(IN=1, HUP=16),
+            unix_fd_add_full=lambda *args: added.append(args),
+            timeout_add_seconds=lambda *_args: 7,
+            source_remove=removed.append,
+            child_watch_add=_reap_child,
+        )
     )
+    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: str(lms))
+    checks = []
     monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
+        tray, "get_daemon_status", lambda: checks.append(1) or "running"
     )
-    assert tray_module.get_desktop_app_pids() == [777]  # nosec B101
+    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
+    monkeypatch.setattr(tray, "_watch_process_exits", lambda: None)
 
+    assert tray.check_model() is True  # nosec B101
+    assert tray.check_model() is True  # nosec B101
+    assert len(added) == 1  # nosec B101
+    assert not tray.indicator.icon_calls  # nosec B101
 
-def test_get_desktop_app_pids_excludes_bench_appimage(
+    _priority, fd, _condition, on_ready = added[0]
+    deadline = time.monotonic() + 10
+    while on_ready(fd, 1) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert removed == [7]  # nosec B101
+    assert tray.indicator.icon_calls[-1] == (  # nosec B101
+        tray_module.ICON_OK,
+        "Model loaded",
+    )
+    assert tray.last_status == "OK"  # nosec B101
+    assert len(checks) == 2  # nosec B101
+
+
+def test_check_model_drops_stale_lms_ps_result(
+    tray_module, tray, monkeypatch
+):
+    """Keep a newer status when an older lms ps probe finishes late."""
+    callbacks = []
+    monkeypatch.setattr(
+        tray_module,
+        "_run_safe_command_async",
+        lambda _cmd, callback: callbacks.append(callback) or True,
+    )
+    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
+    daemon = ["running"]
+    monkeypatch.setattr(tray, "get_daemon_status", lambda: daemon[0])
+    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
+    monkeypatch.setattr(tray, "_watch_process_exits", lambda: None)
+
+    tray.check_model()
+    daemon[0] = "stopped"
+    tray.check_model()
+    callbacks[0](_completed(returncode=0, stdout="qwen LOADED\n"))
+
+    assert tray.last_status == "WARN"  # nosec B101
+    assert not vars(tray)["_lms_ps_pending"]  # nosec B101
+
+
+def test_run_safe_command_async_reaps_via_child_watch(tray_module):
+    """Wait for a command that closed its output through a child watch."""
+    added = []
+    watched = []
+    removed = []
+
+    def child_watch_add(priority, pid, on_exit):
+        watched.append(pid)
+        return _reap_child(priority, pid, on_exit)
+
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            PRIORITY_DEFAULT=0,
+            IOCondition=SimpleNamespace(IN=1, HUP=16),
+            unix_fd_add_full=lambda *args: added.append(args),
+            timeout_add_seconds=lambda *_args: 7,
+            source_remove=removed.append,
+            child_watch_add=child_watch_add,
+        )
+    )
+    results = []
+    run_async = getattr(tray_module, "_run_safe_command_async")
+    command = [
+        sys.executable,
+        "-c",
+        "import os, sys, time; print('hi', flush=True); os.close(1); "
+        "time.sleep(0.5); sys.exit(3)",
+    ]
+
+    assert run_async(command, results.append) is True  # nosec B101
+    _priority, fd, _condition, on_ready = added[0]
+    deadline = time.monotonic() + 10
+    while on_ready(fd, 1) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(watched) == 1  # nosec B101
+    assert removed == [7]  # nosec B101
+    assert results[0].returncode == 3  # nosec B101
+    assert results[0].stdout == "hi\n"  # nosec B101
+
+
+def test_run_safe_command_async_kills_on_timeout(tray_module):
+    """Kill a hung command when its timer fires and report failure."""
+    timers = []
+    removed = []
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            PRIORITY_DEFAULT=0,
+            IOCondition=SimpleNamespace(IN=1, HUP=16),
+            unix_fd_add_full=lambda *_args: 9,
+            timeout_add_seconds=lambda _s, cb: timers.append(cb) or 7,
+            source_remove=removed.append,
+        )
+    )
+    results = []
+    run_async = getattr(tray_module, "_run_safe_command_async")
+    command = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+    assert run_async(command, results.append) is True  # nosec B101
+    assert timers[0]() is False  # nosec B101
+
+    assert removed == [9]  # nosec B101
+    assert results[0].returncode == -signal.SIGKILL  # nosec B101
+    assert results[0].stdout == ""  # nosec B101
+
+
+def test_run_safe_command_async_timeout_ignores_held_pipe(tray_module):
+    """Report failure on timeout although a grandchild keeps the pipe."""
+    timers = []
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            PRIORITY_DEFAULT=0,
+            IOCondition=SimpleNamespace(IN=1, HUP=16),
+            unix_fd_add_full=lambda *_args: 9,
+            timeout_add_seconds=lambda _s, cb: timers.append(cb) or 7,
+            source_remove=lambda _id: None,
+        )
+    )
+    results = []
+    run_async = getattr(tray_module, "_run_safe_command_async")
+    command = [
+        sys.executable,
+        "-c",
+        "import subprocess, sys; "
+        "subprocess.Popen([sys.executable, '-c', "
+        "'import time; time.sleep(2)'])",
+    ]
+
+    assert run_async(command, results.append) is True  # nosec B101
+    assert timers[0]() is False  # nosec B101
+    assert results[0].returncode != 0  # nosec B101
+
+
+def test_watch_process_exits_skips_vanished_pids(
+    tray_module, tray, tray_handles, monkeypatch
+):
+    """Ignore PIDs that exit before a pidfd can be opened."""
+    added = []
+    tray_module.sync_app_state_for_tests(
+        glib_mod=SimpleNamespace(
+            unix_fd_add_full=lambda *args: added.append(args),
+        )
+    )
+
+    def pidfd_open(_pid):
+        raise ProcessLookupError
+
+    monkeypatch.setattr(
+        tray_handles.os, "pidfd_open", pidfd_open, raising=False
+    )
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [11])
+    monkeypatch.setattr(tray_module, "get_llmster_pids", lambda: [])
+    _call_member(tray, "_watch_process_exits")
+    assert not added  # nosec B101
+
+
+def test_is_llmster_running_true_first_check(
+    tray_module, fake_subprocess, monkeypatch
+):
+    """Report running when first pgrep call succeeds."""
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: None)
+    fake_subprocess.set_constant(_RC0)
+    assert tray_module.is_llmster_running() is True  # nosec B101
+    calls = fake_subprocess.calls
+    assert calls[0][0].endswith("pgrep")  # nosec B101
+    assert calls[0][1:3] == ["-x", "llmster"]  # nosec B101
+
+
+def test_is_llmster_running_true_second_check(
+    tray_module, fake_subprocess, monkeypatch
+):
+    """Report running when second fallback pgrep succeeds."""
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: None)
+    fake_subprocess.set_sequence([_RC1, _RC0])
+    assert tray_module.is_llmster_running() is True  # nosec B101
+
+
+def test_is_llmster_running_requires_absolute_pgrep(
     tray_module, monkeypatch
+):
+    """Return False when pgrep is not an absolute path."""
+    monkeypatch.setattr(tray_module, "get_pgrep_cmd", lambda: "pgrep")
+    assert tray_module.is_llmster_running() is False  # nosec B101
+
+
+def test_get_desktop_app_pids_parsing(tray_module, fake_subprocess):
+    """Parse desktop app root process IDs from ps output."""
+    output = (
+        "123 /opt/LM Studio/lm-studio\n"
+        "234 lm-studio\n"
+        "345 /usr/bin/lm-studio --type=renderer\n"
+    )
+
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
+    assert tray_module.get_desktop_app_pids() == [123, 234]  # nosec B101
+
+
+def test_get_desktop_app_pids_appimage(tray_module, fake_subprocess):
+    """Also detect LM Studio AppImage processes."""
+    output = (
+        "777 /home/user/Apps/LM-Studio-0.4.6.AppImage --no-sandbox\n"
+        "888 /home/user/Apps/Other.AppImage\n"
+    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
+    assert tray_module.get_desktop_app_pids() == [777]  # nosec B101
+
+
+def test_get_desktop_app_pids_excludes_bench_appimage(
+    tray_module, fake_subprocess
 ):
     """Do not treat LM-Studio-Bench AppImage as desktop app."""
     output = (
         "777 /home/user/Apps/LM-Studio-Bench-x86_64.AppImage -w\n"
         "888 /home/user/Apps/LM-Studio-0.4.6.AppImage --no-sandbox\n"
     )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
-    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
     assert tray_module.get_desktop_app_pids() == [888]  # nosec B101
 
 
-def test_get_desktop_app_pids_extracted_appimage(tray_module, monkeypatch):
+def test_get_desktop_app_pids_extracted_appimage(tray_module, fake_subprocess):
     """Detect extracted AppImage mount processes."""
     output = (
         "999 /tmp/.mount_LM-StuvLaKuX/lm-studio --no-sandbox\n"
         "1000 /tmp/.mount_Other/other-app\n"
         "1001 /tmp/.mount_LM-Studio/lm-studio\n"
     )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
-    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
     assert tray_module.get_desktop_app_pids() == [999, 1001]  # nosec B101
 
 
-def test_get_desktop_app_pids_excludes_bench_mount(tray_module, monkeypatch):
+def test_get_desktop_app_pids_excludes_bench_mount(
+    tray_module, fake_subprocess
+):
     """Do not treat mounted LM-Studio-Bench processes as desktop app."""
     output = (
         "1030190 /tmp/.mount_LM-StuhafobM/usr/venv/bin/python "
@@ -1730,11 +3026,7 @@ def test_get_desktop_app_pids_excludes_bench_mount(tray_module, monkeypatch):
         "src/tray.py\n"
         "999 /tmp/.mount_LM-Studio/lm-studio --no-sandbox\n"
     )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
-    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
     # Only the real LM Studio mount should be detected, not Bench
     assert tray_module.get_desktop_app_pids() == [999]  # nosec B101
 
@@ -1745,7 +3037,7 @@ def test_get_desktop_app_pids_no_ps(tray_module, monkeypatch):
     assert tray_module.get_desktop_app_pids() == []  # nosec B101
 
 
-def test_get_desktop_app_pids_edge_cases(tray_module, monkeypatch):
+def test_get_desktop_app_pids_edge_cases(tray_module, fake_subprocess):
     """Ignore malformed, non-digit, and renderer entries."""
     output = (
         "abc /opt/LM Studio/lm-studio\n"
@@ -1754,16 +3046,23 @@ def test_get_desktop_app_pids_edge_cases(tray_module, monkeypatch):
         "789 lm-studio --flag\n"
         "101 /opt/LM Studio/lm-studio --type=utility\n"
     )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=output),
-    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout=output))
     assert tray_module.get_desktop_app_pids() == [789]  # nosec B101
 
 
+def test_get_desktop_app_pids_padded_rows(tray_module, fake_subprocess):
+    """Accept ps rows with right-aligned PIDs and trailing blanks."""
+    fake_subprocess.set_constant(
+        _completed(
+            returncode=0,
+            stdout="   42 /usr/bin/lm-studio   \n  43   \n",
+        )
+    )
+    assert tray_module.get_desktop_app_pids() == [42]  # nosec B101
+
+
 def test_get_desktop_app_pids_excludes_daemon_workers(
-    tray_module, monkeypatch
+    tray_module, tray_handles, monkeypatch
 ):
     """Exclude daemon worker processes.
 
@@ -1778,7 +3077,7 @@ def test_get_desktop_app_pids_excludes_daemon_workers(
         "liblmstudioworker\n"
     )
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
         lambda *_args, **_kwargs: _completed(
             returncode=0, stdout=output
@@ -1787,17 +3086,41 @@ def test_get_desktop_app_pids_excludes_daemon_workers(
     assert tray_module.get_desktop_app_pids() == [789]  # nosec B101
 
 
-def test_kill_existing_instances_ignores_current_pid(tray_module, monkeypatch):
+def test_process_snapshot_shared_between_helpers(
+    tray_module, tray_handles, monkeypatch
+):
+    """Run ps once per snapshot window for all process helpers."""
+    ps_calls = []
+
+    def fake_run(cmd, **_kwargs):
+        ps_calls.append(cmd)
+        return _completed(
+            returncode=0,
+            stdout="10 /usr/bin/lm-studio\n20 /opt/llmster/bin/llmster\n",
+        )
+
+    monkeypatch.setattr(tray_handles.subprocess, "run", fake_run)
+    monkeypatch.setattr(tray_module, "get_pgrep_cmd", lambda: None)
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: "/bin/ps")
+
+    assert tray_module.get_desktop_app_pids() == [10]  # nosec B101
+    assert tray_module.is_llmster_running() is True  # nosec B101
+    assert len(ps_calls) == 1  # nosec B101
+
+    _call_member(tray_module, "_invalidate_process_snapshot")
+    tray_module.get_desktop_app_pids()
+    assert len(ps_calls) == 2  # nosec B101
+
+
+def test_kill_existing_instances_ignores_current_pid(
+    tray_module, fake_subprocess, tray_handles, monkeypatch
+):
     """Terminate only stale tray process IDs."""
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout="10\n20\n"),
-    )
-    monkeypatch.setattr(tray_module.os, "getpid", lambda: 20)
+    fake_subprocess.set_constant(_completed(returncode=0, stdout="10\n20\n"))
+    monkeypatch.setattr(tray_handles.os, "getpid", lambda: 20)
     killed = []
     monkeypatch.setattr(
-        tray_module.os,
+        tray_handles.os,
         "kill",
         lambda pid, sig: killed.append((pid, sig)),
     )
@@ -1805,27 +3128,34 @@ def test_kill_existing_instances_ignores_current_pid(tray_module, monkeypatch):
     assert killed == [(10, signal.SIGTERM)]  # nosec B101
 
 
-def test_begin_action_cooldown(tray_module, monkeypatch):
+def test_begin_action_cooldown(tray_module, tray, fake_clock):
     """Throttle repeated actions within cooldown window."""
-    tray = _make_tray_instance(tray_module)
-    times = [100.0, 100.5, 103.0]
-    monkeypatch.setattr(tray_module.time, "monotonic", lambda: times.pop(0))
+    fake_clock.set(100.0)
     assert tray.begin_action_cooldown("x", seconds=2.0) is True  # nosec B101
+    fake_clock.set(100.5)
     assert tray.begin_action_cooldown("x", seconds=2.0) is False  # nosec B101
+    fake_clock.set(103.0)
     assert tray.begin_action_cooldown("x", seconds=2.0) is True  # nosec B101
 
 
-def test_get_status_indicator(tray_module):
+def test_begin_action_cooldown_is_shared_across_actions(
+    tray_module, tray, fake_clock
+):
+    """Block every action, not just the same one, during the cooldown."""
+    fake_clock.set(50.0)
+    assert tray.begin_action_cooldown("start_daemon") is True  # nosec B101
+    assert tray.begin_action_cooldown("stop_daemon") is False  # nosec B101
+
+
+def test_get_status_indicator(tray_module, tray):
     """Map status strings to indicator symbols."""
-    tray = _make_tray_instance(tray_module)
     assert tray.get_status_indicator("running") == "🟢"  # nosec B101
     assert tray.get_status_indicator("stopped") == "🟡"  # nosec B101
     assert tray.get_status_indicator("not_found") == "🔴"  # nosec B101
 
 
-def test_build_daemon_attempts_start_and_stop(tray_module, monkeypatch):
+def test_build_daemon_attempts_start_and_stop(tray_module, tray, monkeypatch):
     """Build expected daemon start and stop command variants."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
     monkeypatch.setattr(
         tray_module,
@@ -1838,17 +3168,18 @@ def test_build_daemon_attempts_start_and_stop(tray_module, monkeypatch):
     assert ["/usr/bin/llmster", "daemon", "down"] in stop  # nosec B101
 
 
-def test_run_daemon_attempts_stops_on_condition(tray_module, monkeypatch):
+def test_run_daemon_attempts_stops_on_condition(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Stop command iteration once stop condition is met."""
-    tray = _make_tray_instance(tray_module)
     called = []
 
     def fake_run(args, **_kwargs):
         """Collect called commands and emulate success."""
         called.append(args)
-        return _completed(returncode=0)
+        return _RC0
 
-    monkeypatch.setattr(tray_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(tray_handles.subprocess, "run", fake_run)
     result = _call_member(
         tray,
         "_run_daemon_attempts",
@@ -1859,14 +3190,42 @@ def test_run_daemon_attempts_stops_on_condition(tray_module, monkeypatch):
     assert len(called) == 1  # nosec B101
 
 
-def test_stop_llmster_best_effort_with_force(tray_module, monkeypatch):
+def test_run_daemon_attempts_rescans_after_command(
+    tray_module, tray, tray_handles, monkeypatch
+):
+    """Check the result of a daemon command against a fresh ps scan."""
+    started = []
+
+    def fake_run(cmd, **_kwargs):
+        if cmd[0] == "/bin/ps":
+            stdout = "20 /opt/llmster/bin/llmster\n" if started else ""
+            return _completed(returncode=0, stdout=stdout)
+        started.append(cmd)
+        return _RC0
+
+    monkeypatch.setattr(tray_handles.subprocess, "run", fake_run)
+    monkeypatch.setattr(tray_module, "get_pgrep_cmd", lambda: None)
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: "/bin/ps")
+
+    assert tray_module.is_llmster_running() is False  # nosec B101
+    _call_member(
+        tray,
+        "_run_daemon_attempts",
+        [["/usr/bin/lms", "daemon", "up"], ["/usr/bin/llmster", "start"]],
+        lambda current: (
+            current.returncode == 0 and tray_module.is_llmster_running()
+        ),
+    )
+    assert started == [["/usr/bin/lms", "daemon", "up"]]  # nosec B101
+
+
+def test_stop_llmster_best_effort_with_force(tray_module, tray, monkeypatch):
     """Force-stop llmster when graceful stop does not finish."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [["cmd"]])
     monkeypatch.setattr(
         tray,
         "_run_daemon_attempts",
-        lambda _a, _c: _completed(returncode=1),
+        lambda _a, _c: _RC1,
     )
     force_stop_called = []
 
@@ -1882,35 +3241,36 @@ def test_stop_llmster_best_effort_with_force(tray_module, monkeypatch):
     assert len(force_stop_called) == 1
 
 
-def test_stop_desktop_app_processes_success(tray_module, monkeypatch):
+def test_stop_desktop_app_processes_success(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
     """Stop desktop app processes using SIGTERM path."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [11, 12])
-    statuses = ["running", "stopped", "stopped", "stopped"]
+    statuses = collections.deque(["running", "stopped", "stopped", "stopped"])
     monkeypatch.setattr(
         tray,
         "get_desktop_app_status",
-        lambda: statuses.pop(0),
+        statuses.popleft,
     )
     killed = []
     monkeypatch.setattr(
-        tray_module.os,
+        tray_handles.os,
         "kill",
         lambda pid, sig: killed.append((pid, sig)),
     )
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _x: None)
     result = _call_member(tray, "_stop_desktop_app_processes")
     assert result is True  # nosec B101
     assert (11, signal.SIGTERM) in killed  # nosec B101
 
 
-def test_stop_desktop_app_processes_force_kill(tray_module, monkeypatch):
+def test_stop_desktop_app_processes_force_kill(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
     """Force-stop desktop app when it ignores SIGTERM."""
-    tray = _make_tray_instance(tray_module)
-    pid_batches = [[11], [22]]
+    pid_batches = collections.deque([[11], [22]])
 
     def next_pids():
-        return pid_batches.pop(0) if pid_batches else []
+        return pid_batches.popleft() if pid_batches else []
 
     calls = {"count": 0}
 
@@ -1920,10 +3280,9 @@ def test_stop_desktop_app_processes_force_kill(tray_module, monkeypatch):
 
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", next_pids)
     monkeypatch.setattr(tray, "get_desktop_app_status", next_status)
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _x: None)
     killed = []
     monkeypatch.setattr(
-        tray_module.os,
+        tray_handles.os,
         "kill",
         lambda pid, sig: killed.append((pid, sig)),
     )
@@ -1933,29 +3292,146 @@ def test_stop_desktop_app_processes_force_kill(tray_module, monkeypatch):
     assert (22, 9) in killed  # nosec B101
 
 
-def test_start_daemon_missing_binaries_notifies(tray_module, monkeypatch):
+def test_stop_desktop_app_processes_backs_off(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
+    """Poll with growing delays capped near two seconds before SIGKILL."""
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [11])
+    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
+    monkeypatch.setattr(tray_handles.os, "kill", lambda _pid, _sig: None)
+
+    result = _call_member(tray, "_stop_desktop_app_processes")
+    assert result is False  # nosec B101
+    delays = list(tray_module.STOP_POLL_DELAYS)
+    assert fake_clock.sleeps == delays * 2  # nosec B101
+    assert delays == sorted(delays)  # nosec B101
+    assert sum(delays) == pytest.approx(2.0)  # nosec B101
+
+
+def test_stop_desktop_app_processes_rescans_each_poll(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
+    """Notice an exit at the first poll after it, not when scans expire."""
+
+    def read_proc_lines():
+        return ["11 /usr/bin/lm-studio"] if fake_clock.now < 0.04 else []
+
+    monkeypatch.setattr(tray_module, "_read_proc_lines", read_proc_lines)
+    monkeypatch.setattr(
+        tray_module, "_wait_for_pids_exit", lambda _pids, _timeout: None
+    )
+    monkeypatch.setattr(
+        tray,
+        "get_desktop_app_status",
+        lambda: (
+            "running" if tray_module.get_desktop_app_pids() else "stopped"
+        ),
+    )
+    monkeypatch.setattr(tray_handles.os, "kill", lambda _pid, _sig: None)
+
+    assert _call_member(tray, "_stop_desktop_app_processes")  # nosec B101
+    assert fake_clock.sleeps == [  # nosec B101
+        tray_module.STOP_POLL_DELAYS[0]
+    ]
+
+
+def test_stop_desktop_app_processes_waits_on_pidfds(
+    tray_module, tray, tray_handles, monkeypatch
+):
+    """Check the status once after pidfds report the processes exited."""
+    waits = []
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [11])
+    monkeypatch.setattr(
+        tray_module,
+        "_wait_for_pids_exit",
+        lambda pids, timeout: waits.append((list(pids), timeout)) or True,
+    )
+    statuses = ["stopped"]
+    monkeypatch.setattr(tray, "get_desktop_app_status", statuses.pop)
+    monkeypatch.setattr(tray_handles.os, "kill", lambda _pid, _sig: None)
+
+    assert _call_member(tray, "_stop_desktop_app_processes")  # nosec B101
+    assert waits == [([11], tray_module.STOP_WAIT_SECONDS)]  # nosec B101
+    assert not statuses  # nosec B101
+
+
+def test_stop_desktop_app_processes_pidfd_timeout_escalates(
+    tray_module, tray, tray_handles, monkeypatch
+):
+    """Escalate to SIGKILL right after a pidfd wait times out."""
+    pid_batches = collections.deque([[11], [22]])
+    monkeypatch.setattr(
+        tray_module, "get_desktop_app_pids", pid_batches.popleft
+    )
+    outcomes = [True, False]
+    waits = []
+    monkeypatch.setattr(
+        tray_module,
+        "_wait_for_pids_exit",
+        lambda pids, _timeout: waits.append(list(pids)) or outcomes.pop(),
+    )
+    statuses = ["stopped", "running"]
+    monkeypatch.setattr(tray, "get_desktop_app_status", statuses.pop)
+    killed = []
+    monkeypatch.setattr(
+        tray_handles.os, "kill", lambda pid, sig: killed.append((pid, sig))
+    )
+    monkeypatch.setattr(tray_module.time, "sleep", pytest.fail)
+
+    assert _call_member(tray, "_stop_desktop_app_processes")  # nosec B101
+    assert waits == [[11], [22]]  # nosec B101
+    assert killed == [  # nosec B101
+        (11, signal.SIGTERM),
+        (22, signal.SIGKILL),
+    ]
+
+
+@pytest.mark.skipif(_PIDFD_OPEN is None, reason="pidfd_open unavailable")
+def test_wait_for_pids_exit_uses_pidfds(tray_module, monkeypatch):
+    """Return True once real processes exit and False on timeout."""
+    monkeypatch.setattr(os, "pidfd_open", _PIDFD_OPEN, raising=False)
+    wait = getattr(tray_module, "_wait_for_pids_exit")
+    with subprocess.Popen(  # nosec B603
+        [sys.executable, "-c", "import time; time.sleep(30)"]
+    ) as child:
+        assert wait([child.pid], 0.05) is False  # nosec B101
+        child.kill()
+        assert wait([child.pid], 5) is True  # nosec B101
+        child.wait()
+    assert wait([child.pid], 0.05) is True  # nosec B101
+
+
+def test_wait_for_pids_exit_falls_back_without_pidfd(tray_module, monkeypatch):
+    """Report None so callers poll when pidfds cannot be used."""
+    wait = getattr(tray_module, "_wait_for_pids_exit")
+    assert wait([11], 1) is None  # nosec B101
+
+    def deny(_pid):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(os, "pidfd_open", deny, raising=False)
+    assert wait([11], 1) is None  # nosec B101
+    assert wait([], 1) is None  # nosec B101
+
+
+def test_start_daemon_missing_binaries_notifies(
+    tray_module, fake_subprocess, action_tray, monkeypatch
+):
     """Notify user when daemon binaries are unavailable."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [])
     monkeypatch.setattr(
         tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
     )
-    calls = []
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda args, **_kwargs: calls.append(args) or _completed(returncode=0),
-    )
+    fake_subprocess.set_constant(_RC0)
     tray.start_daemon(None)
-    assert any("notify-send" in str(c) for c in calls)  # nosec B101
+    assert "notify-send" in fake_subprocess.programs  # nosec B101
 
 
-def test_start_daemon_success_path(tray_module, monkeypatch):
+def test_start_daemon_success_path(tray_module, action_tray, monkeypatch):
     """Notify user when daemon start succeeds."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     monkeypatch.setattr(
         tray,
@@ -1965,7 +3441,7 @@ def test_start_daemon_success_path(tray_module, monkeypatch):
     monkeypatch.setattr(
         tray,
         "_run_daemon_attempts",
-        lambda _a, _b: _completed(returncode=0),
+        lambda _a, _b: _RC0,
     )
     monkeypatch.setattr(tray_module, "is_llmster_running", lambda: True)
     monkeypatch.setattr(
@@ -1973,26 +3449,17 @@ def test_start_daemon_success_path(tray_module, monkeypatch):
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify(cmd):
-        notify_calls.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
+    notify_calls = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notify_calls)
     tray.start_daemon(None)
     assert notify_calls  # nosec B101
 
 
-def test_stop_daemon_success_path(tray_module, monkeypatch):
+def test_stop_daemon_success_path(
+    tray_module, fake_subprocess, action_tray, monkeypatch
+):
     """Notify user when daemon stop succeeds."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(
         tray,
         "_build_daemon_attempts",
@@ -2001,30 +3468,19 @@ def test_stop_daemon_success_path(tray_module, monkeypatch):
     monkeypatch.setattr(
         tray,
         "_stop_llmster_best_effort",
-        lambda: (True, _completed(returncode=0)),
-    )
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
+        lambda: (True, _RC0),
     )
     monkeypatch.setattr(
         tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
     )
-    calls = []
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda args, **_kwargs: calls.append(args) or _completed(returncode=0),
-    )
+    fake_subprocess.set_constant(_RC0)
     tray.stop_daemon(None)
-    assert any("notify-send" in str(c) for c in calls)  # nosec B101
+    assert "notify-send" in fake_subprocess.programs  # nosec B101
 
 
-def test_stop_daemon_failure_detail(tray_module, monkeypatch):
+def test_stop_daemon_failure_detail(tray_module, action_tray, monkeypatch):
     """Include stderr detail when daemon stop fails."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(
         tray,
         "_build_daemon_attempts",
@@ -2040,18 +3496,8 @@ def test_stop_daemon_failure_detail(tray_module, monkeypatch):
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    notify_calls = []
-
-    def capture_notify(cmd):
-        notify_calls.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
+    notify_calls = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notify_calls)
     tray.stop_daemon(None)
     assert notify_calls  # nosec B101
 
@@ -2065,32 +3511,22 @@ def test_ensure_gsettings_schema(_tmp_path, monkeypatch, tray_module):
     assert os.environ["GSETTINGS_SCHEMA_DIR"].endswith("glib-2.0/schemas")
 
 
-def test_start_desktop_app_missing_lms(tray_module, monkeypatch):
+def test_start_desktop_app_missing_lms(
+    tray_module, fake_subprocess, start_desktop_tray, monkeypatch
+):
     """Notify user when lms CLI is missing."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: None)
-    monkeypatch.setattr(
-        tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
-    )
-    calls = []
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda args, **_kwargs: calls.append(args) or _completed(returncode=0),
-    )
+    tray = start_desktop_tray
+    configure_start_desktop(monkeypatch, tray_module, tray, lms_cmd=None)
+    fake_subprocess.set_constant(_RC0)
     tray.start_desktop_app(None)
-    assert any("notify-send" in str(c) for c in calls)  # nosec B101
+    assert "notify-send" in fake_subprocess.programs  # nosec B101
 
 
 def test_start_desktop_app_force_stops_daemon_before_launch(
-    tray_module,
-    monkeypatch,
+    tray_module, start_desktop_tray, tray_handles, fake_clock, monkeypatch
 ):
     """Force-stop daemon when graceful stop path does not stop it."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
+    tray = start_desktop_tray
 
     daemon_state = {"running": True}
 
@@ -2111,44 +3547,15 @@ def test_start_desktop_app_force_stops_daemon_before_launch(
         daemon_state["running"] = False
 
     monkeypatch.setattr(tray, "_force_stop_llmster", force_stop)
+    _stub_deb_install(monkeypatch, tray_module)
 
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
-        "which",
-        lambda _x: "/usr/bin/lm-studio",
-    )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-    monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda p: p == "/usr/bin",
-    )
-
-    spawn_calls = []
-
-    def mock_spawnv(mode, path, args):
-        spawn_calls.append((mode, path, args))
-        return 12345
-
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
+    spawn_calls = DummySpawnRecorder()
+    monkeypatch.setattr(tray_handles.os, "spawnv", spawn_calls)
     monkeypatch.setattr(
         tray,
         "_run_validated_command",
-        lambda _cmd: _completed(returncode=0),
+        lambda _cmd: _RC0,
     )
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _t: None)
 
     tray.start_desktop_app(None)
 
@@ -2158,250 +3565,120 @@ def test_start_desktop_app_force_stops_daemon_before_launch(
 
 
 def test_start_desktop_app_appimage_found_and_started(
-    tray_module,
-    monkeypatch,
-    tmp_path,
+    tray_module, start_desktop_tray, tray_handles, monkeypatch, home
 ):
     """Launch desktop app when AppImage is discovered."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
+    tray = start_desktop_tray
 
-    app_dir = tmp_path / "Apps"
+    app_dir = home / "Apps"
     app_dir.mkdir()
     app_file = app_dir / "LM-Studio.AppImage"
     app_file.write_text("bin", encoding="utf-8")
     app_file.chmod(0o755)
 
-    monkeypatch.setattr(tray_module.sys, "argv", ["x", "model", str(app_dir)])
+    tray_module.sync_app_state_for_tests(script_dir_val=str(app_dir))
 
     def fake_run(args, **_kwargs):
         """Return dpkg miss and generic success for other commands."""
         if args[:2] == ["dpkg", "-l"]:
-            return _completed(returncode=0, stdout="")
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray_module.subprocess, "run", fake_run)
+            return _RC0
+        return _RC0
 
-    spawn_calls = []
+    monkeypatch.setattr(tray_handles.subprocess, "run", fake_run)
 
-    def mock_spawnv(mode, path, args):
-        spawn_calls.append((mode, path, args))
-        return 123
-
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
+    spawn_calls = DummySpawnRecorder(pid=123)
+    monkeypatch.setattr(tray_handles.os, "spawnv", spawn_calls)
 
     tray.start_desktop_app(None)
-    assert spawn_calls, "expected spawnv to be invoked"
-    assert any(
-        "--no-sandbox" in arg
-        for _mode, _path, call in spawn_calls
-        for arg in call
-    )
+    expected = str(app_file)
+    assert spawn_calls == [  # nosec B101
+        (tray_handles.os.P_NOWAIT, expected, [expected, "--no-sandbox"])
+    ]
 
 
 def test_start_desktop_app_prefers_lmstudio_appimage(
-    tray_module,
-    monkeypatch,
-    tmp_path,
+    tray_module, start_desktop_tray, tray_handles, monkeypatch, home
 ):
     """When multiple AppImages exist, the one named LM-Studio is started."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
+    tray = start_desktop_tray
 
-    app_dir = tmp_path / "Apps"
-    app_dir.mkdir()
-    (app_dir / "Other.AppImage").write_text("x")
-    (app_dir / "LM-Studio-1.0.AppImage").write_text("x")
-    for f in app_dir.iterdir():
-        f.chmod(0o755)
+    app_dir = home / "Apps"
+    _stub_executables(monkeypatch, tray_module)
 
-    monkeypatch.setattr(tray_module.sys, "argv", ["x", "model", str(app_dir)])
+    tray_module.sync_app_state_for_tests(script_dir_val=str(app_dir))
 
     def fake_run(args, **_kwargs):
         if args[:2] == ["dpkg", "-l"]:
-            return _completed(returncode=0, stdout="")
-        return _completed(returncode=0)
+            return _RC0
+        return _RC0
 
-    monkeypatch.setattr(tray_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(tray_handles.subprocess, "run", fake_run)
 
-    spawn_calls = []
-
-    def mock_spawnv(mode, path, args):
-        spawn_calls.append((mode, path, args))
-        return 123
-
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-    monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda p: p == str(app_dir),
-    )
+    spawn_calls = DummySpawnRecorder(pid=123)
+    monkeypatch.setattr(tray_handles.os, "spawnv", spawn_calls)
+    os.makedirs(app_dir)
     monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _p: ["Other.AppImage", "LM-Studio-1.0.AppImage"],
-    )
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
+        tray_handles.os,
+        "scandir",
+        _fake_scandir("Other.AppImage", "LM-Studio-1.0.AppImage"),
     )
 
     tray.start_desktop_app(None)
-    assert any(
-        "lm-studio" in arg.lower()
-        for _mode, _path, call in spawn_calls
-        for arg in call
-    )
-    assert not any(
-        "other" in arg.lower()
-        for _mode, _path, call in spawn_calls
-        for arg in call
-    )
-    assert any("--no-sandbox" in call for _mode, _path, call in spawn_calls)
+    expected = str(app_dir / "LM-Studio-1.0.AppImage")
+    assert spawn_calls == [  # nosec B101
+        (tray_handles.os.P_NOWAIT, expected, [expected, "--no-sandbox"])
+    ]
 
 
 def test_start_desktop_app_deb_path_appimage(
-    tmp_path, tray_module, monkeypatch
+    tray_module, start_desktop_tray, tray_handles, monkeypatch, home
 ):
     """Test launching desktop app via AppImage in deb path scenario."""
-    tray = _make_tray_instance(tray_module)
-    app_dir = tmp_path / "Apps"
-    app_dir.mkdir()
-    spawn_calls = []
-
-    def mock_spawnv(mode, path, args):
-        spawn_calls.append((mode, path, args))
-        return 12345
-
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
+    tray = start_desktop_tray
+    app_dir = home / "Apps"
+    _stub_executables(monkeypatch, tray_module)
+    spawn_calls = DummySpawnRecorder()
+    monkeypatch.setattr(tray_handles.os, "spawnv", spawn_calls)
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
+    tray_module.sync_app_state_for_tests(script_dir_val=str(app_dir))
 
+    os.makedirs(app_dir)
     monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda _unused_p: _unused_p == str(app_dir),
-    )
-    monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _unused_p: ["LM-Studio.AppImage"],
-    )
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *args, **_kwargs: True,
+        tray_handles.os,
+        "scandir",
+        _fake_scandir("LM-Studio.AppImage"),
     )
 
-    dummy_app = app_dir / "LM-Studio.AppImage"
-    dummy_app.write_text("", encoding="utf-8")
-    dummy_app.chmod(0o755)
-
     tray.start_desktop_app(None)
-    assert spawn_calls  # nosec B101
-    assert any(
-        "--no-sandbox" in arg
-        for _mode, _path, call in spawn_calls
-        for arg in call
-    )
+    expected = str(app_dir / "LM-Studio.AppImage")
+    assert spawn_calls == [  # nosec B101
+        (tray_handles.os.P_NOWAIT, expected, [expected, "--no-sandbox"])
+    ]
 
 
-def test_start_desktop_app_deb_path(tray_module, monkeypatch):
+def test_start_desktop_app_deb_path(
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
+):
     """Launch desktop app via installed .deb package."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
-        "which",
-        lambda _x: "/usr/bin/lm-studio",
-    )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
+    tray = start_desktop_tray
+    _stub_deb_install(monkeypatch, tray_module)
+    spawn_calls = DummySpawnRecorder()
+    monkeypatch.setattr(tray_handles.os, "spawnv", spawn_calls)
 
-    def is_safe_dir(path):
-        return path == "/usr/bin"
-
-    monkeypatch.setattr(tray_module.os.path, "isdir", is_safe_dir)
-    spawn_calls = []
-
-    def mock_spawnv(mode, path, args):
-        spawn_calls.append((mode, path, args))
-        return 12345
-
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     tray.start_desktop_app(None)
     assert len(notifications) > 0  # nosec B101
     assert spawn_calls  # nosec B101
 
 
-def test_start_desktop_app_spawnv_args(tray_module, monkeypatch):
+def test_start_desktop_app_spawnv_args(
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
+):
     """Test spawnv is called with P_NOWAIT, path, and command list."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
-        "which",
-        lambda _x: "/usr/bin/lm-studio",
-    )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-
-    def is_safe_dir(path):
-        return path == "/usr/bin"
-
-    monkeypatch.setattr(tray_module.os.path, "isdir", is_safe_dir)
+    tray = start_desktop_tray
+    _stub_deb_install(monkeypatch, tray_module)
     captured_call = {}
 
     def mock_spawnv(mode, path, args):
@@ -2414,63 +3691,30 @@ def test_start_desktop_app_spawnv_args(tray_module, monkeypatch):
         )
         return 12345
 
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
+    monkeypatch.setattr(tray_handles.os, "spawnv", mock_spawnv)
 
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     tray.start_desktop_app(None)
-    assert captured_call.get("mode") == tray_module.os.P_NOWAIT  # nosec B101
+    assert captured_call.get("mode") == tray_handles.os.P_NOWAIT  # nosec B101
     assert captured_call.get("path") == "/usr/bin/lm-studio"  # nosec B101
     assert captured_call.get("args") == ["/usr/bin/lm-studio"]  # nosec B101
 
 
-def test_start_desktop_app_spawnv_oserror(tray_module, monkeypatch):
+def test_start_desktop_app_spawnv_oserror(
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
+):
     """Test OSError handling when spawnv fails to launch the app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
-        "which",
-        lambda _x: "/usr/bin/lm-studio",
-    )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-
-    def is_safe_dir(path):
-        return path == "/usr/bin"
-
-    monkeypatch.setattr(tray_module.os.path, "isdir", is_safe_dir)
+    tray = start_desktop_tray
+    _stub_deb_install(monkeypatch, tray_module)
 
     def mock_spawnv(*_a, **_k):
         raise OSError("Permission denied")
 
-    monkeypatch.setattr(tray_module.os, "spawnv", mock_spawnv)
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    monkeypatch.setattr(tray_handles.os, "spawnv", mock_spawnv)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
     tray.start_desktop_app(None)
     assert any(  # nosec B101
         "Error" in str(n) for n in notifications
@@ -2478,83 +3722,75 @@ def test_start_desktop_app_spawnv_oserror(tray_module, monkeypatch):
 
 
 def test_start_desktop_app_unsafe_path_error(
-    tray_module, monkeypatch, tmp_path
+    tray_module, start_desktop_tray, tray_handles, monkeypatch, tmp_path
 ):
     """Test that an AppImage in an unsafe location triggers an error."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: None)
+    tray = start_desktop_tray
+    configure_start_desktop(monkeypatch, tray_module, tray, dpkg_cmd=None)
     unsafe_dir = str(tmp_path / "lmstudio-test-unsafe")
     tray_module.sync_app_state_for_tests(script_dir_val=unsafe_dir)
     monkeypatch.setattr(
-        tray_module.os.path, "isdir", lambda p: p == unsafe_dir
+        tray_handles.ospath, "isdir", lambda p: p == unsafe_dir
     )
     monkeypatch.setattr(
-        tray_module.os, "listdir", lambda _p: ["LM-Studio.AppImage"]
+        tray_handles.os, "scandir", _fake_scandir("LM-Studio.AppImage")
     )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
+    _stub_executables(monkeypatch, tray_module)
     monkeypatch.setattr(
-        tray_module.shutil, "which", lambda _x: None
+        tray_handles.shutil, "which", lambda _x: None
     )
 
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
     tray.start_desktop_app(None)
     assert any(  # nosec B101
         "Error" in str(n) for n in notifications
     )
 
 
-def test_stop_desktop_app_no_process_path(tray_module, monkeypatch):
+def test_stop_desktop_app_no_process_path(
+    tray_module, action_tray, monkeypatch
+):
     """Handle desktop stop request when no process is running."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
     tray.stop_desktop_app(None)
 
 
-def test_show_status_dialog_success(tray_module, monkeypatch):
+def test_show_status_dialog_success(
+    tray_module, fake_subprocess, tray, monkeypatch
+):
     """Render status dialog with lms output."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout="modelA"),
-    )
+    fake_subprocess.set_constant(_completed(returncode=0, stdout="modelA"))
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert dialog.text == "LM Studio Status"  # nosec B101
     assert "modelA" in dialog.secondary  # nosec B101
     assert dialog.ran is True  # nosec B101
     assert dialog.destroyed is True  # nosec B101
 
 
-def test_show_about_dialog_contains_version_and_repo(tray_module, monkeypatch):
+@pytest.fixture(name="about_ctx")
+def about_ctx_fixture(tray_module, tray):
+    """Provide a tray and the shared GdkPixbuf stub wired into app state.
+
+    The stub is stateless; per-test loader overrides go through
+    ``monkeypatch`` and are undone on teardown.
+    """
+    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=_GDK_PIXBUF_STUB)
+    return tray, _GDK_PIXBUF_STUB
+
+
+def test_show_about_dialog_contains_version_and_repo(
+    tray_module, about_ctx, monkeypatch
+):
     """
     Show about dialog includes version, repo link, documentation link,
     and version info.
     """
-    tray = _make_tray_instance(tray_module)
+    tray, _gdk_mod = about_ctx
     tray_module.sync_app_state_for_tests(app_version_val="v2.0.0")
     monkeypatch.setattr(tray_module, "APP_MAINTAINER", "TestMaintainer")
     monkeypatch.setattr(
@@ -2574,7 +3810,7 @@ def test_show_about_dialog_contains_version_and_repo(tray_module, monkeypatch):
     )
     tray.update_status = "Up to date"
     tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
+    dialog = _last_dialog(DummyAboutDialog)
     assert dialog.version == "v2.0.0 (Up to date)"  # nosec B101
     assert dialog.authors == ["TestMaintainer"]  # nosec B101
     assert dialog.website == "https://github.com/test/repo"  # nosec B101
@@ -2591,222 +3827,172 @@ def test_show_about_dialog_contains_version_and_repo(tray_module, monkeypatch):
     assert dialog.destroyed  # nosec B101
 
 
-def test_show_about_dialog_release_link(tray_module, monkeypatch):
+def test_show_about_dialog_release_link(tray_module, about_ctx, monkeypatch):
     """Website button should point to release when update pending."""
-    tray = _make_tray_instance(tray_module)
+    tray, _gdk_mod = about_ctx
     tray_module.sync_app_state_for_tests(app_version_val="v1.0.0")
     repo_url = "https://github.com/foo/bar"
     docs_url = "https://docs.foo/bar"
     monkeypatch.setattr(tray_module, "APP_REPOSITORY", repo_url)
     monkeypatch.setattr(tray_module, "APP_DOCUMENTATION", docs_url)
-    monkeypatch.setattr(tray_module, "get_authors", lambda: ["Me"])
-    tray.update_status = "Update available"
-    tray.latest_update_version = "v1.2.3"
-
-    tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    expected_url = f"{repo_url}/releases/tag/v1.2.3"
-    assert dialog.website == expected_url  # nosec B101
-    assert dialog.website_label == "Release"  # nosec B101
-    expected_comments = (
-        "Monitors and controls "
-        "LM Studio daemon "
-        "and desktop app."
-    )
-    assert dialog.comments == expected_comments  # nosec B101
-    assert (
-        '<a href="https://docs.foo/bar">Documentation</a>'
-        in dialog.added_labels
-    )  # nosec B101
-    assert dialog.ran  # nosec B101
-    assert dialog.destroyed  # nosec B101
-
-
-def test_show_about_dialog_includes_copyright(tray_module, monkeypatch):
-    """About dialog should display 2025–2026 copyright."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray_module, "APP_MAINTAINER", "FooCorp")
-    tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    assert "2025-2026" in dialog.copyright  # nosec B101
-
-
-def test_show_about_dialog_sets_logo(tray_module, monkeypatch, tmp_path):
-    """Load the SVG logo when GdkPixbuf is available."""
-    tray = _make_tray_instance(tray_module)
-    gdk_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=gdk_mod)
-
-    fake_logo = object()
-    monkeypatch.setattr(
-        gdk_mod.Pixbuf,
-        "new_from_file_at_scale",
-        lambda *_a, **_k: fake_logo,
-    )
-    logo_file = tmp_path / "logo.svg"
-    monkeypatch.setattr(
-        tray_module,
-        "get_asset_path",
-        lambda *_a, **_k: str(logo_file),
-    )
-
-    tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    assert dialog.logo is fake_logo  # nosec B101
-
-
-def test_show_about_dialog_logo_error(tray_module, monkeypatch, tmp_path):
-    """Ignore logo loading errors and still show dialog."""
-    tray = _make_tray_instance(tray_module)
-    gdk_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=gdk_mod)
-
-    def _raise_error(*_a, **_k):
-        raise tray_module.GLib.Error("boom")
-
-    monkeypatch.setattr(
-        gdk_mod.Pixbuf,
-        "new_from_file_at_scale",
-        _raise_error,
-    )
-    logo_file = tmp_path / "logo.svg"
-    monkeypatch.setattr(
-        tray_module,
-        "get_asset_path",
-        lambda *_a, **_k: str(logo_file),
-    )
+    monkeypatch.setattr(tray_module, "get_authors", lambda: ["Me"])
+    tray.update_status = "Update available"
+    tray.latest_update_version = "v1.2.3"
 
     tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    assert dialog.ran is True  # nosec B101
-    assert dialog.destroyed is True  # nosec B101
-
-
-def test_show_about_dialog_png_fallback(tray_module, monkeypatch, tmp_path):
-    """Fallback to PNG when SVG is unavailable."""
-    tray = _make_tray_instance(tray_module)
-    gdk_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=gdk_mod)
-
-    fake_logo = object()
-    monkeypatch.setattr(
-        gdk_mod.Pixbuf,
-        "new_from_file_at_scale",
-        lambda *_a, **_k: fake_logo,
+    dialog = _last_dialog(DummyAboutDialog)
+    expected_url = f"{repo_url}/releases/tag/v1.2.3"
+    assert dialog.website == expected_url  # nosec B101
+    assert dialog.website_label == "Release"  # nosec B101
+    expected_comments = (
+        "Monitors and controls "
+        "LM Studio daemon "
+        "and desktop app."
     )
+    assert dialog.comments == expected_comments  # nosec B101
+    assert (
+        '<a href="https://docs.foo/bar">Documentation</a>'
+        in dialog.added_labels
+    )  # nosec B101
+    assert dialog.ran  # nosec B101
+    assert dialog.destroyed  # nosec B101
 
-    def _asset_path(*_args):
-        if _args[-1] == "lm-studio-tray-manager.svg":
-            return None
-        return str(tmp_path / "logo.png")
 
-    monkeypatch.setattr(tray_module, "get_asset_path", _asset_path)
+def test_show_about_dialog_includes_copyright(tray_module, tray, monkeypatch):
+    """About dialog should display 2025–2026 copyright without GdkPixbuf."""
+    monkeypatch.setattr(tray_module, "APP_MAINTAINER", "FooCorp")
     tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    assert dialog.logo is fake_logo  # nosec B101
+    dialog = _last_dialog(DummyAboutDialog)
+    assert "2025-2026" in dialog.copyright  # nosec B101
 
 
-def test_show_about_dialog_frozen_binary_prefers_png(
+@pytest.mark.parametrize(
+    "assets,frozen,load_fails,first_ext,has_logo",
+    [
+        (("svg", "png"), False, False, "svg", True),
+        (("svg", "png"), False, True, "svg", False),
+        (("png",), False, False, "png", True),
+        (("svg", "png"), True, False, "png", True),
+        ((), False, False, None, False),
+    ],
+    ids=["svg", "logo_error", "png_fallback", "frozen", "no_logo"],
+)
+def test_show_about_dialog_logo(
     tray_module,
+    about_ctx,
     monkeypatch,
-    tmp_path,
+    assets,
+    frozen,
+    load_fails,
+    first_ext,
+    has_logo,
 ):
-    """Prefer PNG over SVG in frozen PyInstaller binary."""
-    tray = _make_tray_instance(tray_module)
-    gdk_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=gdk_mod)
-
+    """Load the preferred logo format and tolerate missing or bad files."""
+    tray, gdk_mod = about_ctx
     fake_logo = object()
     load_attempts = []
 
-    def track_load_attempts(path, *_args, **_kwargs):
-        """Track which file types are attempted in order."""
+    def load_logo(path, *_args):
         load_attempts.append(path)
+        if load_fails:
+            raise tray_module.GLib.Error("boom")
         return fake_logo
 
-    monkeypatch.setattr(
-        gdk_mod.Pixbuf,
-        "new_from_file_at_scale",
-        track_load_attempts,
-    )
-
-    meipass_dir = tmp_path / "_MEIPASS" / "assets" / "img"
-    meipass_dir.mkdir(parents=True)
+    def asset_path(*args):
+        ext = args[-1].rsplit(".", 1)[-1]
+        return f"/assets/img/logo.{ext}" if ext in assets else None
 
-    def _asset_path(*args):
-        ext = args[-1].split(".")[-1]
-        return str(meipass_dir / f"logo.{ext}")
-
-    monkeypatch.setattr(tray_module, "get_asset_path", _asset_path)
-    monkeypatch.setattr(
-        tray_module.sys,
-        "_MEIPASS",
-        str(tmp_path / "_MEIPASS"),
-        raising=False,
-    )
+    monkeypatch.setattr(gdk_mod.Pixbuf, "new_from_file_at_scale", load_logo)
+    monkeypatch.setattr(tray_module, "get_asset_path", asset_path)
+    if frozen:
+        monkeypatch.setattr(
+            tray_module.sys, "_MEIPASS", "/bundle", raising=False
+        )
 
     tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
-    assert dialog.logo is fake_logo  # nosec B101
-    assert len(load_attempts) >= 1  # nosec B101
-    assert load_attempts[0].endswith(".png")  # nosec B101
-
-
-def test_show_about_dialog_no_logo_files_found(tray_module, monkeypatch):
-    """Handle case when no logo files are found."""
-    tray = _make_tray_instance(tray_module)
-    gdk_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    tray_module.sync_app_state_for_tests(gdk_pixbuf_mod=gdk_mod)
-    monkeypatch.setattr(tray_module, "get_asset_path", lambda *_a: None)
-    tray.show_about_dialog(None)
-    dialog = tray_module.Gtk.AboutDialog.last_instance
+    dialog = _last_dialog(DummyAboutDialog)
     assert dialog.ran is True  # nosec B101
     assert dialog.destroyed is True  # nosec B101
-    assert dialog.logo is None  # nosec B101
+    assert (dialog.logo is fake_logo) is has_logo  # nosec B101
+    if first_ext is None:
+        assert not load_attempts  # nosec B101
+    else:
+        assert load_attempts[0].endswith(f".{first_ext}")  # nosec B101
 
 
-def test_check_model_fail_warn_info_ok(tray_module, monkeypatch):
-    """Cover FAIL/WARN/INFO/OK icon and transition handling."""
-    tray = _make_tray_instance(tray_module)
-    notify_calls = []
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda args, **_kwargs: notify_calls.append(args)
-        or _completed(returncode=0, stdout="modelX"),
-    )
+def test_check_model_fail_warn_info_ok(
+    tray_module, fake_subprocess, tray, monkeypatch
+):
+    """Cover FAIL/WARN/INFO/OK icon and transition handling.
+
+    The steps run in order against one tray so each check sees the
+    previous status, which is what drives the transition handling.
+    """
+    status = {}
+    monkeypatch.setattr(tray, "get_daemon_status", lambda: status["daemon"])
+    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: status["app"])
+    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: status["lms"])
+    steps = [
+        ("not_found", "not_found", None, "modelX", "ICON_FAIL"),
+        ("stopped", "stopped", None, "modelX", "ICON_WARN"),
+        ("running", "stopped", None, "modelX", "ICON_INFO"),
+        ("running", "stopped", "/usr/bin/lms", "loaded", "ICON_OK"),
+    ]
+    tray.last_status = None
+    for daemon, app, lms_cmd, stdout, icon in steps:
+        status.update(daemon=daemon, app=app, lms=lms_cmd)
+        fake_subprocess.set_constant(_completed(returncode=0, stdout=stdout))
+        assert tray.check_model() is True  # nosec B101
+        assert tray.indicator.icon_calls[-1][0] == getattr(  # nosec B101
+            tray_module, icon
+        )
+
 
+def test_check_model_skips_menu_rebuild_when_states_unchanged(
+    tray, monkeypatch
+):
+    """Rebuild the menu only when the daemon or app state changes."""
+    builds = []
+    monkeypatch.setattr(tray, "build_menu", lambda: builds.append(1))
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "not_found")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "not_found")
-    tray.last_status = None
+    tray.last_status = "FAIL"
+    tray._menu_state = ("not_found", "not_found")
+
     assert tray.check_model() is True  # nosec B101
-    monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
+    assert not builds  # nosec B101
+
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     assert tray.check_model() is True  # nosec B101
-    monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
+    assert len(builds) == 1  # nosec B101
+
+
+def test_check_model_skips_unchanged_icon_updates(
+    tray_module, tray, monkeypatch
+):
+    """Only push the icon to the indicator when icon or tooltip change."""
+    monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: None)
     assert tray.check_model() is True  # nosec B101
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout="loaded"),
-    )
     assert tray.check_model() is True  # nosec B101
+    warn = (tray_module.ICON_WARN, "Daemon and desktop app stopped")
+    assert tray.indicator.icon_calls == [warn]  # nosec B101
+
+    monkeypatch.setattr(tray, "get_daemon_status", lambda: "not_found")
+    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "not_found")
+    assert tray.check_model() is True  # nosec B101
+    assert tray.indicator.icon_calls[-1][0] == (  # nosec B101
+        tray_module.ICON_FAIL
+    )
+    assert len(tray.indicator.icon_calls) == 2  # nosec B101
 
 
-def test_check_model_api_fallback(tray_module, monkeypatch):
+def test_check_model_api_fallback(tray_module, tray, monkeypatch):
     """Use API fallback when lms ps fails but models exist."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
     monkeypatch.setattr(tray_module, "check_api_models", lambda: True)
 
     assert tray.check_model() is True  # nosec B101
@@ -2817,16 +4003,14 @@ def test_check_model_api_fallback(tray_module, monkeypatch):
 
 
 def test_check_model_skips_lms_ps_when_only_desktop_running(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, fake_clock, monkeypatch
 ):
     """Avoid lms ps call during desktop launch grace window."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
     tray.lms_ps_resume_at = 999.0
-    monkeypatch.setattr(tray_module.time, "monotonic", lambda: 100.0)
+    fake_clock.set(100.0)
 
     def fail_on_lms_ps(*_a, **_k):
         raise RuntimeError("lms ps must not be called in desktop-only mode")
@@ -2839,16 +4023,14 @@ def test_check_model_skips_lms_ps_when_only_desktop_running(
 
 
 def test_check_model_uses_lms_ps_for_desktop_after_grace(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, fake_clock, monkeypatch
 ):
     """Use lms ps in desktop-only mode after grace window elapsed."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
     tray.lms_ps_resume_at = 100.0
-    monkeypatch.setattr(tray_module.time, "monotonic", lambda: 200.0)
+    fake_clock.set(200.0)
 
     monkeypatch.setattr(
         tray_module,
@@ -2864,87 +4046,138 @@ def test_check_model_uses_lms_ps_for_desktop_after_grace(
     monkeypatch.setattr(
         tray_module,
         "check_api_models",
-        lambda: (_ for _ in ()).throw(
-            RuntimeError("API fallback should not run in this path")
-        ),
+        _raiser(RuntimeError("API fallback should not run in this path")),
     )
 
     assert tray.check_model() is True  # nosec B101
     assert tray.indicator.icon_calls[-1][0] == tray_module.ICON_OK
 
 
-def test_check_api_models_success(tray_module, monkeypatch):
-    """Return True when API reports loaded models."""
-    payload = json.dumps(
-        {"data": [{"id": "model", "loaded": True}]}
+_API_LOADED_RESPONSE = DummyUrlResponse(
+    json.dumps({"data": [{"id": "model", "loaded": True}]}).encode("utf-8")
+)
+_API_AVAILABLE_RESPONSE = DummyUrlResponse(
+    json.dumps(
+        {
+            "data": [
+                {"id": "model-a", "state": "available"},
+                {"id": "model-b"},
+            ]
+        }
     ).encode("utf-8")
+)
+_API_NON_DICT_RESPONSES = tuple(
+    DummyUrlResponse(payload) for payload in (b"null", b"[]", b'"string"')
+)
+_API_NON_LIST_DATA_RESPONSES = tuple(
+    DummyUrlResponse(json.dumps({"data": data}).encode("utf-8"))
+    for data in (None, {}, "string")
+)
+_API_EMPTY_RESPONSE = DummyUrlResponse(b'{"data": []}')
+_API_INVALID_STRUCTURE_RESPONSE = DummyUrlResponse(
+    json.dumps({"invalid": "structure"}).encode("utf-8")
+)
 
-    monkeypatch.setattr(
-        tray_module.urllib_request,
-        "urlopen",
-        lambda *_a, **_k: DummyUrlResponse(payload),
-    )
+
+def _serve_api(monkeypatch, handles, response=None, errors=()):
+    """Route API connections to a ``DummyHTTPConnection`` and return it."""
+    conn = DummyHTTPConnection(response, errors)
+    monkeypatch.setattr(handles.http_client, "HTTPConnection", conn)
+    return conn
+
+
+def test_check_api_models_success(tray_module, tray_handles, monkeypatch):
+    """Return True when API reports loaded models."""
+    _serve_api(monkeypatch, tray_handles, _API_LOADED_RESPONSE)
 
     assert tray_module.check_api_models() is True  # nosec B101
 
 
 def test_check_api_models_available_only_returns_false(
-    tray_module,
-    monkeypatch,
+    tray_module, tray_handles, monkeypatch
 ):
     """Return False when API lists only available (not loaded) models."""
-    payload = json.dumps(
-        {
-            "data": [
-                {"id": "model-a", "state": "available"},
-                {"id": "model-b"},
-            ]
-        }
-    ).encode("utf-8")
+    _serve_api(monkeypatch, tray_handles, _API_AVAILABLE_RESPONSE)
+
+    assert tray_module.check_api_models() is False  # nosec B101
 
-    monkeypatch.setattr(
-        tray_module.urllib_request,
-        "urlopen",
-        lambda *_a, **_k: DummyUrlResponse(payload),
-    )
 
+def test_check_api_models_error(tray_module, tray_handles, monkeypatch):
+    """Return False and drop the connection when the API is down."""
+    conn = _serve_api(
+        monkeypatch,
+        tray_handles,
+        errors=[ConnectionRefusedError("down"), ConnectionRefusedError()],
+    )
     assert tray_module.check_api_models() is False  # nosec B101
+    assert conn.closed == 2  # nosec B101
+
+
+def test_check_api_models_reuses_connection(
+    tray_module, tray_handles, monkeypatch
+):
+    """Keep one API connection open across polls."""
+    conn = _serve_api(monkeypatch, tray_handles, _API_LOADED_RESPONSE)
+    assert tray_module.check_api_models() is True  # nosec B101
+    assert tray_module.check_api_models() is True  # nosec B101
+    assert conn.opened == [("localhost", 1234)]  # nosec B101
+    assert conn.requests == [  # nosec B101
+        ("GET", "/v1/models"),
+        ("GET", "/v1/models"),
+    ]
+
 
+def test_check_api_models_retries_stale_connection(
+    tray_module, tray_handles, monkeypatch
+):
+    """Reconnect once when the server closed the kept-alive connection."""
+    conn = _serve_api(
+        monkeypatch,
+        tray_handles,
+        _API_LOADED_RESPONSE,
+        errors=[tray_module.http_client.RemoteDisconnected("closed")],
+    )
+    assert tray_module.check_api_models() is True  # nosec B101
+    assert len(conn.opened) == 2  # nosec B101
+    assert conn.closed == 1  # nosec B101
 
-def test_check_api_models_error(tray_module, monkeypatch):
-    """Return False when API errors or returns invalid JSON."""
-    def _raise_error(*_a, **_k):
-        raise tray_module.urllib_error.URLError("down")
 
-    monkeypatch.setattr(tray_module.urllib_request, "urlopen", _raise_error)
+def test_check_api_models_http_error_status(
+    tray_module, tray_handles, monkeypatch
+):
+    """Treat a non-200 API response as no models loaded."""
+    _serve_api(
+        monkeypatch,
+        tray_handles,
+        DummyUrlResponse(b"{}", status=503),
+    )
     assert tray_module.check_api_models() is False  # nosec B101
 
 
-def test_check_api_models_non_dict_response(tray_module, monkeypatch):
+@pytest.mark.parametrize(
+    "response",
+    _API_NON_DICT_RESPONSES,
+    ids=lambda response: response.payload.decode("utf-8"),
+)
+def test_check_api_models_non_dict_response(
+    tray_module, tray_handles, monkeypatch, response
+):
     """Return False when API returns non-dict JSON (e.g. null or list)."""
-    for bad_payload in [b"null", b"[]", b'"string"']:
-        monkeypatch.setattr(
-            tray_module.urllib_request,
-            "urlopen",
-            lambda *_a, _p=bad_payload, **_k: DummyUrlResponse(_p),
-        )
-        assert tray_module.check_api_models() is False, (  # nosec B101
-            f"Expected False for payload: {bad_payload!r}"
-        )
+    _serve_api(monkeypatch, tray_handles, response)
+    assert tray_module.check_api_models() is False  # nosec B101
 
 
-def test_check_api_models_non_list_data_field(tray_module, monkeypatch):
+@pytest.mark.parametrize(
+    "response",
+    _API_NON_LIST_DATA_RESPONSES,
+    ids=lambda response: response.payload.decode("utf-8"),
+)
+def test_check_api_models_non_list_data_field(
+    tray_module, tray_handles, monkeypatch, response
+):
     """Return False when 'data' field is not a list (e.g. null or dict)."""
-    for bad_data in [None, {}, "string"]:
-        payload = json.dumps({"data": bad_data}).encode("utf-8")
-        monkeypatch.setattr(
-            tray_module.urllib_request,
-            "urlopen",
-            lambda *_a, _p=payload, **_k: DummyUrlResponse(_p),
-        )
-        assert tray_module.check_api_models() is False, (  # nosec B101
-            f"Expected False for data value: {bad_data!r}"
-        )
+    _serve_api(monkeypatch, tray_handles, response)
+    assert tray_module.check_api_models() is False  # nosec B101
 
 
 def test_get_api_models_url_defaults(tray_module):
@@ -2958,7 +4191,9 @@ def test_get_api_models_url_defaults(tray_module):
     )  # nosec B101
 
 
-def test_load_config_missing_defaults(tray_module, tmp_path, monkeypatch):
+def test_load_config_missing_defaults(
+    tray_module, tray_handles, tmp_path, monkeypatch
+):
     """Keep defaults when config is missing."""
     tray_module.sync_app_state_for_tests(
         script_dir_val=str(tmp_path),
@@ -2966,46 +4201,44 @@ def test_load_config_missing_defaults(tray_module, tmp_path, monkeypatch):
         api_port_val=1234,
     )
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _unused: str(tmp_path / "config.json"),
     )
     tray_module.load_config()
-    assert (
-        _call_member(tray_module, "_AppState").API_HOST == "localhost"
-    )  # nosec B101
-    assert (
-        _call_member(tray_module, "_AppState").API_PORT == 1234
-    )  # nosec B101
+    state = _state(tray_module)
+    assert state.API_HOST == "localhost"  # nosec B101
+    assert state.API_PORT == 1234  # nosec B101
 
 
-def test_load_config_valid_values(tray_module, tmp_path, monkeypatch):
+def test_load_config_valid_values(
+    tray_module, tray_handles, tmp_path, monkeypatch
+):
     """Load valid config values into app state."""
     config_file = tmp_path / "config.json"
     config_file.write_text(
-        json.dumps({"api_host": "10.0.0.5", "api_port": 8080}),
+        '{"api_host": "10.0.0.5", "api_port": 8080}',
         encoding="utf-8",
     )
     tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _unused: str(config_file),
     )
     tray_module.load_config()
-    assert (
-        _call_member(tray_module, "_AppState").API_HOST == "10.0.0.5"
-    )  # nosec B101
-    assert (
-        _call_member(tray_module, "_AppState").API_PORT == 8080
-    )  # nosec B101
+    state = _state(tray_module)
+    assert state.API_HOST == "10.0.0.5"  # nosec B101
+    assert state.API_PORT == 8080  # nosec B101
 
 
-def test_load_config_invalid_port(tray_module, tmp_path, monkeypatch):
+def test_load_config_invalid_port(
+    tray_module, tray_handles, tmp_path, monkeypatch
+):
     """Ignore invalid port values."""
     config_file = tmp_path / "config.json"
     config_file.write_text(
-        json.dumps({"api_host": "example", "api_port": 99999}),
+        '{"api_host": "example", "api_port": 99999}',
         encoding="utf-8",
     )
     tray_module.sync_app_state_for_tests(
@@ -3013,17 +4246,14 @@ def test_load_config_invalid_port(tray_module, tmp_path, monkeypatch):
         api_port_val=1234,
     )
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _p: str(config_file),
     )
     tray_module.load_config()
-    assert (
-        _call_member(tray_module, "_AppState").API_HOST == "example"
-    )  # nosec B101
-    assert (
-        _call_member(tray_module, "_AppState").API_PORT == 1234
-    )  # nosec B101
+    state = _state(tray_module)
+    assert state.API_HOST == "example"  # nosec B101
+    assert state.API_PORT == 1234  # nosec B101
 
 
 def test_normalize_api_port(tray_module):
@@ -3042,9 +4272,8 @@ def test_normalize_api_port(tray_module):
     )  # nosec B101
 
 
-def test_show_config_dialog_cancel(tray_module, monkeypatch):
+def test_show_config_dialog_cancel(tray_module, tray, monkeypatch):
     """Canceling the config dialog leaves settings unchanged."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(
         api_host_val="localhost",
         api_port_val=1234,
@@ -3059,24 +4288,22 @@ def test_show_config_dialog_cancel(tray_module, monkeypatch):
 
     monkeypatch.setattr(tray_module.Gtk, "Dialog", _dialog_factory)
     tray.show_config_dialog(None)
-    assert (
-        _call_member(tray_module, "_AppState").API_HOST == "localhost"
-    )  # nosec B101
-    assert (
-        _call_member(tray_module, "_AppState").API_PORT == 1234
-    )  # nosec B101
+    state = _state(tray_module)
+    assert state.API_HOST == "localhost"  # nosec B101
+    assert state.API_PORT == 1234  # nosec B101
 
 
-def test_show_config_dialog_save(tray_module, monkeypatch, tmp_path):
+def test_show_config_dialog_save(
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
+):
     """Saving the config dialog persists host and port."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(
         script_dir_val=str(tmp_path),
         api_host_val="localhost",
         api_port_val=1234,
     )
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _p: str(tmp_path / "config.json"),
     )
@@ -3096,78 +4323,66 @@ def test_show_config_dialog_save(tray_module, monkeypatch, tmp_path):
     assert data["api_port"] == 1234  # nosec B101
 
 
-def test_save_config_writes_file(tray_module, tmp_path, monkeypatch):
+def test_save_config_writes_file(
+    tray_module, tray_handles, tmp_path, monkeypatch
+):
     """Persist config values to disk."""
     tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _p: str(tmp_path / "config.json"),
     )
     tray_module.save_config("host", 4321)
     config_file = tmp_path / "config.json"
-    data = json.loads(config_file.read_text(encoding="utf-8"))
+    text = config_file.read_text(encoding="utf-8")
+    assert text == (  # nosec B101
+        '{\n  "api_host": "host",\n  "api_port": 4321\n}'
+    )
+    data = json.loads(text)
     assert data["api_host"] == "host"  # nosec B101
     assert data["api_port"] == 4321  # nosec B101
 
 
-def test_build_menu_running_entries(tray_module, monkeypatch):
+def test_build_menu_running_entries(tray_module, tray, monkeypatch):
     """Build menu entries for running daemon and desktop app."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
     tray_module.TrayIcon.build_menu(tray)
-    labels = [getattr(i, "label", "") for i in tray.menu.get_children()]
-    assert any("Daemon (Running)" in label for label in labels)  # nosec B101
-    assert any(
-        "Desktop App (Running)" in label for label in labels
-    )  # nosec B101
+    assert tray.menu.has_label("Daemon (Running)")  # nosec B101
+    assert tray.menu.has_label("Desktop App (Running)")  # nosec B101
 
 
-def test_build_menu_clears_existing_items(tray_module, monkeypatch):
+def test_build_menu_clears_existing_items(tray_module, tray, monkeypatch):
     """Remove stale menu items before rebuilding."""
-    tray = _make_tray_instance(tray_module)
     tray.menu.append(DummyMenuItem(label="old"))
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     tray_module.TrayIcon.build_menu(tray)
-    labels = [getattr(i, "label", "") for i in tray.menu.get_children()]
-    assert "old" not in labels  # nosec B101
+    assert not tray.menu.has_label("old")  # nosec B101
 
 
-def test_build_menu_not_found_entries(tray_module, monkeypatch):
+def test_build_menu_not_found_entries(tray_module, tray, monkeypatch):
     """Build menu entries for missing daemon and desktop app."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "not_found")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "not_found")
     tray_module.TrayIcon.build_menu(tray)
-    labels = [getattr(i, "label", "") for i in tray.menu.get_children()]
-    assert any(
-        "Daemon (Not Installed)" in label for label in labels
-    )  # nosec B101
-    assert any(
-        "Desktop App (Not Installed)" in label for label in labels
-    )  # nosec B101
+    assert tray.menu.has_label("Daemon (Not Installed)")  # nosec B101
+    assert tray.menu.has_label("Desktop App (Not Installed)")  # nosec B101
 
 
-def test_build_menu_stopped_entries(tray_module, monkeypatch):
+def test_build_menu_stopped_entries(tray_module, tray, monkeypatch):
     """Build menu entries for stopped daemon and desktop app."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     tray_module.TrayIcon.build_menu(tray)
-    labels = [getattr(i, "label", "") for i in tray.menu.get_children()]
-    assert any(
-        "Start Daemon (Headless)" in label for label in labels
-    )  # nosec B101
-    assert any(
-        "Start Desktop App" in label for label in labels
-    )  # nosec B101
+    assert tray.menu.has_label("Start Daemon (Headless)")  # nosec B101
+    assert tray.menu.has_label("Start Desktop App")  # nosec B101
 
 
-def test_get_daemon_status_variants(tray_module, monkeypatch):
+def test_get_daemon_status_variants(tray_module, tray, monkeypatch):
     """Return daemon status for missing, running, and stopped cases."""
-    tray = _make_tray_instance(tray_module)
+    invalidate = getattr(tray_module, "_invalidate_process_snapshot")
     monkeypatch.setattr(tray_module, "get_llmster_cmd", lambda: None)
     assert tray.get_daemon_status() == "not_found"  # nosec B101
 
@@ -3177,68 +4392,80 @@ def test_get_daemon_status_variants(tray_module, monkeypatch):
         lambda: "/usr/bin/llmster",
     )
     monkeypatch.setattr(tray_module, "is_llmster_running", lambda: True)
+    invalidate()
     assert tray.get_daemon_status() == "running"  # nosec B101
 
     monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
+    invalidate()
     assert tray.get_daemon_status() == "stopped"  # nosec B101
 
 
-def test_get_desktop_app_status_variants(tray_module, monkeypatch, tmp_path):
+def test_get_daemon_status_shared_within_ttl(
+    tray_module, tray, fake_clock, monkeypatch
+):
+    """Answer repeated status queries from one probe per TTL window."""
+    probes = []
+    monkeypatch.setattr(
+        tray_module, "get_llmster_cmd", lambda: "/usr/bin/llmster"
+    )
+    monkeypatch.setattr(
+        tray_module,
+        "is_llmster_running",
+        lambda: probes.append(True) or True,
+    )
+    fake_clock.set(50.0)
+
+    assert tray.get_daemon_status() == "running"  # nosec B101
+    assert tray.get_daemon_status() == "running"  # nosec B101
+    assert len(probes) == 1  # nosec B101
+
+    fake_clock.advance(tray_module.DAEMON_STATUS_TTL)
+    tray.get_daemon_status()
+    assert len(probes) == 2  # nosec B101
+
+
+def test_get_desktop_app_status_variants(
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
+):
     """Return desktop app status for running and installed variants."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [1])
     assert tray.get_desktop_app_status() == "running"  # nosec B101
 
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_lms)
     monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
+        tray_handles.shutil,
         "which",
         lambda x: "/usr/bin/lm-studio",
     )
     assert tray.get_desktop_app_status() == "stopped"  # nosec B101
 
     app_dir = tmp_path / "Apps"
-    app_dir.mkdir()
-    (app_dir / "LM-Studio.AppImage").write_text("x", encoding="utf-8")
     tray_module.sync_app_state_for_tests(script_dir_val=str(app_dir))
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
+    os.makedirs(app_dir)
     monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0, stdout=""),
-    )
-    monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda p: p == str(app_dir),
-    )
-    monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _p: ["LM-Studio.AppImage"],
+        tray_handles.os,
+        "scandir",
+        _fake_scandir("LM-Studio.AppImage"),
     )
     assert tray.get_desktop_app_status() == "stopped"  # nosec B101
 
 
 def test_get_desktop_app_status_debug_logs(
-    tray_module, monkeypatch, caplog, tmp_path
+    tray_module, tray, tray_handles, monkeypatch, caplog, tmp_path
 ):
     """When debug logging enabled the lookup emits helpful messages."""
-    tray = _make_tray_instance(tray_module)
     caplog.set_level(logging.DEBUG)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
     monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
     monkeypatch.setattr(
         tray_module,
         "_run_safe_command",
-        lambda args: _completed(returncode=0, stdout="lm-studio"),
+        lambda args, **_k: _RC0_LMS,
     )
     monkeypatch.setattr(
-        tray_module.shutil,
+        tray_handles.shutil,
         "which",
         lambda x: "/usr/bin/lm-studio",
     )
@@ -3248,31 +4475,23 @@ def test_get_desktop_app_status_debug_logs(
     caplog.clear()
     monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: None)
     apps_dir = tmp_path / "Apps2"
-    apps_dir.mkdir()
     tray_module.sync_app_state_for_tests(script_dir_val=str(apps_dir))
+    os.makedirs(apps_dir)
     monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda p: str(apps_dir) == p,
-    )
-    monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _unused_p: ["LM-Studio.AppImage"],
+        tray_handles.os,
+        "scandir",
+        _fake_scandir("LM-Studio.AppImage"),
     )
     assert tray.get_desktop_app_status() == "stopped"
     assert "Detected AppImage at" in caplog.text
 
 
 def test_show_status_dialog_ignores_available_only(
-    tray_module,
-    monkeypatch,
-    caplog,
+    tray_module, tray, tray_handles, monkeypatch, caplog
 ):
     """Ensure show_status_dialog treats `lms ps` output listing only
     available models as no models loaded.
     """
-    tray = _make_tray_instance(tray_module)
     caplog.set_level(logging.DEBUG)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(
@@ -3289,26 +4508,9 @@ def test_show_status_dialog_ignores_available_only(
         ),
     )
 
-    class DummyResp:
-        """Dummy response for urlopen context manager."""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, _exc_type, _exc_val, _exc_tb):
-            return False
-
-        def read(self):
-            """Return empty models list."""
-            return b'{"data": []}'
-
-    monkeypatch.setattr(
-        tray_module.urllib_request,
-        "urlopen",
-        lambda *unused_args, **unused_kwargs: DummyResp(),
-    )
+    _serve_api(monkeypatch, tray_handles, _API_EMPTY_RESPONSE)
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary
     assert "contains only available models" in caplog.text
 
@@ -3322,16 +4524,33 @@ def test_show_status_dialog_ignores_available_only(
         ),
     )
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary
     assert "explicitly reports no models" in caplog.text
 
 
-def test_check_model_ignores_available_only(tray_module, monkeypatch):
+@pytest.mark.parametrize(
+    "output, expected",
+    [
+        ("", False),
+        ("  \n", False),
+        ("model-a  8 GB", True),
+        ("foo available\nbar AVAILABLE", False),
+        ("foo Available\nbar LOADED", True),
+        ("foo loaded\nNo models are currently loaded.", False),
+    ],
+    ids=["empty", "blank", "plain", "available", "loaded", "no-models"],
+)
+def test_has_loaded_model_signals(tray_module, output, expected):
+    """Interpret lms ps markers regardless of case and order."""
+    has_loaded = getattr(tray_module, "_has_loaded_model")
+    assert has_loaded(output) is expected  # nosec B101
+
+
+def test_check_model_ignores_available_only(tray_module, tray, monkeypatch):
     """check_model must not flip to OK when output only lists
     available models.
     """
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests()
     monkeypatch.setattr(
         tray,
@@ -3378,11 +4597,9 @@ def test_check_model_ignores_available_only(tray_module, monkeypatch):
 
 
 def test_check_model_cli_no_models_with_api_true_transition(
-    tray_module,
-    monkeypatch,
+    tray_module, tray, monkeypatch
 ):
     """Transition from OK to INFO when CLI says no models but API true."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests()
     monkeypatch.setattr(
         tray_module,
@@ -3421,7 +4638,7 @@ def test_check_model_cli_no_models_with_api_true_transition(
         "_run_validated_command",
         lambda cmd: (
             notifications.append(cmd)
-            or _completed(returncode=0)
+            or _RC0
         ),
     )
 
@@ -3450,7 +4667,55 @@ def test_home_mask_formatter_masks_home_dir(tray_module):
     assert home not in out
 
 
-def test_logging_handlers_are_replaced(tray_module, tmp_path):
+def test_home_mask_formatter_refreshes_on_home_change(
+    tray_module, monkeypatch, tmp_path
+):
+    """Reuse the cached home path until HOME points elsewhere."""
+    fmt = tray_module.HomeMaskFormatter("%(message)s")
+    expansions = []
+    real_expanduser = os.path.expanduser
+    monkeypatch.setattr(
+        tray_module.os.path,
+        "expanduser",
+        lambda p: expansions.append(p) or real_expanduser(p),
+    )
+
+    def masked(path):
+        rec = logging.LogRecord(
+            "test", logging.INFO, "/p", 1, "%s", (path,), None
+        )
+        return fmt.format(rec)
+
+    first = tmp_path / "first"
+    monkeypatch.setenv("HOME", str(first))
+    assert masked(f"{first}/a") == "~/a"  # nosec B101
+    assert masked(f"{first}/b") == "~/b"  # nosec B101
+    assert len(expansions) == 1  # nosec B101
+
+    second = tmp_path / "second"
+    monkeypatch.setenv("HOME", str(second))
+    assert masked(f"{second}/c") == "~/c"  # nosec B101
+    assert len(expansions) == 2  # nosec B101
+
+
+def test_home_mask_formatter_masks_runtime_dir(
+    tray_module, monkeypatch, tmp_path
+):
+    """Mask XDG_RUNTIME_DIR too, even when it lives below HOME."""
+    fmt = tray_module.HomeMaskFormatter("%(message)s")
+    home = tmp_path / "home"
+    runtime = home / "run"
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+    rec = logging.LogRecord(
+        "test", logging.INFO, "/p", 1, "%s %s",
+        (f"{runtime}/bus", f"{home}/cfg"), None,
+    )
+    out = fmt.format(rec)
+    assert out == "$XDG_RUNTIME_DIR/bus ~/cfg"  # nosec B101
+
+
+def test_logging_handlers_are_replaced(tray_module, tmp_path, monkeypatch):
     """
     After calling basicConfig the module loop replaces formatter
     with masking one.
@@ -3464,12 +4729,12 @@ def test_logging_handlers_are_replaced(tray_module, tmp_path):
         force=True,
     )
     root = logging.getLogger()
-    for handler in root.handlers:
-        handler.setFormatter(
-            tray_module.HomeMaskFormatter(
-                "%(asctime)s - %(levelname)s - %(message)s"
-            )
-        )
+    monkeypatch.setattr(
+        root, "handlers", [*root.handlers, logging.StreamHandler()]
+    )
+    _call_member(tray_module, "_install_home_mask_formatter")
+    formatters = {id(h.formatter) for h in root.handlers}
+    assert len(formatters) == 1  # nosec B101
     assert all(
         isinstance(h.formatter, tray_module.HomeMaskFormatter)
         for h in root.handlers
@@ -3497,34 +4762,28 @@ def test_logging_paths_are_masked(
 
 
 def test_dpkg_reports_but_no_executable_fallback_appimage(
-    tray_module, monkeypatch, caplog, tmp_path
+    tray_module, tray, tray_handles, monkeypatch, caplog, tmp_path
 ):
     """
     When dpkg shows package but binary missing, AppImage search
     still runs.
     """
-    tray = _make_tray_instance(tray_module)
     caplog.set_level(logging.DEBUG)
     monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
     monkeypatch.setattr(
         tray_module,
         "_run_safe_command",
-        lambda args, **_k: _completed(returncode=0, stdout="lm-studio"),
+        lambda args, **_k: _RC0_LMS,
     )
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: None)
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
 
-    apps_dir = tmp_path / "Apps3"
-    apps_dir.mkdir()
-    tray_module.sync_app_state_for_tests(script_dir_val=str(apps_dir))
-    monkeypatch.setattr(
-        tray_module.os.path,
-        "isdir",
-        lambda p: str(apps_dir) == p,
-    )
+    apps_dir = tmp_path / "Apps3"
+    tray_module.sync_app_state_for_tests(script_dir_val=str(apps_dir))
+    os.makedirs(apps_dir)
     monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _unused: ["LM-Studio.AppImage"],
+        tray_handles.os,
+        "scandir",
+        _fake_scandir("LM-Studio.AppImage"),
     )
 
     status = tray.get_desktop_app_status()
@@ -3537,13 +4796,12 @@ def test_dpkg_reports_but_no_executable_fallback_appimage(
 
 
 def test_get_desktop_app_status_debug_no_repeat(
-    tray_module, monkeypatch, caplog, _tmp_path
+    tray_module, tray, tray_handles, monkeypatch, caplog, _tmp_path
 ):
     """
     Calling get_desktop_app_status twice with the same environment
     only logs once.
     """
-    tray = _make_tray_instance(tray_module)
     caplog.set_level(logging.DEBUG)
     monkeypatch.setattr(
         tray_module, "get_desktop_app_pids", lambda: []
@@ -3554,10 +4812,10 @@ def test_get_desktop_app_status_debug_no_repeat(
     monkeypatch.setattr(
         tray_module,
         "_run_safe_command",
-        lambda _unused: _completed(returncode=0, stdout="lm-studio"),
+        _run_lms,
     )
     monkeypatch.setattr(
-        tray_module.shutil,
+        tray_handles.shutil,
         "which",
         lambda _unused: "/usr/bin/lm-studio",
     )
@@ -3567,22 +4825,107 @@ def test_get_desktop_app_status_debug_no_repeat(
     assert caplog.text == ""
 
 
-def test_force_stop_llmster(tray_module, monkeypatch):
-    """Issue force-stop commands for llmster."""
-    tray = _make_tray_instance(tray_module)
-    calls = []
+def test_get_desktop_app_status_reuses_install_detection(
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
+):
+    """Skip dpkg and AppImage scans until a fingerprinted input changes."""
+    app_dir = tmp_path / "apps"
+    app_dir.mkdir()
+    tray_module.sync_app_state_for_tests(script_dir_val=str(app_dir))
+    pids = []
+    monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: pids)
+    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
+    dpkg_calls = DummyCallRecorder()
+    monkeypatch.setattr(tray_module, "_run_safe_command", dpkg_calls)
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+
+    assert tray.get_desktop_app_status() == "not_found"  # nosec B101
+    assert tray.get_desktop_app_status() == "not_found"  # nosec B101
+    assert len(dpkg_calls) == 1  # nosec B101
+
+    pids.append(4242)
+    assert tray.get_desktop_app_status() == "running"  # nosec B101
+    pids.clear()
+
+    (app_dir / "LM-Studio.AppImage").write_text("", encoding="utf-8")
+    os.utime(app_dir, ns=(0, 0))
+    assert tray.get_desktop_app_status() == "stopped"  # nosec B101
+    assert len(dpkg_calls) == 2  # nosec B101
+
+
+def test_dpkg_query_many_batches_and_expires(
+    tray_module, tray_handles, fake_clock, monkeypatch
+):
+    """Query all packages in one fork and reuse it for the TTL window."""
+    queries = []
+    output = (
+        "lm-studio install ok installed\n"
+        "llmster deinstall ok config-files\n"
+    )
+    monkeypatch.setattr(
+        tray_handles.subprocess,
+        "run",
+        lambda command, **_k: queries.append(command)
+        or _completed(returncode=1, stdout=output),
+    )
+    fake_clock.set(100.0)
+    query_many = getattr(tray_module, "_dpkg_query_many")
+    packages = ["lm-studio", "llmster", "missing"]
+
+    expected = {"lm-studio": True, "llmster": False, "missing": False}
+    assert query_many("/usr/bin/dpkg", packages) == expected  # nosec B101
+    assert query_many("/usr/bin/dpkg", packages) == expected  # nosec B101
+    assert queries == [  # nosec B101
+        [
+            "/usr/bin/dpkg-query",
+            "-W",
+            "-f=${Package} ${Status}\n",
+            *packages,
+        ]
+    ]
+
+    fake_clock.advance(tray_module.DPKG_QUERY_TTL)
+    query_many("/usr/bin/dpkg", packages)
+    assert len(queries) == 2  # nosec B101
+
+
+def test_run_safe_command_caches_only_with_ttl(
+    tray_module, tray_handles, monkeypatch
+):
+    """Share results of identical calls only when a TTL is given."""
+    runs = []
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
-        lambda args, **_kwargs: calls.append(args) or _completed(returncode=0),
+        lambda command, **_k: runs.append(command) or _RC0,
     )
-    running = [True, False]
+    run_safe = getattr(tray_module, "_run_safe_command")
+
+    run_safe(["/usr/bin/pkill", "-x", "llmster"])
+    run_safe(["/usr/bin/pkill", "-x", "llmster"])
+    assert len(runs) == 2  # nosec B101
+
+    run_safe(["/usr/bin/lms", "version"], cache_ttl=5)
+    run_safe(["/usr/bin/lms", "version"], cache_ttl=5)
+    assert len(runs) == 3  # nosec B101
+
+    tray_module.sync_app_state_for_tests()
+    run_safe(["/usr/bin/lms", "version"], cache_ttl=5)
+    assert len(runs) == 4  # nosec B101
+
+
+def test_force_stop_llmster(
+    tray_module, fake_subprocess, tray, fake_clock, monkeypatch
+):
+    """Issue force-stop commands for llmster."""
+    fake_subprocess.set_constant(_RC0)
+    calls = fake_subprocess.calls
+    running = collections.deque([True, False])
     monkeypatch.setattr(
         tray_module,
         "is_llmster_running",
-        lambda: running.pop(0),
+        running.popleft,
     )
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _x: None)
     _call_member(tray, "_force_stop_llmster")
     pkill_x = any(
         c[0].endswith("pkill") and "-x" in c for c in calls
@@ -3594,15 +4937,16 @@ def test_force_stop_llmster(tray_module, monkeypatch):
     assert pkill_f  # nosec B101
 
 
-def test_force_stop_llmster_sigkill_escalation(tray_module, monkeypatch):
+def test_force_stop_llmster_sigkill_escalation(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
     """Escalate to SIGKILL when SIGTERM does not stop llmster in time."""
-    tray = _make_tray_instance(tray_module)
     calls = []
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
         lambda args, **_kwargs: (
-            calls.append(args) or _completed(returncode=0)
+            calls.append(args) or _RC0
         ),
     )
     call_count = {"n": 0}
@@ -3612,7 +4956,6 @@ def test_force_stop_llmster_sigkill_escalation(tray_module, monkeypatch):
         return call_count["n"] <= 13
 
     monkeypatch.setattr(tray_module, "is_llmster_running", _is_running)
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _x: None)
     _call_member(tray, "_force_stop_llmster")
     pkill9_x = any(
         c[0].endswith("pkill") and "-9" in c and "-x" in c
@@ -3626,224 +4969,163 @@ def test_force_stop_llmster_sigkill_escalation(tray_module, monkeypatch):
     assert pkill9_f  # nosec B101
 
 
-def test_stop_desktop_app_processes_force_kill_path(tray_module, monkeypatch):
+def test_stop_desktop_app_processes_force_kill_path(
+    tray_module, tray, tray_handles, fake_clock, monkeypatch
+):
     """Escalate to SIGKILL when desktop app ignores SIGTERM."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [10])
-    status_seq = ["running"] * 9 + ["stopped", "stopped"]
+    status_seq = collections.deque(["running"] * 9 + ["stopped", "stopped"])
     monkeypatch.setattr(
         tray,
         "get_desktop_app_status",
-        lambda: status_seq.pop(0),
+        status_seq.popleft,
     )
     killed = []
     monkeypatch.setattr(
-        tray_module.os,
+        tray_handles.os,
         "kill",
         lambda pid, sig: killed.append((pid, sig)),
     )
-    monkeypatch.setattr(tray_module.time, "sleep", lambda _x: None)
     result = _call_member(tray, "_stop_desktop_app_processes")
     assert result is True  # nosec B101
     assert any(sig == 9 for _unused_pid, sig in killed)  # nosec B101
 
 
-def test_start_daemon_success_after_stopping_app(tray_module, monkeypatch):
+def test_start_daemon_success_after_stopping_app(
+    tray_module, action_tray, tray_handles, monkeypatch
+):
     """Start daemon successfully after stopping desktop app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    status = ["running", "stopped"]
-    monkeypatch.setattr(tray, "get_desktop_app_status", lambda: status.pop(0))
+    tray = action_tray
+    status = collections.deque(["running", "stopped"])
+    monkeypatch.setattr(tray, "get_desktop_app_status", status.popleft)
     monkeypatch.setattr(tray, "_stop_desktop_app_processes", lambda: True)
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [["cmd"]])
     monkeypatch.setattr(
         tray,
         "_run_daemon_attempts",
-        lambda _a, _c: _completed(returncode=0),
+        lambda _a, _c: _RC0,
     )
     monkeypatch.setattr(tray_module, "is_llmster_running", lambda: True)
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
-    )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     tray.start_daemon(None)
 
 
-def test_start_daemon_exception_path(tray_module, monkeypatch):
+def test_start_daemon_exception_path(
+    tray_module, action_tray, tray_handles, monkeypatch
+):
     """Handle unexpected exception while starting daemon."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [["cmd"]])
     monkeypatch.setattr(
         tray,
         "_run_daemon_attempts",
-        lambda _a, _c: (_ for _ in ()).throw(RuntimeError("boom")),
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
+        _raiser(RuntimeError("boom")),
     )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     tray.start_daemon(None)
 
 
-def test_stop_daemon_failure_detail_path(tray_module, monkeypatch):
+def test_stop_daemon_failure_detail_path(
+    tray_module, action_tray, tray_handles, monkeypatch
+):
     """Include subprocess detail when daemon stop fails."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [["cmd"]])
     monkeypatch.setattr(
         tray,
         "_stop_llmster_best_effort",
         lambda: (False, _completed(returncode=1, stderr="still running")),
     )
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
-    )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     tray.stop_daemon(None)
 
 
-def test_stop_daemon_exception_path(tray_module, monkeypatch):
+def test_stop_daemon_exception_path(
+    tray_module, action_tray, tray_handles, monkeypatch
+):
     """Handle unexpected exception while stopping daemon."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "_build_daemon_attempts", lambda _x: [["cmd"]])
     monkeypatch.setattr(
         tray,
         "_stop_llmster_best_effort",
-        lambda: (_ for _ in ()).throw(RuntimeError("boom")),
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
+        _raiser(RuntimeError("boom")),
     )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     tray.stop_daemon(None)
 
 
-def test_start_desktop_app_daemon_stop_fails(tray_module, monkeypatch):
+def test_start_desktop_app_daemon_stop_fails(
+    tray_module, start_desktop_tray, tray_handles, fake_clock, monkeypatch
+):
     """Abort desktop start when daemon cannot be stopped."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: True)
+    tray = start_desktop_tray
+    configure_start_desktop(
+        monkeypatch, tray_module, tray, daemon_running=True
+    )
     monkeypatch.setattr(
         tray,
         "_stop_llmster_best_effort",
-        lambda: (False, _completed(returncode=1)),
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
+        lambda: (False, _RC1),
     )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     tray.start_desktop_app(None)
 
 
 def test_start_desktop_app_stops_daemon_even_on_false_negative(
-    tray_module,
-    monkeypatch,
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
 ):
     """Abort startup when stop fails despite initial false-negative check."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
+    tray = start_desktop_tray
     monkeypatch.setattr(
         tray,
         "_stop_llmster_best_effort",
-        lambda: (False, _completed(returncode=1)),
-    )
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
+        lambda: (False, _RC1),
     )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_ok)
     popen_called = []
 
     def fake_popen(*_args, **_kwargs):
         popen_called.append(True)
         return DummyProcess(pid=123)
 
-    monkeypatch.setattr(tray_module.subprocess, "Popen", fake_popen)
+    monkeypatch.setattr(tray_handles.subprocess, "Popen", fake_popen)
     tray.start_desktop_app(None)
 
     assert not popen_called  # nosec B101
 
 
-def test_start_desktop_app_not_found_path(tray_module, monkeypatch):
+def test_start_desktop_app_not_found_path(
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
+):
     """Notify user when no desktop installation is found."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
+    tray = start_desktop_tray
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
-        lambda args, **_kwargs: _completed(returncode=0, stdout="")
+        lambda args, **_kwargs: _RC0
         if args[:2] == ["dpkg", "-l"]
-        else _completed(returncode=0),
+        else _RC0,
     )
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: False)
+    monkeypatch.setattr(tray_handles.ospath, "isdir", lambda _p: False)
     tray.start_desktop_app(None)
 
 
-def test_start_desktop_app_spawnv_failure(tray_module, monkeypatch):
+def test_start_desktop_app_spawnv_failure(
+    tray_module, start_desktop_tray, tray_handles, monkeypatch
+):
     """Handle spawnv failure when launching desktop app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(tray_module, "is_llmster_running", lambda: False)
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
-    monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: "/usr/bin/dpkg")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout="lm-studio"),
-    )
-    monkeypatch.setattr(
-        tray_module.shutil,
-        "which",
-        lambda _x: "/usr/bin/lm-studio",
-    )
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-
-    def is_safe_dir(path):
-        return path == "/usr/bin"
-
-    monkeypatch.setattr(tray_module.os.path, "isdir", is_safe_dir)
+    tray = start_desktop_tray
+    _stub_deb_install(monkeypatch, tray_module)
     monkeypatch.setattr(
-        tray_module.os,
+        tray_handles.os,
         "spawnv",
-        lambda *_a, **_k: (_ for _ in ()).throw(OSError("fail")),
+        _raiser(OSError("fail")),
     )
 
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     tray.start_desktop_app(None)
     assert any(  # nosec B101
@@ -3851,10 +5133,11 @@ def test_start_desktop_app_spawnv_failure(tray_module, monkeypatch):
     )
 
 
-def test_stop_desktop_app_exception_path(tray_module, monkeypatch):
+def test_stop_desktop_app_exception_path(
+    tray_module, action_tray, monkeypatch
+):
     """Handle exception while stopping desktop app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [123])
 
     def raise_error():
@@ -3865,37 +5148,30 @@ def test_stop_desktop_app_exception_path(tray_module, monkeypatch):
         tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
     )
 
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     tray.stop_desktop_app(None)
     assert len(notifications) > 0  # nosec B101
 
 
-def test_show_status_dialog_error_path(tray_module, monkeypatch):
+def test_show_status_dialog_error_path(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Render status dialog with API fallback message when lms is missing."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: None)
-    monkeypatch.setattr(
-        tray_module.urllib_request,
-        "urlopen",
-        lambda *_a, **_k: (_ for _ in ()).throw(
-            tray_module.urllib_error.URLError("connection refused")
-        ),
+    _serve_api(
+        monkeypatch,
+        tray_handles,
+        errors=[ConnectionRefusedError(), ConnectionRefusedError()],
     )
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary  # nosec B101
 
 
-def test_show_status_dialog_success_path(tray_module, monkeypatch):
+def test_show_status_dialog_success_path(tray_module, tray, monkeypatch):
     """Render status dialog with CLI output on success."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
     monkeypatch.setattr(
@@ -3904,75 +5180,42 @@ def test_show_status_dialog_success_path(tray_module, monkeypatch):
         lambda *_a, **_k: _completed(returncode=0, stdout="model A"),
     )
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert dialog.secondary == "model A"  # nosec B101
 
 
-def test_show_status_dialog_no_models(tray_module, monkeypatch):
+def test_show_status_dialog_no_models(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Render default message when no models are loaded."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
 
-    class DummyResp:
-        """A context manager mock for simulating HTTP responses in tests.
-
-        This dummy response object mimics the behavior of a real HTTP response,
-        allowing it to be used with context manager syntax (with statement).
-        It returns an empty JSON model list when read.
-        """
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            return False
-
-        def read(self):
-            """
-            Simulates reading data by returning a bytes object
-            representing an empty JSON array of models.
-
-            Returns:
-                bytes: A JSON-formatted bytes object with an empty
-                    "data" list.
-            """
-            return b'{"data": []}'  # no models
-    monkeypatch.setattr(
-        tray_module.urllib_request,
-        "urlopen",
-        lambda *args, **kwargs: DummyResp(),
-    )
+    _serve_api(monkeypatch, tray_handles, _API_EMPTY_RESPONSE)
 
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary  # nosec B101
 
 
-def test_check_model_timeout_and_exception_paths(tray_module, monkeypatch):
+def test_check_model_timeout_and_exception_paths(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Keep check_model stable on timeout and subprocess errors."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
 
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
-        lambda *_a, **_k: (
-            _ for _ in ()
-        ).throw(subprocess.TimeoutExpired("cmd", 1)),
+        _raiser(subprocess.TimeoutExpired("cmd", 1)),
     )
     assert tray.check_model() is True  # nosec B101
 
 
 def test_check_model_transition_notifications(
-    tray_module,
-    monkeypatch,
-    caplog,
+    tray_module, tray, tray_handles, monkeypatch, caplog
 ):
     """Notify on INFO->WARN, WARN->FAIL, and OK->INFO transitions.
 
@@ -3981,24 +5224,14 @@ def test_check_model_transition_notifications(
     loaded/unloaded).  This test exercises both notifications and log
     messages.
     """
-    tray = _make_tray_instance(tray_module)
     caplog.set_level(logging.DEBUG)
 
     monkeypatch.setattr(tray_module, "get_notify_send_cmd", lambda: "/n")
     monkeypatch.setattr(tray_module, "check_api_models", lambda: False)
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_fail)
 
     tray.last_status = "INFO"
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
@@ -4021,42 +5254,36 @@ def test_check_model_transition_notifications(
     assert len(notifications) >= 3  # nosec B101
 
 
-def test_check_model_empty_lms_output(tray_module, monkeypatch):
+def test_check_model_empty_lms_output(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Keep INFO status for empty lms output and run OSError."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "stopped")
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=0, stdout=""),
-    )
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_ok)
     assert tray.check_model() is True  # nosec B101
 
     monkeypatch.setattr(
-        tray_module.subprocess,
+        tray_handles.subprocess,
         "run",
-        lambda *_a, **_k: (_ for _ in ()).throw(OSError("boom")),
+        _raiser(OSError("boom")),
     )
     assert tray.check_model() is True  # nosec B101
 
 
-def test_start_daemon_fails_when_desktop_cannot_stop(tray_module, monkeypatch):
+def test_start_daemon_fails_when_desktop_cannot_stop(
+    tray_module, fake_subprocess, action_tray, monkeypatch
+):
     """Abort daemon start when desktop app fails to stop."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray, "get_desktop_app_status", lambda: "running")
     monkeypatch.setattr(tray, "_stop_desktop_app_processes", lambda: False)
     monkeypatch.setattr(
         tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
     )
-    calls = []
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda args, **_kwargs: calls.append(args) or _completed(returncode=0),
-    )
+    fake_subprocess.set_constant(_RC0)
+    calls = fake_subprocess.calls
     tray.start_daemon(None)
     assert any(
         "Failed to stop desktop app" in " ".join(cmd) for cmd in calls
@@ -4064,59 +5291,20 @@ def test_start_daemon_fails_when_desktop_cannot_stop(tray_module, monkeypatch):
 
 
 def test_debug_mode_import_enables_warning_capture(monkeypatch, tmp_path):
-    """Enable warning capture when module is imported in debug mode."""
-    gi_mod = ModuleType("gi")
+    """Enable warning capture when module is imported in debug mode.
 
-    def require_version(*args, **kwargs):
-        _ = (args, kwargs)
-        return None
+    The session-wide GI stubs are already resident in ``sys.modules``.
+    """
+    gi_imports = []
 
-    monkeypatch.setattr(
-        gi_mod,
-        "require_version",
-        require_version,
-        raising=False,
-    )
-    gtk_mod = DummyGtkModule("gi.repository.Gtk")
-    glib_mod = DummyGLibModule("gi.repository.GLib")
-    gdkpixbuf_mod = DummyGdkPixbufModule("gi.repository.GdkPixbuf")
-    app_mod = DummyAppIndicatorModule("gi.repository.AyatanaAppIndicator3")
-
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository",
-        ModuleType("gi.repository"),
-    )
-    monkeypatch.setitem(sys.modules, "gi.repository.Gtk", gtk_mod)
-    monkeypatch.setitem(sys.modules, "gi.repository.GLib", glib_mod)
-    monkeypatch.setitem(sys.modules, "gi.repository.GdkPixbuf", gdkpixbuf_mod)
-    monkeypatch.setitem(
-        sys.modules,
-        "gi.repository.AyatanaAppIndicator3",
-        app_mod,
-    )
-
-    original_import_module = importlib.import_module
-
-    def fake_import_module(name):
-        """Resolve mocked GI modules while importing debug module."""
-        if name == "gi.repository.Gtk":
-            return gtk_mod
-        if name == "gi.repository.GLib":
-            return glib_mod
-        if name == "gi.repository.GdkPixbuf":
-            return gdkpixbuf_mod
-        if name == "gi.repository.AyatanaAppIndicator3":
-            return app_mod
-        return original_import_module(name)
+    def fake_import_module(name, package=None):
+        """Record GI lookups while importing the debug module."""
+        if name.startswith("gi.repository."):
+            gi_imports.append(name)
+        return _fake_gi_import(name, package)
 
     monkeypatch.setattr(importlib, "import_module", fake_import_module)
-    monkeypatch.setattr(
-        subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=1, stdout="", stderr=""),
-    )
+    monkeypatch.setattr(subprocess, "run", _run_fail)
     monkeypatch.setattr(os, "getpid", lambda: 11111)
 
     captured = {"enabled": False}
@@ -4125,23 +5313,11 @@ def test_debug_mode_import_enables_warning_capture(monkeypatch, tmp_path):
         lambda enabled: captured.__setitem__("enabled", enabled),
     )
 
-    module_name = "lmstudio_tray_debug"
-    sys.modules.pop(module_name, None)
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["lmstudio_tray.py", "--debug", "m", str(tmp_path)]
-        spec = importlib.util.spec_from_file_location(
-            module_name,
-            str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
-        )
-        assert spec is not None and spec.loader is not None  # nosec B101
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        module.main()
-        assert captured["enabled"] is True  # nosec B101
-    finally:
-        sys.argv = old_argv
+    sys.argv = ["lmstudio_tray.py", "--debug", "m", str(tmp_path)]
+    module = _exec_tray_module(monkeypatch, "lmstudio_tray_debug")
+    module.main()
+    assert captured["enabled"] is True  # nosec B101
+    assert len(gi_imports) == len(set(gi_imports))  # nosec B101
 
 
 def test_trayicon_constructor_sets_indicator_and_timer(
@@ -4174,11 +5350,6 @@ def test_trayicon_constructor_idle_add(monkeypatch, tray_module):
     monkeypatch.setattr(
         tray_module.TrayIcon, "check_model", lambda _self: True
     )
-    monkeypatch.setattr(
-        tray_module.GLib,
-        "timeout_add_seconds",
-        lambda *_a, **_k: True,
-    )
     idle_calls = []
 
     def record_idle(callback):
@@ -4195,9 +5366,8 @@ def test_trayicon_constructor_idle_add(monkeypatch, tray_module):
     assert len(idle_calls) == 2  # nosec B101
 
 
-def test_maybe_auto_start_daemon(monkeypatch, tray_module):
+def test_maybe_auto_start_daemon(monkeypatch, tray_module, tray):
     """Auto-start always stops then starts daemon for fresh passkey."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(auto_start_val=True)
     tray.action_lock_until = 123.0
     calls = []
@@ -4220,9 +5390,8 @@ def test_maybe_auto_start_daemon(monkeypatch, tray_module):
     assert tray.action_lock_until == 0.0  # nosec B101
 
 
-def test_maybe_start_gui(monkeypatch, tray_module):
+def test_maybe_start_gui(monkeypatch, tray_module, tray):
     """Invoke GUI start path when enabled."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(gui_mode_val=True)
     calls = []
 
@@ -4235,47 +5404,37 @@ def test_maybe_start_gui(monkeypatch, tray_module):
 
 
 def test_get_llmster_cmd_permission_error_and_no_candidates(
-    tray_module,
-    monkeypatch,
+    tray_module, tray_handles, monkeypatch, home
 ):
     """Return None when llmster directory scan fails or finds no binaries."""
-    monkeypatch.setattr(tray_module.shutil, "which", lambda _x: None)
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: True)
-    monkeypatch.setattr(
-        tray_module.os,
-        "listdir",
-        lambda _p: (_ for _ in ()).throw(PermissionError("denied")),
-    )
+    monkeypatch.setattr(tray_handles.shutil, "which", lambda _x: None)
+    _make_llmster_install(home, ["v1"], executable=False)
     assert tray_module.get_llmster_cmd() is None  # nosec B101
 
-    monkeypatch.setattr(tray_module.os, "listdir", lambda _p: ["v1"])
-    monkeypatch.setattr(tray_module.os.path, "isfile", lambda _p: False)
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: False)
+    _call_member(tray_module, "_clear_path_resolver_cache")
+    monkeypatch.setattr(
+        tray_handles.os,
+        "scandir",
+        _raiser(PermissionError("denied")),
+    )
     assert tray_module.get_llmster_cmd() is None  # nosec B101
 
 
-def test_is_llmster_running_first_probe_match(tray_module, monkeypatch):
+def test_is_llmster_running_first_probe_match(
+    tray_module, fake_subprocess, monkeypatch
+):
     """Return running when first process probe succeeds."""
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=0),
-    )
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: None)
+    fake_subprocess.set_constant(_RC0)
     assert tray_module.is_llmster_running() is True  # nosec B101
 
 
-def test_is_llmster_running_second_probe_error(tray_module, monkeypatch):
+def test_is_llmster_running_second_probe_error(
+    tray_module, fake_subprocess, monkeypatch
+):
     """Return not running when fallback probe raises subprocess error."""
-    calls = {"count": 0}
-
-    def run_side_effect(*_args, **_kwargs):
-        """Fail second probe after first probe miss."""
-        calls["count"] += 1
-        if calls["count"] == 1:
-            return _completed(returncode=1)
-        raise subprocess.SubprocessError("fail")
-
-    monkeypatch.setattr(tray_module.subprocess, "run", run_side_effect)
+    monkeypatch.setattr(tray_module, "get_ps_cmd", lambda: None)
+    fake_subprocess.set_sequence([_RC1, subprocess.SubprocessError("fail")])
     assert tray_module.is_llmster_running() is False  # nosec B101
 
 
@@ -4291,49 +5450,45 @@ def test_run_safe_command_invalid_inputs(tray_module):
         _call_member(tray_module, "_run_safe_command", ["ls", "-l"])
 
 
-def test_is_llmster_running_file_not_found_error(tray_module, monkeypatch):
+def test_is_llmster_running_file_not_found_error(
+    tray_module, tray_handles, monkeypatch
+):
     """Return False when pgrep raises FileNotFoundError."""
     def raise_fnf(*_a, **_k):
         raise FileNotFoundError("pgrep not found")
-    monkeypatch.setattr(tray_module.subprocess, "run", raise_fnf)
+    monkeypatch.setattr(tray_handles.subprocess, "run", raise_fnf)
     assert tray_module.is_llmster_running() is False  # nosec B101
 
 
-def test_is_llmster_running_oserror_first_probe(tray_module, monkeypatch):
-    """Return False when first probe raises OSError."""
-    calls = {"count": 0}
-
-    def run_side_effect(*_a, **_k):
-        calls["count"] += 1
-        if calls["count"] == 1:
-            raise OSError("fail")
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray_module.subprocess, "run", run_side_effect)
+def test_is_llmster_running_oserror_first_probe(
+    tray_module, fake_subprocess
+):
+    """Return True when only the first probe raises OSError."""
+    fake_subprocess.set_sequence([OSError("fail"), _RC0])
     assert tray_module.is_llmster_running() is True  # nosec B101
 
 
-def test_get_desktop_app_pids_error_handling(tray_module, monkeypatch):
+def test_get_desktop_app_pids_error_handling(
+    tray_module, tray_handles, monkeypatch
+):
     """Return empty list when ps command fails or raises errors."""
-    monkeypatch.setattr(
-        tray_module.subprocess,
-        "run",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
+    monkeypatch.setattr(tray_handles.subprocess, "run", _run_fail)
     assert tray_module.get_desktop_app_pids() == []  # nosec B101
 
     def raise_oserror(*_a, **_k):
         raise OSError("fail")
-    monkeypatch.setattr(tray_module.subprocess, "run", raise_oserror)
+    monkeypatch.setattr(tray_handles.subprocess, "run", raise_oserror)
     assert tray_module.get_desktop_app_pids() == []  # nosec B101
 
     def raise_valueerror(*_a, **_k):
         raise ValueError("fail")
-    monkeypatch.setattr(tray_module.subprocess, "run", raise_valueerror)
+    monkeypatch.setattr(tray_handles.subprocess, "run", raise_valueerror)
     assert tray_module.get_desktop_app_pids() == []  # nosec B101
 
 
-def test_kill_existing_instances_errors(tray_module, monkeypatch):
+def test_kill_existing_instances_errors(
+    tray_module, tray_handles, monkeypatch
+):
     """Handle errors when terminating other instances."""
 
     monkeypatch.setattr(tray_module, "get_pgrep_cmd", lambda: None)
@@ -4358,28 +5513,28 @@ def test_kill_existing_instances_errors(tray_module, monkeypatch):
             errors_raised.append(err)
             raise err
 
-    monkeypatch.setattr(tray_module.os, "getpid", mock_getpid)
-    monkeypatch.setattr(tray_module.os, "kill", mock_kill)
+    monkeypatch.setattr(tray_handles.os, "getpid", mock_getpid)
+    monkeypatch.setattr(tray_handles.os, "kill", mock_kill)
     tray_module.kill_existing_instances()
     assert len(errors_raised) == 1  # nosec B101
 
 
-def test_get_daemon_status_oserror(tray_module, monkeypatch):
+def test_get_daemon_status_oserror(
+    tray_module, tray, tray_handles, monkeypatch
+):
     """Return not_found when daemon check raises OSError."""
-    tray = _make_tray_instance(tray_module)
 
     def raise_oserror(*_a, **_k):
         raise OSError("fail")
 
-    monkeypatch.setattr(tray_module.subprocess, "run", raise_oserror)
+    monkeypatch.setattr(tray_handles.subprocess, "run", raise_oserror)
     assert _call_member(tray, "get_daemon_status") == "not_found"  # nosec B101
 
 
 def test_get_desktop_app_status_appimage_search(
-    tray_module, monkeypatch, tmp_path
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
 ):
     """Find AppImage in search paths."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(
         tray_module, "get_desktop_app_pids", lambda: []
     )
@@ -4390,25 +5545,19 @@ def test_get_desktop_app_status_appimage_search(
     (apps_dir / "LM Studio.AppImage").touch()
 
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda p: str(apps_dir) if "Apps" in p else "/nonexistent",
     )
 
-    def is_apps_dir(p):
-        return apps_dir in Path(p).parents or str(p) == str(apps_dir)
-
-    monkeypatch.setattr(tray_module.os.path, "isdir", is_apps_dir)
-
     result = _call_member(tray, "get_desktop_app_status")
     assert result == "stopped"  # nosec B101
 
 
 def test_get_desktop_app_status_ignores_bench_appimage(
-    tray_module, monkeypatch, tmp_path
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
 ):
     """Do not treat LM-Studio-Bench AppImage as desktop app install."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
     monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: None)
 
@@ -4417,12 +5566,12 @@ def test_get_desktop_app_status_ignores_bench_appimage(
     (apps_dir / "LM-Studio-Bench-x86_64.AppImage").touch()
 
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda p: str(apps_dir) if "Apps" in p else "/nonexistent",
     )
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "isdir",
         lambda p: str(p) == str(apps_dir),
     )
@@ -4460,28 +5609,95 @@ def test_is_lm_studio_appimage_label_variants(tray_module):
     )
 
 
+def test_find_lm_studio_appimage_skips_directories(tray_module, tmp_path):
+    """Pick the first matching regular file and ignore matching dirs."""
+    find = getattr(tray_module, "_find_lm_studio_appimage")
+    assert find(str(tmp_path)) is None  # nosec B101
+
+    (tmp_path / "LM-Studio-0.9.AppImage").mkdir()
+    (tmp_path / "LM-Studio-2.0.AppImage").write_text("", encoding="utf-8")
+    (tmp_path / "LM-Studio-1.0.AppImage").write_text("", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+
+    expected = str(tmp_path / "LM-Studio-1.0.AppImage")
+    assert find(str(tmp_path)) == expected  # nosec B101
+
+
+def test_find_lm_studio_appimage_checks_only_winning_names(
+    tray_module, tray_handles, monkeypatch, tmp_path
+):
+    """Only stat entries whose name would replace the current pick."""
+    checked = []
+    monkeypatch.setattr(
+        DummyDirEntry,
+        "is_file",
+        lambda entry: checked.append(entry.name) or True,
+    )
+    monkeypatch.setattr(
+        tray_handles.os,
+        "scandir",
+        _fake_scandir(
+            "LM-Studio-1.0.AppImage",
+            "LM-Studio-2.0.AppImage",
+            "Other.AppImage",
+            "LM-Studio-0.9.AppImage",
+        ),
+    )
+    find = getattr(tray_module, "_find_lm_studio_appimage")
+
+    expected = str(tmp_path / "LM-Studio-0.9.AppImage")
+    assert find(str(tmp_path)) == expected  # nosec B101
+    assert checked == [  # nosec B101
+        "LM-Studio-1.0.AppImage",
+        "LM-Studio-0.9.AppImage",
+    ]
+
+
+def test_find_lm_studio_appimage_caches_by_mtime(
+    tray_module, tray_handles, monkeypatch, tmp_path
+):
+    """Rescan a directory only after its entries change."""
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(
+        tray_handles.os,
+        "scandir",
+        lambda path: scans.append(path) or real_scandir(path),
+    )
+    find = getattr(tray_module, "_find_lm_studio_appimage")
+    (tmp_path / "LM-Studio.AppImage").write_text("", encoding="utf-8")
+    expected = str(tmp_path / "LM-Studio.AppImage")
+
+    assert find(str(tmp_path)) == expected  # nosec B101
+    assert find(str(tmp_path)) == expected  # nosec B101
+    assert len(scans) == 1  # nosec B101
+
+    (tmp_path / "LM-Studio.AppImage").unlink()
+    os.utime(tmp_path, ns=(0, 0))
+    assert find(str(tmp_path)) is None  # nosec B101
+    assert len(scans) == 2  # nosec B101
+
+
 def test_get_desktop_app_status_permission_error(
-    tray_module, monkeypatch
+    tray_module, tray, tray_handles, monkeypatch, tmp_path
 ):
     """Handle PermissionError during AppImage search."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
     monkeypatch.setattr(tray_module, "get_dpkg_cmd", lambda: None)
+    tray_module.sync_app_state_for_tests(script_dir_val=str(tmp_path))
 
     def raise_permission(*_a):
         raise PermissionError("denied")
 
-    monkeypatch.setattr(tray_module.os.path, "isdir", lambda _p: True)
-    monkeypatch.setattr(tray_module.os, "listdir", raise_permission)
+    monkeypatch.setattr(tray_handles.os, "scandir", raise_permission)
 
     result = _call_member(tray, "get_desktop_app_status")
     assert result == "not_found"  # nosec B101
 
 
-def test_start_daemon_runtime_error(tray_module, monkeypatch):
+def test_start_daemon_runtime_error(tray_module, action_tray, monkeypatch):
     """Handle RuntimeError when starting daemon."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(
         tray, "_build_daemon_attempts", lambda _x: [["/usr/bin/llmster"]]
     )
@@ -4496,22 +5712,18 @@ def test_start_daemon_runtime_error(tray_module, monkeypatch):
         call_count["count"] += 1
         if call_count["count"] == 1:
             raise RuntimeError("daemon fail")
-        return _completed(returncode=0)
+        return _RC0
 
     monkeypatch.setattr(
         tray, "_run_validated_command", raise_runtime_on_daemon
     )
-    monkeypatch.setattr(
-        tray_module.GLib, "timeout_add_seconds", lambda *_a: True
-    )
     _call_member(tray, "start_daemon", None)  # Should handle error
     assert call_count["count"] >= 2  # nosec B101  # Daemon + notification
 
 
-def test_stop_daemon_error_paths(tray_module, monkeypatch):
+def test_stop_daemon_error_paths(tray_module, action_tray, monkeypatch):
     """Cover error handling in stop_daemon."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(
         tray, "_build_daemon_attempts", lambda _x: ["/usr/bin/llmster"]
     )
@@ -4522,89 +5734,68 @@ def test_stop_daemon_error_paths(tray_module, monkeypatch):
     _call_member(tray, "stop_daemon", None)  # Should call force stop
 
 
-def test_start_desktop_app_with_notifications(tray_module, monkeypatch):
+def test_start_desktop_app_with_notifications(
+    tray_module, start_desktop_tray, monkeypatch
+):
     """Cover notification path when starting desktop app."""
-    tray = _make_tray_instance(tray_module)
-
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    monkeypatch.setattr(
-        tray_module.os.path, "isfile", lambda _p: True
-    )
-    monkeypatch.setattr(tray_module.os, "access", lambda _p, _m: True)
-    monkeypatch.setattr(
-        tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
-    )
-
-    notifications = []
+    tray = start_desktop_tray
 
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
+    _stub_executables(monkeypatch, tray_module)
 
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     _call_member(tray, "start_desktop_app", None)
     assert len(notifications) > 0  # nosec B101
 
 
-def test_stop_desktop_app_no_pids(tray_module, monkeypatch):
+def test_stop_desktop_app_no_pids(tray_module, action_tray, monkeypatch):
     """Handle no running processes when stopping desktop app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
+    tray = action_tray
     monkeypatch.setattr(tray_module, "get_desktop_app_pids", lambda: [])
     monkeypatch.setattr(
         tray_module, "get_notify_send_cmd", lambda: "/usr/bin/notify-send"
     )
 
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     _call_member(tray, "stop_desktop_app", None)
     assert len(notifications) > 0  # nosec B101
     assert any("No running" in str(n) for n in notifications)  # nosec B101
 
 
-def test_stop_desktop_app_success_and_failure(tray_module, monkeypatch):
+def test_stop_desktop_app_success_and_failure(
+    tray_module, action_tray, monkeypatch
+):
     """Cover success and failure paths when stopping desktop app."""
-    tray = _make_tray_instance(tray_module)
-    monkeypatch.setattr(tray, "begin_action_cooldown", lambda _x: True)
-    pids_list = [[123, 456], [789]]
+    tray = action_tray
+    pids_list = collections.deque([[123, 456], [789]])
     monkeypatch.setattr(
-        tray_module, "get_desktop_app_pids", lambda: pids_list.pop(0)
+        tray_module, "get_desktop_app_pids", pids_list.popleft
     )
     monkeypatch.setattr(
         tray_module,
         "get_notify_send_cmd",
         lambda: "/usr/bin/notify-send",
     )
-    stop_results = [True, False]
+    stop_results = collections.deque([True, False])
 
     def mock_stop():
-        return stop_results.pop(0)
+        return stop_results.popleft()
 
     monkeypatch.setattr(tray, "_stop_desktop_app_processes", mock_stop)
 
-    notifications = []
-
-    def capture_notify(cmd):
-        notifications.append(cmd)
-        return _completed(returncode=0)
-
-    monkeypatch.setattr(tray, "_run_validated_command", capture_notify)
+    notifications = DummyCallRecorder()
+    monkeypatch.setattr(tray, "_run_validated_command", notifications)
 
     _call_member(tray, "stop_desktop_app", None)
     _call_member(tray, "stop_desktop_app", None)
     assert len(notifications) >= 2  # nosec B101
 
 
-def test_run_daemon_attempts_invalid_command_format(tray_module):
+def test_run_daemon_attempts_invalid_command_format(tray_module, tray):
     """Skip invalid command formats in _run_daemon_attempts."""
-    tray = _make_tray_instance(tray_module)
 
     attempts = ["not_a_list", {"invalid": "dict"}, 123]
     result = _call_member(
@@ -4619,9 +5810,8 @@ def test_run_daemon_attempts_invalid_command_format(tray_module):
     assert result is None  # nosec B101
 
 
-def test_get_status_indicator_all_states(tray_module):
+def test_get_status_indicator_all_states(tray_module, tray):
     """Test all status indicator variants."""
-    tray = _make_tray_instance(tray_module)
     running = _call_member(
         tray, "get_status_indicator", "running"
     )
@@ -4640,9 +5830,8 @@ def test_get_status_indicator_all_states(tray_module):
     assert unknown == "🔴"  # nosec B101
 
 
-def test_quit_app(tray_module, monkeypatch):
+def test_quit_app(tray_module, tray, monkeypatch):
     """Test quit_app method."""
-    tray = _make_tray_instance(tray_module)
     quit_called = {"value": False}
 
     def mock_quit():
@@ -4653,9 +5842,8 @@ def test_quit_app(tray_module, monkeypatch):
     assert quit_called["value"] is True  # nosec B101
 
 
-def test_show_status_dialog_lms_not_found(tray_module, monkeypatch):
+def test_show_status_dialog_lms_not_found(tray_module, tray, monkeypatch):
     """Test show_status_dialog when lms is not found."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: None)
 
     dialogs = []
@@ -4702,80 +5890,73 @@ def test_show_status_dialog_lms_not_found(tray_module, monkeypatch):
             """
 
     monkeypatch.setattr(tray_module.Gtk, "MessageDialog", CaptureDialog)
-    _call_member(tray, "show_status_dialog", None)
-    assert len(dialogs) > 0  # nosec B101
-
-
-def test_parse_args_short_hand_debug_flag(tray_module):
-    """Parse -d short-hand flag for --debug."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "-d"]
-        args = tray_module.parse_args()
-        assert args.debug is True  # nosec B101
-    finally:
-        sys.argv = old_argv
-
-
-def test_parse_args_short_hand_auto_start_daemon(tray_module):
-    """Parse -a short-hand flag for --auto-start-daemon."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "-a"]
-        args = tray_module.parse_args()
-        assert args.auto_start_daemon is True  # nosec B101
-    finally:
-        sys.argv = old_argv
+    _call_member(tray, "show_status_dialog", None)
+    assert len(dialogs) > 0  # nosec B101
 
 
-def test_parse_args_short_hand_gui_flag(tray_module):
-    """Parse -g short-hand flag for --gui."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "-g"]
+_PARSE_ARGS_CASES = [
+    (("-d",), {"debug": True}),
+    (("-a",), {"auto_start_daemon": True}),
+    (("-g",), {"gui": True}),
+    # -v exits in real usage; parse_args itself only records the flag.
+    (("-v",), {"version": True}),
+    (("-dga",), {"debug": True, "gui": True, "auto_start_daemon": True}),
+    (
+        ("--debug", "--gui", "--auto-start-daemon"),
+        {"debug": True, "gui": True, "auto_start_daemon": True},
+    ),
+    (
+        ("--auto-start-daemon", "--gui"),
+        {"debug": False, "gui": True, "auto_start_daemon": True},
+    ),
+]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "cli, expected",
+    _PARSE_ARGS_CASES,
+    ids=[" ".join(cli) for cli, _expected in _PARSE_ARGS_CASES],
+)
+def test_parse_args_flags(tray_module, cli, expected):
+    """Parse short- and long-hand flags from ``sys.argv``."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, "argv", ["lmstudio_tray.py", *cli])
         args = tray_module.parse_args()
-        assert args.gui is True  # nosec B101
-    finally:
-        sys.argv = old_argv
+    actual = {name: getattr(args, name) for name in expected}
+    assert actual == expected
 
 
-def test_parse_args_short_hand_version_flag(tray_module):
-    """Parse -v short-hand flag for --version (exits in real usage)."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "-v"]
-        args = tray_module.parse_args()
-        assert args.version is True  # nosec B101
-    finally:
-        sys.argv = old_argv
+@pytest.mark.fast
+@pytest.mark.parametrize("n", [10, 100, 1000])
+def test_parse_args_repeated_flags_scale_linearly(tray_module, n):
+    """Parsing many repeated optionals must not degrade quadratically.
 
+    CPU time is measured so parallel workers competing for cores do not
+    inflate the result.
+    """
+    start = time.process_time()
+    args = tray_module.parse_args(["--debug"] * n)
+    elapsed = time.process_time() - start
+    assert args.debug
+    assert elapsed < 0.5
 
-def test_parse_args_combined_short_hand_flags(tray_module):
-    """Parse multiple short-hand flags combined."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "-dga"]
-        args = tray_module.parse_args()
-        assert args.debug is True  # nosec B101
-        assert args.gui is True  # nosec B101
-        assert args.auto_start_daemon is True  # nosec B101
-    finally:
-        sys.argv = old_argv
 
+@pytest.mark.fast
+def test_parse_args_reuses_parser_and_resolves_default_dir(
+    tray_module, monkeypatch
+):
+    """Build the parser once and resolve the default script_dir per call."""
+    build_parser = getattr(tray_module, "_build_parser")
+    assert build_parser() is build_parser()
 
-def test_parse_args_long_hand_still_works(tray_module):
-    """Verify long-hand flags still work after adding short-hand."""
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "--debug", "--gui", "--auto-start-daemon"]
-        args = tray_module.parse_args()
-        assert args.debug is True  # nosec B101
-        assert args.gui is True  # nosec B101
-        assert args.auto_start_daemon is True  # nosec B101
-    finally:
-        sys.argv = old_argv
+    monkeypatch.setattr(
+        tray_module, "_get_default_script_dir", lambda: "/opt/tray"
+    )
+    assert tray_module.parse_args([]).script_dir == "/opt/tray"
 
 
+@pytest.mark.fast
 def test_parse_args_script_dir_normalized(tmp_path, tray_module):
     """When the user provides a relative script directory it becomes
     absolute after applying CLI args.
@@ -4790,33 +5971,24 @@ def test_parse_args_script_dir_normalized(tmp_path, tray_module):
     rel = "relative/dir"
     abs_dir = os.path.abspath(os.path.join(str(base), rel))
 
-    old_argv = sys.argv[:]
-    try:
-        sys.argv = ["prog", "mymodel", rel]
-        args = tray_module.parse_args()
-        _call_member(tray_module, "_AppState").apply_cli_args(args)
-        assert (
-            _call_member(tray_module, "_AppState").script_dir  # nosec B101
-            == os.path.abspath(rel)
-        )
-        assert os.path.isabs(
-            _call_member(tray_module, "_AppState").script_dir
-        )  # nosec B101
-        sys.argv = ["prog", "mymodel", abs_dir]
-        args2 = tray_module.parse_args()
-        _call_member(tray_module, "_AppState").apply_cli_args(args2)
-        assert (
-            _call_member(tray_module, "_AppState").script_dir == abs_dir
-        )  # nosec B101
-    finally:
-        sys.argv = old_argv
+    parse = tray_module.parse_args
+    app_state = _state(tray_module)
 
+    app_state.apply_cli_args(parse(["mymodel", rel]))
+    assert app_state.script_dir == os.path.abspath(rel)
+    assert os.path.isabs(app_state.script_dir)
 
+    app_state.apply_cli_args(parse(["mymodel", abs_dir]))
+    assert app_state.script_dir == abs_dir
+
+
+@pytest.mark.fast
 def test_validate_url_scheme_valid_http(tray_module):
     """Validate that _validate_url_scheme accepts http URLs."""
     _call_member(tray_module, "_validate_url_scheme", "http://localhost:1234")
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_valid_https(tray_module):
     """Validate that _validate_url_scheme accepts https URLs."""
     _call_member(
@@ -4824,12 +5996,14 @@ def test_validate_url_scheme_valid_https(tray_module):
     )
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_invalid_file(tray_module):
     """Reject file:// URLs for security."""
     with pytest.raises(ValueError, match="scheme 'file' not permitted"):
         _call_member(tray_module, "_validate_url_scheme", "file:///etc/passwd")
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_invalid_ftp(tray_module):
     """Reject ftp:// URLs for security."""
     with pytest.raises(ValueError, match="scheme 'ftp' not permitted"):
@@ -4839,253 +6013,72 @@ def test_validate_url_scheme_invalid_ftp(tray_module):
 
 
 def test_show_status_dialog_api_fallback_lms_fail(
-    tray_module, monkeypatch
+    tray_module, tray, tray_handles, monkeypatch
 ):
     """Test show_status_dialog API fallback when lms ps fails."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
-
-    api_response = {
-        "data": [
-            {"id": "mistralai/mistral-7b", "loaded": True},
-            {"id": "openai/gpt-3", "loaded": True},
-        ]
-    }
-
-    def mock_urlopen_json(*_a, **_k):
-        response = DummyContextManager()
-        response.payload = json.dumps(api_response).encode("utf-8")
-        return response
-
-    class DummyContextManager:
-        """Dummy context manager for testing purposes.
-
-        This class simulates a context manager that can be used in
-        with statements. It provides a read() method that returns a
-        payload and supports the context manager protocol via
-        __enter__ and __exit__ methods.
-
-        Attributes:
-            payload (bytes): The data returned by read(). Defaults
-                to an empty bytes object.
-        """
-        payload = b""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            ...
-
-        def read(self):
-            """
-            Retrieve the payload data.
-
-            Returns:
-                Any: The payload data stored in this object.
-            """
-            return self.payload
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
 
-    monkeypatch.setattr(
-        tray_module.urllib_request, "urlopen", mock_urlopen_json
+    response = DummyUrlResponse(
+        b'{"data": [{"id": "mistralai/mistral-7b", "loaded": true},'
+        b' {"id": "openai/gpt-3", "loaded": true}]}'
     )
+    _serve_api(monkeypatch, tray_handles, response)
 
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "Models loaded via desktop app:" in dialog.secondary  # nosec
 
 
 def test_show_status_dialog_api_fallback_no_lms(
-    tray_module, monkeypatch
+    tray_module, tray, tray_handles, monkeypatch
 ):
     """Test show_status_dialog API fallback when lms not available."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: None)
 
-    api_response = {
-        "data": [{"id": "meta/llama2", "loaded": True}]
-    }
-
-    def mock_urlopen_json(*_a, **_k):
-        response = DummyContextManager()
-        response.payload = json.dumps(api_response).encode("utf-8")
-        return response
-
-    class DummyContextManager:
-        """A dummy context manager for testing purposes.
-
-        This class simulates a context manager that holds a
-        payload of bytes data. It can be used in with statements
-        and provides a read method to retrieve the stored payload.
-        """
-        payload = b""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            ...
-
-        def read(self):
-            """Retrieve the payload data.
-
-            Returns:
-                The payload content stored in this instance.
-            """
-            return self.payload
-
-    monkeypatch.setattr(
-        tray_module.urllib_request, "urlopen", mock_urlopen_json
+    response = DummyUrlResponse(
+        b'{"data": [{"id": "meta/llama2", "loaded": true}]}'
     )
+    _serve_api(monkeypatch, tray_handles, response)
 
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "Models loaded via desktop app:" in dialog.secondary  # nosec B101
 
 
 def test_show_status_dialog_api_invalid_json(
-    tray_module, monkeypatch
+    tray_module, tray, tray_handles, monkeypatch
 ):
     """Test show_status_dialog with invalid JSON from API."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
-
-    def mock_urlopen_bad(*_a, **_k):
-        response = DummyContextManager()
-        response.payload = b"invalid json"
-        return response
-
-    class DummyContextManager:
-        """A dummy context manager for testing purposes.
-
-        This class simulates a context manager that holds a
-        payload of bytes data. It can be used in with statements
-        and provides a read() method to retrieve the stored
-        payload.
-
-        Attributes:
-            payload (bytes): The data payload stored in this
-                context manager.
-        """
-        payload = b""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            ...
-
-        def read(self):
-            """Return the payload data stored in this object.
-
-            Returns:
-                The payload data.
-            """
-            return self.payload
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
 
-    monkeypatch.setattr(
-        tray_module.urllib_request, "urlopen", mock_urlopen_bad
-    )
+    _serve_api(monkeypatch, tray_handles, DummyUrlResponse(b"invalid json"))
 
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary  # nosec B101
 
 
 def test_show_status_dialog_api_non_dict_response(
-    tray_module, monkeypatch
+    tray_module, tray, tray_handles, monkeypatch
 ):
     """Test show_status_dialog with non-dict from API."""
-    tray = _make_tray_instance(tray_module)
     monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
-    monkeypatch.setattr(
-        tray_module,
-        "_run_safe_command",
-        lambda *_a, **_k: _completed(returncode=1, stdout=""),
-    )
-
-    class DummyContextManager:
-        """Dummy context manager for API response testing."""
-
-        payload = b""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            ...
-
-        def read(self):
-            """
-            Retrieve the payload data.
-
-            Returns:
-                The stored payload object.
-            """
-            return self.payload
-
-    def mock_urlopen_list(*_a, **_k):
-        """Return a list instead of dict to test error handling."""
-        response = DummyContextManager()
-        response.payload = b"[]"
-        return response
+    monkeypatch.setattr(tray_module, "_run_safe_command", _run_fail)
 
-    monkeypatch.setattr(
-        tray_module.urllib_request, "urlopen", mock_urlopen_list
-    )
+    _serve_api(monkeypatch, tray_handles, DummyUrlResponse(b"[]"))
 
     tray.show_status_dialog(None)
-    dialog = tray_module.Gtk.MessageDialog.last_instance
+    dialog = _last_dialog(DummyMessageDialog)
     assert "No models loaded" in dialog.secondary  # nosec B101
 
 
-def test_check_api_models_with_invalid_data(tray_module, monkeypatch):
+def test_check_api_models_with_invalid_data(
+    tray_module, tray_handles, monkeypatch
+):
     """Test check_api_models with invalid data structure."""
-
-    def mock_urlopen_invalid(*_a, **_k):
-        response = DummyContextManager()
-        response.payload = json.dumps({"invalid": "structure"}).encode(
-            "utf-8"
-        )
-        return response
-
-    class DummyContextManager:
-        """
-        Dummy context manager for API response testing.
-        This class simulates a context manager that can be used in
-        with statements. It provides a read() method that returns a
-        payload and supports the context manager protocol via
-        __enter__ and __exit__ methods."""
-
-        payload = b""
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, *args):
-            ...
-
-        def read(self):
-            """
-            Read and return the payload data.
-
-            Returns:
-                The payload content stored in the instance."""
-            return self.payload
-
-    monkeypatch.setattr(
-        tray_module.urllib_request, "urlopen", mock_urlopen_invalid
-    )
+    _serve_api(monkeypatch, tray_handles, _API_INVALID_STRUCTURE_RESPONSE)
 
     result = tray_module.check_api_models()
     assert result is False  # nosec B101
@@ -5107,18 +6100,6 @@ def test_get_default_script_dir_fallback_to_cwd(tray_module, monkeypatch):
     assert result == "/fallback/directory"  # nosec B101
 
 
-def test_parse_args_both_flags_true(tray_module, monkeypatch):
-    """Test parsing when both --auto-start-daemon and --gui are provided."""
-    monkeypatch.setattr(
-        sys,
-        "argv",
-        ["lmstudio_tray.py", "--auto-start-daemon", "--gui"]
-    )
-    args = tray_module.parse_args()
-    assert args.auto_start_daemon is True  # nosec B101
-    assert args.gui is True  # nosec B101
-
-
 def test_get_default_script_dir_with_none_argv(tray_module, monkeypatch):
     """Test _get_default_script_dir when sys.argv[0] is None."""
     monkeypatch.setattr(sys, "argv", [None])
@@ -5185,12 +6166,12 @@ def test_get_asset_path_returns_none_when_missing(
 
 
 def test_save_config_replace_failure_removes_tmp(
-    tray_module, tmp_path, monkeypatch
+    tray_module, tray_handles, tmp_path, monkeypatch
 ):
     """Clean up temporary file if final replace fails."""
     config_file = tmp_path / "config.json"
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _p: str(config_file),
     )
@@ -5198,7 +6179,7 @@ def test_save_config_replace_failure_removes_tmp(
     def _raise_replace(_src, _dst):
         raise OSError("replace failed")
 
-    monkeypatch.setattr(tray_module.os, "replace", _raise_replace)
+    monkeypatch.setattr(tray_handles.os, "replace", _raise_replace)
 
     with pytest.raises(OSError):
         tray_module.save_config("host", 1234)
@@ -5207,12 +6188,12 @@ def test_save_config_replace_failure_removes_tmp(
 
 
 def test_save_config_replace_failure_remove_failure(
-    tray_module, tmp_path, monkeypatch
+    tray_module, tray_handles, tmp_path, monkeypatch
 ):
     """Keep original error when tmp cleanup also fails."""
     config_file = tmp_path / "config.json"
     monkeypatch.setattr(
-        tray_module.os.path,
+        tray_handles.ospath,
         "expanduser",
         lambda _p: str(config_file),
     )
@@ -5223,13 +6204,14 @@ def test_save_config_replace_failure_remove_failure(
     def _raise_remove(_path):
         raise OSError("remove failed")
 
-    monkeypatch.setattr(tray_module.os, "replace", _raise_replace)
-    monkeypatch.setattr(tray_module.os, "remove", _raise_remove)
+    monkeypatch.setattr(tray_handles.os, "replace", _raise_replace)
+    monkeypatch.setattr(tray_handles.os, "remove", _raise_remove)
 
     with pytest.raises(OSError):
         tray_module.save_config("host", 1234)
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_invalid_host_with_whitespace(tray_module):
     """Reject hosts containing whitespace."""
     tray_module.sync_app_state_for_tests(api_host_val="bad host")
@@ -5239,6 +6221,7 @@ def test_validate_url_scheme_invalid_host_with_whitespace(tray_module):
         _call_member(tray_module, "_validate_url_scheme", "http://x")
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_invalid_host_with_path_chars(tray_module):
     """Reject hosts containing slash/query/hash delimiters."""
     tray_module.sync_app_state_for_tests(api_host_val="example.com/path")
@@ -5248,6 +6231,7 @@ def test_validate_url_scheme_invalid_host_with_path_chars(tray_module):
         _call_member(tray_module, "_validate_url_scheme", "http://x")
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_invalid_single_colon_host(tray_module):
     """Reject host:port literals in API_HOST.
 
@@ -5260,6 +6244,7 @@ def test_validate_url_scheme_invalid_single_colon_host(tray_module):
         _call_member(tray_module, "_validate_url_scheme", "http://x")
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_wraps_ipv6_host(tray_module):
     """Wrap bare IPv6 hosts in brackets when building endpoint URL."""
     tray_module.sync_app_state_for_tests(api_host_val="2001:db8::1")
@@ -5269,6 +6254,7 @@ def test_validate_url_scheme_wraps_ipv6_host(tray_module):
     assert result == "http://[2001:db8::1]:1234"  # nosec B101
 
 
+@pytest.mark.fast
 def test_validate_url_scheme_rejects_invalid_port(tray_module):
     """Reject out-of-range API ports."""
     tray_module.sync_app_state_for_tests(api_host_val="localhost")
@@ -5278,20 +6264,20 @@ def test_validate_url_scheme_rejects_invalid_port(tray_module):
         _call_member(tray_module, "_validate_url_scheme", "http://x")
 
 
-def test_show_config_dialog_without_gtk_logs_error(tray_module, monkeypatch):
+def test_show_config_dialog_without_gtk_logs_error(
+    tray_module, tray, monkeypatch
+):
     """Return early when GTK module is unavailable."""
-    tray = _make_tray_instance(tray_module)
-    app_state = _call_member(tray_module, "_AppState")
+    app_state = _state(tray_module)
     monkeypatch.setattr(app_state, "Gtk", None)
 
     tray.show_config_dialog(None)
 
 
 def test_show_config_dialog_save_error_shows_error_dialog(
-    tray_module, monkeypatch
+    tray_module, tray, monkeypatch
 ):
     """Display a GTK error dialog when save_config raises."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(
         api_host_val="localhost",
         api_port_val=1234,
@@ -5318,16 +6304,17 @@ def test_show_config_dialog_save_error_shows_error_dialog(
 
     tray.show_config_dialog(None)
 
-    error_dialog = tray_module.Gtk.MessageDialog.last_instance
+    error_dialog = _last_dialog(DummyMessageDialog)
     assert error_dialog is not None  # nosec B101
     assert error_dialog.ran is True  # nosec B101
     assert error_dialog.destroyed is True  # nosec B101
     assert "Failed to save configuration" in error_dialog.text  # nosec B101
 
 
-def test_show_config_dialog_invalid_input_warns(tray_module, monkeypatch):
+def test_show_config_dialog_invalid_input_warns(
+    tray_module, tray, monkeypatch
+):
     """Do not save when host/port input is invalid."""
-    tray = _make_tray_instance(tray_module)
     tray_module.sync_app_state_for_tests(
         api_host_val="",
         api_port_val="invalid",
@@ -5363,7 +6350,7 @@ def test_run_validated_command_adds_info_icon_to_notify(
 
     def _capture(command):
         calls.append(command)
-        return _completed(returncode=0)
+        return _RC0
 
     monkeypatch.setattr(tray_module, "_run_safe_command", _capture)
 
@@ -5382,7 +6369,7 @@ def test_run_validated_command_keeps_existing_icon(tray_module, monkeypatch):
 
     def _capture(command):
         calls.append(command)
-        return _completed(returncode=0)
+        return _RC0
 
     monkeypatch.setattr(tray_module, "_run_safe_command", _capture)
 
@@ -5395,9 +6382,101 @@ def test_run_validated_command_keeps_existing_icon(tray_module, monkeypatch):
     assert calls[0][2] == "✅ already"  # nosec B101
 
 
-def test_run_daemon_attempts_breaks_on_timeout(tray_module, monkeypatch):
+class DummyNotification:
+    """Stand-in for ``Notify.Notification`` recording shown messages."""
+
+    __slots__ = ("args",)
+
+    shown = []
+    fail = False
+
+    def __init__(self, *args):
+        """Store the summary, body and icon arguments."""
+        self.args = args
+
+    @classmethod
+    def new(cls, summary, body, icon):
+        """Mirror the libnotify constructor."""
+        return cls(summary, body, icon)
+
+    def show(self):
+        """Record the notification or raise like a GLib error."""
+        if DummyNotification.fail:
+            raise RuntimeError("no notification daemon")
+        DummyNotification.shown.append(self.args)
+
+
+def _load_dummy_libnotify(tray_module, monkeypatch, fail):
+    """Install a libnotify stand-in whose notifications may fail."""
+    monkeypatch.setattr(DummyNotification, "shown", [])
+    monkeypatch.setattr(DummyNotification, "fail", fail)
+    notify_module = ModuleType("gi.repository.Notify")
+    setattr(notify_module, "Notification", DummyNotification)
+    monkeypatch.setattr(_state(tray_module), "Notify", notify_module)
+
+
+@pytest.mark.parametrize("fail", [False, True], ids=["shown", "fallback"])
+def test_notify_uses_libnotify(tray_module, tray, monkeypatch, fail):
+    """Show notifications via libnotify, else spawn notify-send."""
+    _load_dummy_libnotify(tray_module, monkeypatch, fail)
+    lookups = []
+    monkeypatch.setattr(
+        tray_module,
+        "_which",
+        lambda name: lookups.append(name) or "/usr/bin/notify-send",
+    )
+    spawned = DummyCallRecorder()
+    monkeypatch.setattr(tray_module, "_run_safe_command", spawned)
+
+    assert _call_member(tray, "_notify", "Title", "message")  # nosec B101
+
+    if fail:
+        assert not DummyNotification.shown  # nosec B101
+        expected = ["/usr/bin/notify-send", "Title", "ℹ️ message"]
+        assert spawned == [expected]  # nosec B101
+    else:
+        expected = ("Title", "ℹ️ message", None)
+        assert DummyNotification.shown == [expected]  # nosec B101
+        assert not lookups  # nosec B101
+        assert not spawned  # nosec B101
+
+
+def test_notify_dropped_without_notify_send(tray_module, tray, monkeypatch):
+    """Drop the message when libnotify fails and notify-send is missing."""
+    _load_dummy_libnotify(tray_module, monkeypatch, True)
+    monkeypatch.setattr(tray_module, "_which", lambda _name: None)
+    spawned = DummyCallRecorder()
+    monkeypatch.setattr(tray_module, "_run_safe_command", spawned)
+
+    assert not _call_member(tray, "_notify", "Title", "✅ done")  # nosec B101
+    assert tray_module.get_notify_send_cmd() is None  # nosec B101
+    assert not spawned  # nosec B101
+
+
+def test_init_libnotify(tray_module, monkeypatch):
+    """Initialize libnotify when GI provides it and fail soft otherwise."""
+    notify_module = ModuleType("gi.repository.Notify")
+    setattr(notify_module, "init", lambda _name: True)
+    monkeypatch.setattr(
+        tray_module.importlib,
+        "import_module",
+        lambda _name: notify_module,
+    )
+    init_libnotify = getattr(tray_module, "_init_libnotify")
+    assert init_libnotify() is notify_module  # nosec B101
+
+    setattr(notify_module, "init", lambda _name: False)
+    assert init_libnotify() is None  # nosec B101
+
+    def missing(_name):
+        raise ImportError("no Notify typelib")
+
+    monkeypatch.setattr(tray_module.importlib, "import_module", missing)
+    assert init_libnotify() is None  # nosec B101
+
+
+def test_run_daemon_attempts_breaks_on_timeout(tray_module, tray, monkeypatch):
     """Stop daemon attempt loop when a command times out."""
-    tray = _make_tray_instance(tray_module)
 
     def _timeout(_command):
         raise subprocess.TimeoutExpired(cmd="cmd", timeout=1)
@@ -5415,33 +6494,27 @@ def test_run_daemon_attempts_breaks_on_timeout(tray_module, monkeypatch):
 
 
 def test_start_desktop_app_daemon_still_running_after_verification(
-    tray_module, monkeypatch
+    tray_module, start_desktop_tray, monkeypatch
 ):
     """Notify and abort GUI launch when daemon still runs after stop."""
-    tray = _make_tray_instance(tray_module)
+    tray = start_desktop_tray
     notify_calls = []
 
-    states = [False, True]
+    states = collections.deque([False, True])
 
     def _is_running():
-        return states.pop(0) if states else True
+        return states.popleft() if states else True
 
     def _capture_notify(command):
         notify_calls.append(command)
-        return _completed(returncode=0)
+        return _RC0
 
-    monkeypatch.setattr(tray_module, "get_lms_cmd", lambda: "/usr/bin/lms")
     monkeypatch.setattr(tray_module, "is_llmster_running", _is_running)
     monkeypatch.setattr(
         tray,
         "_stop_daemon_with_notification",
         lambda: (True, None),
     )
-    monkeypatch.setattr(
-        tray_module,
-        "get_notify_send_cmd",
-        lambda: "/usr/bin/notify-send",
-    )
     monkeypatch.setattr(tray, "_run_validated_command", _capture_notify)
 
     tray.start_desktop_app(None)
@@ -5454,13 +6527,9 @@ def test_start_desktop_app_daemon_still_running_after_verification(
     [(True, "emblem-default"), (False, "dialog-information")],
 )
 def test_check_model_daemon_running_without_lms_ps_uses_api(
-    tray_module,
-    monkeypatch,
-    api_has_models,
-    expected_icon,
+    tray_module, tray, monkeypatch, api_has_models, expected_icon
 ):
     """Use API fallback when daemon runs and lms-ps path is skipped."""
-    tray = _make_tray_instance(tray_module)
     tray.last_status = "WARN"
 
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
@@ -5479,10 +6548,9 @@ def test_check_model_daemon_running_without_lms_ps_uses_api(
 
 
 def test_check_model_app_running_lms_ps_no_models_sets_info(
-    tray_module, monkeypatch
+    tray_module, tray, monkeypatch
 ):
     """Set INFO when lms ps succeeds but reports no loaded model."""
-    tray = _make_tray_instance(tray_module)
     tray.last_status = "WARN"
 
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
@@ -5505,10 +6573,9 @@ def test_check_model_app_running_lms_ps_no_models_sets_info(
 
 
 def test_check_model_app_running_lms_ps_error_uses_api_false(
-    tray_module, monkeypatch
+    tray_module, tray, monkeypatch
 ):
     """Set INFO when lms ps fails and API reports no loaded models."""
-    tray = _make_tray_instance(tray_module)
     tray.last_status = "WARN"
 
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "stopped")
@@ -5531,10 +6598,9 @@ def test_check_model_app_running_lms_ps_error_uses_api_false(
 
 
 def test_check_model_any_running_without_lms_uses_api_true(
-    tray_module, monkeypatch
+    tray_module, tray, monkeypatch
 ):
     """Set OK when runtime is active and API reports loaded models."""
-    tray = _make_tray_instance(tray_module)
     tray.last_status = "WARN"
 
     monkeypatch.setattr(tray, "get_daemon_status", lambda: "running")
@@ -5550,6 +6616,8 @@ def test_check_model_any_running_without_lms_uses_api_true(
 class DummyRumpsMenuItem:
     """Lightweight rumps.MenuItem stub for testing."""
 
+    __slots__ = ("title", "callback", "_children")
+
     def __init__(self, title="", callback=None, **_kwargs):
         """Initialize a dummy menu item."""
         self.title = title
@@ -5564,6 +6632,8 @@ class DummyRumpsMenuItem:
 class DummyRumpsMenu:
     """Lightweight rumps.Menu stub."""
 
+    __slots__ = ("_items",)
+
     def __init__(self):
         """Initialize an empty menu."""
         self._items = []
@@ -5574,8 +6644,7 @@ class DummyRumpsMenu:
 
     def update(self, items):
         """Add new items to the menu."""
-        for item in items:
-            self._items.append(item)
+        self._items.extend(items)
 
     def __iter__(self):
         """Iterate over menu items."""
@@ -5664,55 +6733,50 @@ class DummyRumpsModule(ModuleType):
         cls._quit_called = False
 
 
-@pytest.fixture(name="macos_module")
-def macos_module_fixture(monkeypatch, tmp_path):
-    """Load lmstudio_tray with IS_MACOS=True and a rumps stub."""
-    rumps_stub = DummyRumpsModule("rumps")
-    DummyRumpsModule.reset()
-
-    monkeypatch.setitem(sys.modules, "rumps", rumps_stub)
+@pytest.fixture(name="macos_module_cached", scope="session")
+def macos_module_cached_fixture(gi_stub_modules, session_home):
+    """Import lmstudio_tray with IS_MACOS=True once per test session.
 
-    gi_mod = ModuleType("gi")
-    monkeypatch.setattr(
-        gi_mod,
-        "require_version",
-        lambda *_args, **_kwargs: None,
-        raising=False,
-    )
-    monkeypatch.setitem(sys.modules, "gi", gi_mod)
+    Mirrors ``tray_module_cached``: the module is executed a single time
+    against a rumps stub and yielded with a snapshot of its initial
+    state for the function-scoped ``macos_module`` fixture to restore.
+    """
+    _ = gi_stub_modules, session_home
+    rumps_stub = DummyRumpsModule("rumps")
+    restore = _install_modules({"rumps": rumps_stub})
+    try:
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(subprocess, "run", _safe_run)
+            module = _exec_tray_module(mp, "lmstudio_tray_macos")
+    finally:
+        restore()
 
-    def safe_run(*_args, **_kwargs):
-        """Return a safe default subprocess result during import."""
-        return _completed(returncode=1, stdout="", stderr="")
+    setattr(module, "IS_MACOS", True)
+    setattr(module, "_rumps_lib", rumps_stub)
+    setattr(module, "_RumpsBase", DummyRumpsApp)
+    return module, _snapshot_module_state(module)
 
-    monkeypatch.setattr(subprocess, "run", safe_run)
-    monkeypatch.setenv("HOME", str(tmp_path))
-    monkeypatch.setattr(os, "getpid", lambda: 99999)
 
-    module_name = "lmstudio_tray_macos"
-    sys.modules.pop(module_name, None)
-    spec = importlib.util.spec_from_file_location(
-        module_name,
-        str(Path(__file__).resolve().parents[1] / "lmstudio_tray.py"),
+@pytest.fixture(name="macos_module")
+def macos_module_fixture(macos_module_cached, monkeypatch, tmp_path):
+    """Provide the cached macOS tray module with per-test isolation."""
+    module, snapshot = macos_module_cached
+    DummyRumpsModule.reset()
+    monkeypatch.setattr(subprocess, "run", _safe_run)
+    monkeypatch.setattr(module, "PROC_ROOT", str(tmp_path / "no-proc"))
+    monkeypatch.setattr(
+        module, "DPKG_STATUS_PATH", str(tmp_path / "no-dpkg-status")
     )
-    if spec is None or spec.loader is None:
-        raise RuntimeError("Failed to create module spec or loader")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-
-    monkeypatch.setattr(module, "IS_MACOS", True)
-    monkeypatch.setattr(module, "_rumps_lib", rumps_stub)
-    monkeypatch.setattr(module, "_RumpsBase", DummyRumpsApp)
-
     yield module
+    _restore_module_state(module, snapshot)
 
 
-def _make_macos_tray(module):
-    """Build a partially initialised MacOSTrayIcon for unit tests."""
+@functools.lru_cache(maxsize=None)
+def _macos_tray_template(module):
+    """Build a partially initialised MacOSTrayIcon once per module."""
     tray = module.MacOSTrayIcon.__new__(module.MacOSTrayIcon)
     tray.title = "⚠️"
-    tray.menu = DummyRumpsMenu()
+    tray.menu = None
     tray.last_status = None
     tray.action_lock_until = 0.0
     tray.lms_ps_resume_at = 0.0
@@ -5736,6 +6800,16 @@ def _make_macos_tray(module):
     return tray
 
 
+def _make_macos_tray(module):
+    """Copy the MacOSTrayIcon template with fresh mutable state."""
+    tray = copy.copy(_macos_tray_template(module))
+    state = vars(tray)
+    state["menu"] = DummyRumpsMenu()
+    state["_desktop_detection"] = dict(state["_desktop_detection"])
+    state["_update_info"] = dict(state["_update_info"])
+    return tray
+
+
 def test_is_macos_flag_exists(tray_module):
     """IS_MACOS must be a boolean attribute on the module."""
     assert isinstance(tray_module.IS_MACOS, bool)  # nosec B101
@@ -6053,7 +7127,7 @@ def test_macos_check_model_ok_via_api(macos_module, monkeypatch):
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda _cmd: _completed(returncode=1, stdout="", stderr=""),
+        lambda _cmd: _RC1,
     )
     monkeypatch.setattr(macos_module, "check_api_models", lambda: True)
     tray.check_model()
@@ -6233,7 +7307,7 @@ def test_macos_stop_daemon_with_notification_success(
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda cmd: _completed(returncode=0),
+        lambda cmd: _RC0,
     )
     monkeypatch.setattr(macos_module, "is_llmster_running", lambda: False)
     monkeypatch.setattr(
@@ -6250,6 +7324,35 @@ def test_macos_stop_daemon_with_notification_success(
     )  # nosec B101
 
 
+def test_macos_stop_daemon_rescans_after_each_command(
+    macos_module, monkeypatch
+):
+    """Stop after the first command once a fresh scan shows llmster gone."""
+    tray = _make_macos_tray(macos_module)
+    DummyRumpsModule.reset()
+    monkeypatch.setattr(
+        macos_module, "get_lms_cmd", lambda: "/usr/local/bin/lms"
+    )
+    monkeypatch.setattr(macos_module, "get_llmster_cmd", lambda: None)
+    ran = []
+    monkeypatch.setattr(
+        macos_module,
+        "_run_safe_command",
+        lambda cmd: ran.append(cmd) or _RC0,
+    )
+    monkeypatch.setattr(
+        macos_module,
+        "_read_proc_lines",
+        lambda: [] if ran else ["20 /opt/llmster/bin/llmster"],
+    )
+    monkeypatch.setattr(tray, "_force_stop_llmster", lambda: None)
+
+    assert macos_module.is_llmster_running() is True  # nosec B101
+    stopped, _ = _call_member(tray, "_stop_daemon_with_notification")
+    assert stopped  # nosec B101
+    assert len(ran) == 1  # nosec B101
+
+
 def test_macos_stop_daemon_with_notification_fail(
     macos_module, monkeypatch
 ):
@@ -6302,7 +7405,7 @@ def test_macos_start_daemon_body_success(macos_module, monkeypatch):
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda cmd: _completed(returncode=0),
+        lambda cmd: _RC0,
     )
     monkeypatch.setattr(macos_module, "is_llmster_running", lambda: True)
     monkeypatch.setattr(tray, "_schedule_menu_refresh", lambda *_: None)
@@ -6314,7 +7417,9 @@ def test_macos_start_daemon_body_success(macos_module, monkeypatch):
     )  # nosec B101
 
 
-def test_macos_start_daemon_body_fail(macos_module, monkeypatch):
+def test_macos_start_daemon_body_fail(
+    macos_module, fake_clock, monkeypatch
+):
     """_start_daemon_body notifies on failure to start daemon."""
     tray = _make_macos_tray(macos_module)
     DummyRumpsModule.reset()
@@ -6326,7 +7431,7 @@ def test_macos_start_daemon_body_fail(macos_module, monkeypatch):
 
     def _run_safe_command_stub(command):
         _ = command
-        return _completed(returncode=0)
+        return _RC0
 
     monkeypatch.setattr(
         macos_module,
@@ -6427,13 +7532,17 @@ def test_macos_start_desktop_app_body_success(
     launched = []
 
     def fake_popen(cmd, **kwargs):
-        _ = kwargs
-        launched.append(cmd)
+        launched.append((cmd, kwargs))
         return SimpleNamespace()
 
     monkeypatch.setattr(macos_module.subprocess, "Popen", fake_popen)
     _call_member(tray, "_start_desktop_app_body")
-    assert launched  # nosec B101
+    assert len(launched) == 1  # nosec B101
+    cmd, kwargs = launched[0]
+    assert cmd == ["/usr/bin/open", str(app_dir)]  # nosec B101
+    assert kwargs["close_fds"] is True  # nosec B101
+    assert kwargs["start_new_session"] is True  # nosec B101
+    assert kwargs["stdin"] is macos_module.subprocess.DEVNULL  # nosec B101
     notifications = DummyRumpsModule.get_notifications()
     assert any(
         "starting" in n[2].lower()
@@ -6509,11 +7618,7 @@ def test_macos_show_about_dialog(macos_module):
     """show_about_dialog shows version and repository info."""
     tray = _make_macos_tray(macos_module)
     DummyRumpsModule.reset()
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "1.2.3"
     tray.show_about_dialog(None)
     alerts = DummyRumpsModule.get_alerts()
@@ -6524,11 +7629,7 @@ def test_macos_show_about_dialog(macos_module):
 def test_macos_check_updates_dev_build(macos_module):
     """check_updates returns False for dev build."""
     tray = _make_macos_tray(macos_module)
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "dev"
     result = tray.check_updates()
     assert not result  # nosec B101
@@ -6538,11 +7639,7 @@ def test_macos_check_updates_dev_build(macos_module):
 def test_macos_check_updates_no_latest(macos_module, monkeypatch):
     """check_updates returns False when release fetch fails."""
     tray = _make_macos_tray(macos_module)
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     monkeypatch.setattr(
         macos_module,
@@ -6557,11 +7654,7 @@ def test_macos_check_updates_no_latest(macos_module, monkeypatch):
 def test_macos_check_updates_up_to_date(macos_module, monkeypatch):
     """check_updates sets status to 'Up to date' when current."""
     tray = _make_macos_tray(macos_module)
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     monkeypatch.setattr(
         macos_module,
@@ -6577,11 +7670,7 @@ def test_macos_check_updates_new_version(macos_module, monkeypatch):
     """check_updates notifies when a newer version is available."""
     tray = _make_macos_tray(macos_module)
     DummyRumpsModule.reset()
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     monkeypatch.setattr(
         macos_module,
@@ -6602,11 +7691,7 @@ def test_macos_manual_check_updates_up_to_date(
     DummyRumpsModule.reset()
     monkeypatch.setattr(tray, "check_updates", lambda: False)
     tray.update_status = "Up to date"
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     tray.manual_check_updates(None)
     alerts = DummyRumpsModule.get_alerts()
@@ -6614,6 +7699,18 @@ def test_macos_manual_check_updates_up_to_date(
     assert "up to date" in alerts[0][1].lower()  # nosec B101
 
 
+def test_macos_manual_check_updates_debounces(macos_module, monkeypatch):
+    """manual_check_updates ignores clicks during the action cooldown."""
+    tray = _make_macos_tray(macos_module)
+    DummyRumpsModule.reset()
+    checks = []
+    monkeypatch.setattr(tray, "check_updates", lambda: checks.append(1))
+    tray.action_lock_until = float("inf")
+    tray.manual_check_updates(None)
+    assert not checks  # nosec B101
+    assert not DummyRumpsModule.get_alerts()  # nosec B101
+
+
 def test_macos_manual_check_updates_error(macos_module, monkeypatch):
     """manual_check_updates shows an alert with error detail."""
     tray = _make_macos_tray(macos_module)
@@ -6651,11 +7748,7 @@ def test_macos_manual_check_updates_ahead_of_release(
     monkeypatch.setattr(tray, "check_updates", lambda: False)
     tray.update_status = "Ahead of release"
     tray.latest_update_version = "v0.9.0"
-    app_state = _call_member(
-        macos_module,
-        "__getattribute__",
-        "_AppState",
-    )
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     tray.manual_check_updates(None)
     assert DummyRumpsModule.get_alerts()  # nosec B101
@@ -6703,7 +7796,7 @@ def test_macos_force_stop_llmster_stops_process(
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda cmd: calls.append(cmd) or _completed(returncode=0),
+        lambda cmd: calls.append(cmd) or _RC0,
     )
     monkeypatch.setattr(
         macos_module, "is_llmster_running", lambda: False
@@ -6811,7 +7904,7 @@ def test_macos_maybe_start_gui(macos_module, monkeypatch):
 def test_macos_check_updates_ahead_of_release(macos_module, monkeypatch):
     """check_updates sets 'Ahead of release' when current is newer."""
     tray = _make_macos_tray(macos_module)
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v2.0.0"
     monkeypatch.setattr(
         macos_module,
@@ -6850,7 +7943,7 @@ def test_macos_check_updates_notified_once(macos_module, monkeypatch):
     """check_updates notifies only once per unique latest version."""
     tray = _make_macos_tray(macos_module)
     DummyRumpsModule.reset()
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     monkeypatch.setattr(
         macos_module,
@@ -6883,7 +7976,7 @@ def test_macos_start_daemon_body_stops_app_first(
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda cmd: _completed(returncode=0),
+        lambda cmd: _RC0,
     )
     monkeypatch.setattr(macos_module, "is_llmster_running", lambda: True)
     monkeypatch.setattr(tray, "_schedule_menu_refresh", lambda *_: None)
@@ -6921,7 +8014,7 @@ def test_macos_show_status_dialog_lms_ps_empty(
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda unused_arg: _completed(returncode=0, stdout=""),
+        lambda unused_arg: _RC0,
     )
     tray.show_status_dialog(None)
     alerts = DummyRumpsModule.get_alerts()
@@ -6979,7 +8072,7 @@ def test_macos_build_menu_includes_show_status(
 
 
 def test_macos_force_stop_llmster_sigkill_path(
-    macos_module, monkeypatch
+    macos_module, fake_clock, monkeypatch
 ):
     """_force_stop_llmster escalates to SIGKILL when process persists."""
     tray = _make_macos_tray(macos_module)
@@ -6988,7 +8081,7 @@ def test_macos_force_stop_llmster_sigkill_path(
 
     def fake_run_safe(cmd):
         calls.append(cmd)
-        return _completed(returncode=0)
+        return _RC0
 
     call_count = [0]
 
@@ -7005,14 +8098,13 @@ def test_macos_force_stop_llmster_sigkill_path(
     monkeypatch.setattr(
         macos_module, "is_llmster_running", still_running_check
     )
-    monkeypatch.setattr(macos_module.time, "sleep", lambda _: None)
     _call_member(tray, "_force_stop_llmster")
     kill_cmds = [c for c in calls if "-9" in c]
     assert kill_cmds  # nosec B101
 
 
 def test_macos_stop_desktop_app_processes_sigkill(
-    macos_module, monkeypatch
+    macos_module, fake_clock, monkeypatch
 ):
     """_stop_desktop_app_processes escalates to SIGKILL when app persists."""
     tray = _make_macos_tray(macos_module)
@@ -7032,7 +8124,6 @@ def test_macos_stop_desktop_app_processes_sigkill(
     monkeypatch.setattr(
         os, "kill", lambda pid, sig: kills.append((pid, sig))
     )
-    monkeypatch.setattr(macos_module.time, "sleep", lambda _: None)
     _call_member(tray, "_stop_desktop_app_processes")
     sigs = [sig for _, sig in kills]
     assert signal.SIGTERM in sigs  # nosec B101
@@ -7063,7 +8154,7 @@ def test_macos_manual_check_updates_update_available(
     monkeypatch.setattr(tray, "check_updates", lambda: False)
     tray.update_status = "Update available"
     tray.latest_update_version = "v2.0.0"
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     app_state.APP_VERSION = "v1.0.0"
     tray.manual_check_updates(None)
     alerts = DummyRumpsModule.get_alerts()
@@ -7268,7 +8359,7 @@ def test_macos_tray_icon_init_auto_start(macos_module, monkeypatch):
     monkeypatch.setattr(
         macos_module.MacOSTrayIcon, "_APP_LOCATIONS", []
     )
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     app_state.AUTO_START_DAEMON = True
     threads_started = []
     original_thread = macos_module.threading.Thread
@@ -7318,7 +8409,7 @@ def test_macos_tray_icon_init_gui_mode(macos_module, monkeypatch):
     monkeypatch.setattr(
         macos_module.MacOSTrayIcon, "_APP_LOCATIONS", []
     )
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     app_state.GUI_MODE = True
     threads_started = []
 
@@ -7416,7 +8507,7 @@ def test_macos_check_model_lms_ps_fail_api_false(
     monkeypatch.setattr(
         macos_module,
         "_run_safe_command",
-        lambda _cmd: _completed(returncode=1, stdout="", stderr=""),
+        lambda _cmd: _RC1,
     )
     monkeypatch.setattr(macos_module, "check_api_models", lambda: False)
     tray.check_model()
@@ -7499,7 +8590,7 @@ def test_run_macos_launches_tray(macos_module, monkeypatch, tmp_path):
     monkeypatch.setattr(
         macos_module, "get_app_version", lambda: "v1.0.0"
     )
-    app_state = _call_member(macos_module, "__getattribute__", "_AppState")
+    app_state = _state(macos_module)
     monkeypatch.setattr(app_state, "script_dir", str(tmp_path))
 
     original_run = macos_module.MacOSTrayIcon.run
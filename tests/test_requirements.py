@@ -12,6 +12,7 @@ def test_requirements_txt_no_hashes():
     """The top-level requirements.txt is intended for scanners and should
     not contain pip ``--hash`` specifiers or continuation backslashes.
     """
-    text = Path("requirements.txt").read_text(encoding="utf-8")
-    assert "--hash" not in text, "requirements.txt still contains hash pins"
-    assert "\\" not in text, "requirements.txt still uses line continuations"
+    path = Path(__file__).resolve().parents[1] / "requirements.txt"
+    data = path.read_bytes()
+    assert b"--hash" not in data, "requirements.txt still contains hash pins"
+    assert b"\\" not in data, "requirements.txt still uses line continuations"
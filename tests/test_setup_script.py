@@ -1,8 +1,11 @@
 """Smoke tests for `setup.sh` logic."""
 
+import functools
 import subprocess
 from pathlib import Path
 
+import pytest
+
 
 def run_setup(dry_run=True):
     """
@@ -30,20 +33,56 @@ def run_setup(dry_run=True):
     return proc
 
 
+@functools.lru_cache(maxsize=None)
+def _setup_sh_bytes():
+    """Read the repository's setup.sh once per session."""
+    return (Path(__file__).resolve().parents[1] / "setup.sh").read_bytes()
+
+
 def _make_setup_copy(tmp_path):
     """Copy setup.sh into a temp directory and return (script_dir, script)."""
     script_dir = tmp_path / "repo"
     script_dir.mkdir()
-    orig = Path(__file__).resolve().parents[1] / "setup.sh"
     script_copy = script_dir / "setup.sh"
-    script_copy.write_text(orig.read_text(), encoding="utf-8")
+    script_copy.write_bytes(_setup_sh_bytes())
     script_copy.chmod(0o755)
     return script_dir, script_copy
 
 
-def test_gtk_typelib_check_present():
+def _run_dry_run(script_dir):
+    """Run ``setup.sh --dry-run`` from ``script_dir`` as on Linux."""
+    return subprocess.run(
+        ["bash", "-c", "OSTYPE=linux-gnu bash setup.sh --dry-run"],
+        cwd=script_dir,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+@pytest.fixture(name="setup_dry_run_output", scope="session")
+def setup_dry_run_output_fixture():
+    """Run the repository's ``setup.sh --dry-run`` once per session.
+
+    The output only depends on the script, so tests asserting on it share
+    one bash process.
+    """
+    return run_setup()
+
+
+@pytest.fixture(name="appimage_dry_run_output", scope="module")
+def appimage_dry_run_output_fixture(tmp_path_factory):
+    """Dry-run ``setup.sh`` next to an executable AppImage once."""
+    script_dir, _ = _make_setup_copy(tmp_path_factory.mktemp("appimage"))
+    appimage = script_dir / "lmstudio-tray-manager-0.5.3-linux-x86_64.AppImage"
+    appimage.touch()
+    appimage.chmod(0o755)
+    return _run_dry_run(script_dir)
+
+
+def test_gtk_typelib_check_present(setup_dry_run_output):
     """The script should include a GTK3/GObject typelib check step."""
-    proc = run_setup()
+    proc = setup_dry_run_output
     out = proc.stdout
     assert "Step 4: Checking GTK3/GObject typelibs" in out
     assert "GTK3/GObject typelibs" in out
@@ -53,7 +92,7 @@ def test_gtk_typelib_check_present():
 def test_exit_if_user_declines_install(_monkeypatch, tmp_path):
     """If dependencies are missing and user answers no, the script stops."""
     script_dir, _ = _make_setup_copy(tmp_path)
-    (script_dir / "lmstudio-tray-manager").write_text("", encoding="utf-8")
+    (script_dir / "lmstudio-tray-manager").touch()
     proc = subprocess.run(
         ["bash", "-c", "echo n | OSTYPE=linux-gnu bash setup.sh"],
         cwd=script_dir,
@@ -65,36 +104,16 @@ def test_exit_if_user_declines_install(_monkeypatch, tmp_path):
     assert "Setup cancelled" in proc.stdout or "Setup cancelled" in proc.stderr
 
 
-def test_appimage_detected_dry_run(tmp_path):
+def test_appimage_detected_dry_run(appimage_dry_run_output):
     """An AppImage in the script dir is detected and reported in dry-run."""
-    script_dir, _ = _make_setup_copy(tmp_path)
-    appimage = script_dir / "lmstudio-tray-manager-0.5.3-linux-x86_64.AppImage"
-    appimage.write_text("", encoding="utf-8")
-    appimage.chmod(0o755)
-    proc = subprocess.run(
-        ["bash", "-c", "OSTYPE=linux-gnu bash setup.sh --dry-run"],
-        cwd=script_dir,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    proc = appimage_dry_run_output
     assert proc.returncode == 0, proc.stdout + proc.stderr
     assert "AppImage release detected" in proc.stdout
 
 
-def test_appimage_skips_gtk3_check(tmp_path):
+def test_appimage_skips_gtk3_check(appimage_dry_run_output):
     """When an AppImage is present, the GTK3 check step is skipped."""
-    script_dir, _ = _make_setup_copy(tmp_path)
-    appimage = script_dir / "lmstudio-tray-manager-0.5.3-linux-x86_64.AppImage"
-    appimage.write_text("", encoding="utf-8")
-    appimage.chmod(0o755)
-    proc = subprocess.run(
-        ["bash", "-c", "OSTYPE=linux-gnu bash setup.sh --dry-run"],
-        cwd=script_dir,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    proc = appimage_dry_run_output
     assert proc.returncode == 0, proc.stdout + proc.stderr
     assert "AppImage bundles its own GTK3" in proc.stdout
 
@@ -103,15 +122,9 @@ def test_appimage_not_executable_dry_run(tmp_path):
     """A non-executable AppImage triggers chmod offer in dry-run mode."""
     script_dir, _ = _make_setup_copy(tmp_path)
     appimage = script_dir / "lmstudio-tray-manager-0.5.3-linux-x86_64.AppImage"
-    appimage.write_text("", encoding="utf-8")
+    appimage.touch()
     appimage.chmod(0o644)  # not executable
-    proc = subprocess.run(
-        ["bash", "-c", "OSTYPE=linux-gnu bash setup.sh --dry-run"],
-        cwd=script_dir,
-        capture_output=True,
-        text=True,
-        check=False,
-    )
+    proc = _run_dry_run(script_dir)
     assert proc.returncode == 0, proc.stdout + proc.stderr
     assert "Would make it executable" in proc.stdout
     assert "AppImage" in proc.stdout
@@ -121,7 +134,7 @@ def test_appimage_not_executable_user_declines(tmp_path):
     """Declining chmod on a non-executable AppImage cancels setup."""
     script_dir, _ = _make_setup_copy(tmp_path)
     appimage = script_dir / "lmstudio-tray-manager-0.5.3-linux-x86_64.AppImage"
-    appimage.write_text("", encoding="utf-8")
+    appimage.touch()
     appimage.chmod(0o644)  # not executable
     proc = subprocess.run(
         ["bash", "-c", "echo n | OSTYPE=linux-gnu bash setup.sh"],